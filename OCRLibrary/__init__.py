@@ -5,6 +5,9 @@ from OCRLibrary.keywords.binary_image_transformation import ImageThresholdingKey
 from OCRLibrary.keywords.changing_colourspace_transformation import ChangingColourspaceKeywords
 from OCRLibrary.keywords.content_location import ContentLocationKeywords
 from OCRLibrary.keywords.content_validation import ContentValidationKeywords
+from OCRLibrary.keywords.content_waiting import ContentWaitingKeywords
+from OCRLibrary.keywords.image_pipeline import ImagePipelineKeywords
+from OCRLibrary.keywords.ocr_configuration import OCRConfigurationKeywords
 from OCRLibrary.keywords.read_and_save_images import ReadImageKeywords, SaveImageKeywords
 from OCRLibrary.keywords.smoothing_image_transformation import SmoothingImageKeywords
 
@@ -17,6 +20,9 @@ class OCRLibrary(ImageThresholdingKeywords,
                 ChangingColourspaceKeywords,
                 ContentLocationKeywords,
                 ContentValidationKeywords,
+                ContentWaitingKeywords,
+                ImagePipelineKeywords,
+                OCRConfigurationKeywords,
                 ReadImageKeywords,
                 SaveImageKeywords,
                 SmoothingImageKeywords):
@@ -68,7 +74,12 @@ class OCRLibrary(ImageThresholdingKeywords,
     === Kernel Type Argument ===
     Keywords that require a ``kernel_type`` take the given kernel size and create a structured element. The integer provided as
     the kernel type will determine the shape of the structured element. 0 will be a rectangle, 1 will be an ellipse, 
-    and 2 will be a cross.
+    and 2 will be a cross. Each kernel is only created once per type and size, and reused by every following keyword call.
+
+    Rectangle kernels are the fastest kernels for morphological transformations: they are applied as one horizontal and one
+    vertical pass, and several iterations of a rectangle kernel cost a single pass of the equivalent larger kernel. Wide
+    rectangle kernels (i.e. ``(40, 1)`` to join the words of a line) are therefore cheap, while large ellipse kernels are
+    an order of magnitude slower.
 
     === Iteration Argument ===
     Iteration is the number of times the transformation is performed on the image. The ``iteration`` can be any positive integer
@@ -77,6 +88,43 @@ class OCRLibrary(ImageThresholdingKeywords,
     === Depth Argument ===
     Depth represents the desired depth of the destination image. When ``depth=-1`` the output image will have the same depth as the source.
 
+    === In Place Argument ===
+    When ``in_place=True`` the result of the transformation is written to the given image instead of a new image, which
+    avoids allocating a new full size image for every step of a long chain of transformations. The given image is modified
+    and returned. Images returned by ``Read Image`` are read only (they are shared through the decoded image cache) and are
+    never modified, a new image is returned for them, so the first transformation of a chain always returns a new image.
+    ``in_place`` is also accepted by ``Get Binary Image``, ``Get To Zero Image``, ``Get Trunc Image`` (for gray scale images),
+    ``Convert Image To HSV``, ``Mask Colour``, ``Mask Colours`` and ``Mask Colour Ranges``.
+
+    Example:
+    | ${binary_img}=    Get Binary Image    ${processed_img}
+    | ${binary_img}=    Apply Erosion To Image    ${binary_img}    ${kernel_size}    in_place=True
+    | ${binary_img}=    Apply Dilation To Image    ${binary_img}    ${kernel_size}    in_place=True
+
+    == Image Pipelines ==
+    ``Apply Pipeline`` applies several transformations to an image in a single keyword call. The steps of a pipeline are
+    validated and compiled once, the compiled pipeline is cached by its steps and reused by every following call with the
+    same steps (i.e. in every test of a suite). Intermediate images are written to two buffers reused by every pipeline,
+    so only the returned image is allocated.
+
+    A step is either a string with the name of the step followed by its arguments (``name argument=value``, lists separated
+    by commas), or a dictionary with the ``name`` of the step and its arguments:
+    | =Step= | =Arguments= | =Transformation= |
+    | gray_scale | | Converts the image to gray scale. |
+    | hsv | | Converts a BGR image to HSV. |
+    | threshold | type=binary, inverse=False, otsu=False, threshold=127, max_threshold=255 | Thresholds the image (``binary``, ``tozero`` or ``trunc``), colour images are converted to gray scale first. |
+    | morph_erosion, morph_dilation, morph_opening, morph_closing, morph_gradient, morph_top_hat, morph_black_hat | kernel_size, kernel_type=0, iteration=1 | Morphological transformation. |
+    | blur | type=averaging, kernel_size | Averaging, gaussian or median blur. The kernel size of the median blur is a single odd int. |
+    | filter_2d | kernel_size, kernel_type=0 | Filters the image with the structuring element of the kernel. |
+    | mask | lower, upper | Masks the colours that are not within the bounds. |
+    The arguments are the same as the arguments of the corresponding keywords (see `Keywords With Apply Prefix`). When OTSU
+    is used the optimal threshold value is not returned.
+
+    Example:
+    | ${opening}=    Create Dictionary    name=morph_opening    kernel_size=${kernel_size}    iteration=2
+    | @{steps}=    Create List    threshold type=binary inverse=True otsu=True    ${opening}    blur type=gaussian kernel_size=3,3
+    | ${processed_img}=    Apply Pipeline    ${img}    ${steps}
+
     == Pytesseract Configuration Strings ==
     Please see [https://github.com/bendurston/robotframework-ocrlibrary#custom-configurations-for-reading-images |the OCRLibrary README.md] for an in depth explanation of the ``pyt_conf`` argument.
 
@@ -86,11 +134,142 @@ class OCRLibrary(ImageThresholdingKeywords,
     | ${content}=   Get Image Content   ${processed_img}    --psm 6 -c tessedit_char_whitelist=0123456789   eng
     Note: Only use one space between each configuration in the ``pyt_conf`` argument.
 
+    == OCR Engines ==
+    Every keyword that reads text from an image (``Get Image Content``, ``Validate Image Content`` and the ``Locate`` keywords)
+    goes through the same OCR engine. The engine is selected with ``Set OCR Engine``.
+
+    By default (``auto``) OCRLibrary loads libtesseract and keeps tesseract initialized between keyword calls, so the language
+    model is only loaded once per configuration instead of starting a tesseract process for each call. If libtesseract cannot
+    be found, or a ``pyt_conf`` option cannot be applied through the Tesseract C API, pytesseract is used instead.
+    The environment variable ``OCRLIBRARY_LIBTESSERACT`` can be set to the path of libtesseract if it is not found automatically.
+
+    Example:
+    | Set OCR Engine    pytesseract
+
+    == OCR Result Cache ==
+    Results of the OCR engine are cached in memory. The cache is keyed by a hash of the image pixels, the ``pyt_conf`` and the
+    ``lang`` arguments, so reading or locating text again in an unchanged image only costs a hash of the image instead of a
+    new OCR run (i.e. ``Locate Text Coordinates`` followed by ``Validate Image Content`` on the same processed image).
+
+    The cache keeps the least recently used results within a budget of 128 entries and 32 MiB by default. The budget can be
+    changed with ``Set OCR Cache Size``, and the hits and misses are returned by ``Get OCR Cache Statistics``.
+
+    == Tiled Reading ==
+    Very large screenshots (i.e. multi-monitor captures) can be read in tiles. After ``Set OCR Tiling``, images wider or taller
+    than the tile size are split in overlapping tiles which are read in parallel, and the words of every tile are merged back
+    into a single result with coordinates relative to the full image. Words cut at the edge of a tile are taken from the
+    neighbouring tile, and words read twice in the overlap of two tiles are only kept once.
+
+    Tiling applies to ``Get Image Content``, ``Validate Image Content``, ``Get OCR Document`` and the ``Locate`` keywords. The
+    text of a tiled image is rebuilt from the words read, one line of text per line of words.
+
+    Example:
+    | Set OCR Tiling    tile_size=1024    overlap=128
+    | ${coordinates}=    Locate Text Coordinates    ${processed_img}    save
+
+    == Text Line Detection ==
+    Most of the time spent reading a sparse screenshot (i.e. a form with a few labels) goes to the layout analysis of the OCR
+    engine and to empty areas. After ``Set OCR Line Detection``, the lines of text are detected first (with a morphological
+    gradient, a closing with a wide rectangle kernel and contours), and each line is read as a single line of text (``--psm 7``
+    replaces the page segmentation mode of ``pyt_conf``), the lines being read in parallel. The words read are merged with
+    coordinates relative to the full image, so the ``Locate`` keywords, ``Get OCR Document`` and ``Get Image Content`` are used
+    as usual.
+
+    Line detection is best suited to screenshots with a few lines of text on a plain background, text on images or in tables
+    may not be detected as lines. When line detection is enabled, tiling is not used.
+
+    Example:
+    | Set OCR Line Detection    kernel_size=(35, 5)    padding=4
+    | ${coordinates}=    Locate Text Coordinates    ${processed_img}    Submit
+
+    == Waiting For Text ==
+    ``Wait Until Text Is Visible`` and ``Wait Until Text Disappears`` take a new screenshot every ``poll_interval`` until the text
+    is found (or no longer found) or the ``timeout`` expires. The ``screenshot`` argument is either the name of a keyword returning
+    an image or an image path (i.e. a keyword of the library used to interact with the application), or the path of an image file
+    that another process keeps overwriting. A string containing a path separator or ending with an image extension (i.e. ``.png``)
+    is always a path, while the file is missing no text is read and the screenshots keep being taken. When a ``region`` is given
+    it must overlap the first screenshot taken.
+
+    Each screenshot is compared to the previous one with a hash of its pixels, and text is only read again when the pixels changed.
+    While the screen does not change, the poll interval is multiplied by ``backoff`` (1.0, the default, keeps a constant interval);
+    it is reset as soon as the screen changes. The timeout and poll interval are Robot Framework time strings (i.e. ``10s``,
+    ``1 minute`` or ``0.5``). When a ``region`` is given only that part of the screenshots is compared and read.
+
+    Example:
+    | Click Button    Save
+    | Wait Until Text Is Visible    Take Application Screenshot    Saved    timeout=20s    poll_interval=250ms    backoff=1.5
+
+    == Reading Multiple Outputs ==
+    With the ``tesseract_api`` engine, every time an image is read both its text and the bounds of its words are read from the
+    same OCR run and cached (see `OCR Result Cache`). Validating the content of an image and locating text in the same image
+    therefore costs a single OCR run:
+    | Validate Image Content    ${processed_img}    Welcome
+    | ${coordinates}=    Locate Text Coordinates    ${processed_img}    Continue
+
+    The ``pytesseract`` engine only reads the requested output, over the standard output of tesseract, as reading several
+    outputs from one tesseract process goes through temporary files.
+
+    An OCR document holds the text read with its words, so it can also be given to ``Validate Image Content`` and ``Get Image Content``.
+    ``Get Image OCR Outputs`` returns the text, the OCR document, the hOCR and/or the ALTO XML of an image from a single OCR run.
+
+    == Locating Text ==
+    The ``Locate`` keywords take either a processed image or an OCR document returned by ``Get OCR Document``. An OCR document
+    is the result of a single OCR run with every word indexed by its text, so locating many words on the same screen only reads
+    the image once. When an OCR document is given, the ``pyt_conf`` and ``lang`` arguments of the ``Locate`` keywords are ignored.
+
+    The ``match_mode`` argument selects how the text is compared to the words read:
+    - ``exact`` the word must be identical to the text (default).
+    - ``ignore_case`` the word and the text are compared case insensitively.
+    - ``normalized`` the word and the text are compared case insensitively after unicode normalization, and punctuation
+    surrounding the word is ignored (i.e. ``"Ok,"`` matches ``ok``).
+
+    Example:
+    | ${document}=    Get OCR Document    ${processed_img}
+    | ${coordinates}=    Locate Text Coordinates    ${document}    save    match_mode=ignore_case
+
+    When the screen only changes a little between two screenshots, ``Update OCR Document`` returns the OCR document of the new
+    screenshot by reading only the parts of the screenshot that changed.
+
+    == Locating Images ==
+    ``Locate Image Template`` and ``Locate All Image Templates`` find a template image (i.e. a fixed icon or button) in an image
+    without reading it, which is much faster than locating text. The images are compared in gray scale, and the similarity of a
+    match goes from 0 to 1 (identical pixels), matches less similar than the ``threshold`` argument are left out.
+
+    The search is done coarse to fine: the template is matched over a reduced copy of the image, and only the best candidates
+    are matched again at full size. Matches overlapping a better match are left out. The reduced copies of the templates are
+    cached, so locating the same template in many screenshots only reduces it once.
+
+    The ``scales`` argument is a number, a list or a comma separated string of the sizes of the template in the image. For example
+    ``scales=1,2`` finds a template captured on a regular screen both in regular and in HiDPI (200%) screenshots.
+
+    == Regions Of Interest ==
+    ``Get Image Content``, ``Validate Image Content``, ``Get OCR Document`` and the ``Locate`` keywords take an optional ``region``
+    argument. When a region is given only that part of the image is read, which is faster than reading the full screenshot.
+    The region is a tuple/list (x, y, w, h) where x and y are the top left corner of the region, and w and h its width and height.
+    Coordinates and bounds returned by the ``Locate`` keywords are always relative to the full image.
+
+    When an OCR document is given to a ``Locate`` keyword, only the words entirely inside the region are considered.
+
+    Example:
+    | ${toolbar}=    Create List    0    0    1920    120
+    | ${coordinates}=    Locate Text Coordinates    ${processed_img}    File    region=${toolbar}
+
+    ``Read Text In Regions`` reads many named regions of an image with a single OCR run, see its documentation for details.
+
     == Masking Colours ==
     Users are able to mask (maintain) colours that exist within the provided upper and lower bounds. A BGR or HSV image can be
     used for either ``Mask Colour`` or ``Mask Colours``. Bounds can be either a list of a tuple, and each index must be of type int.
     Representation of BGR and HSV bounds respectively: (blue value, green value, red value), (hue value, saturation value, brightness value).
 
+    ``Mask Colour Ranges`` keeps the colours within any number of pairs of bounds. With a few pairs each pair is masked in turn,
+    with 6 pairs or more the pairs are compiled into lookup tables (one per channel, cached by the bounds) and up to 32 pairs are
+    masked in a single pass over the image, so masking 30 colours costs about as much as masking 6.
+
+    ``Locate Colour Regions`` uses the same bounds to find where a colour is in an image (i.e. a red error badge) without
+    reading the image, which takes milliseconds instead of a full OCR pass.
+    ``Read Text In Colour Regions`` only reads the box around each of these regions (i.e. the text of highlighted rows), the
+    boxes being read in parallel, instead of reading a masked image that is mostly black.
+
     For more detail about the masking colours, please see the OpenCV changing colourspaces documentation listed above.
 
     Please see the [https://github.com/bendurston/robotframework-ocrlibrary/blob/main/examples/keyword_usage.robot |keyword_usage.robot file] for an example of the Mask Colour or Mask Colours keywords.
@@ -98,6 +277,21 @@ class OCRLibrary(ImageThresholdingKeywords,
     == Reading And Saving Images ==
     Please see the list of the following [https://docs.opencv.org/master/d4/da8/group__imgcodecs.html#ga288b8b3da0892bd651fce07b3bbd3a56 |formats that are supported] for image reading.
 
+    Screenshots returned as bytes or base64 (i.e. by the Browser library) can be read with ``Read Image From Bytes`` and
+    ``Read Image From Base64`` without writing them to a file first.
+
+    ``Read Image`` can decode an image directly to gray scale, or to a reduced resolution (i.e. half the width and height of a
+    HiDPI screenshot) with its ``mode`` argument, which is faster and uses less memory than reading the full colour image and
+    converting it afterwards. The gray values of a JPEG image decoded directly to gray scale can differ slightly from those of
+    the colour image converted to gray scale, so the thresholding keywords (``Get Binary Image``, ``Get To Zero Image`` and
+    ``Get Trunc Image``) read the image paths they are given in colour and convert them.
+
+    Decoded images are cached in memory, keyed by the absolute path, the modification time and the size of the file, so reading
+    the same screenshot several times (i.e. with ``Read Image`` and ``Get Binary Image``) only decodes it once. A file that is
+    overwritten is decoded again. The cache keeps the least recently used images within a budget of 32 images and 256 MiB by
+    default, which can be changed with ``Set Image Cache Size``. Images returned by ``Read Image`` are read only so an image
+    shared through the cache cannot be modified by accident, the image processing keywords always return new images.
+
     Please see the [https://docs.opencv.org/master/d4/da8/group__imgcodecs.html#gabbc7ef1aa2edfaa87772f1202d67e0ce |list of exceptions] for saving an image.
     """
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
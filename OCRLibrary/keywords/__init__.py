@@ -5,6 +5,9 @@ from .binary_image_transformation import ImageThresholdingKeywords, Morphologica
 from .changing_colourspace_transformation import ChangingColourspaceKeywords
 from .content_validation import ContentValidationKeywords
 from .content_location import ContentLocationKeywords
+from .content_waiting import ContentWaitingKeywords
+from .image_pipeline import ImagePipelineKeywords
+from .ocr_configuration import OCRConfigurationKeywords
 from .read_and_save_images import ReadImageKeywords, SaveImageKeywords
 from .smoothing_image_transformation import SmoothingImageKeywords
 
@@ -13,6 +16,9 @@ __all__ = ["ImageThresholdingKeywords",
             "ChangingColourspaceKeywords",
             "ContentLocationKeywords",
             "ContentValidationKeywords",
+            "ContentWaitingKeywords",
+            "ImagePipelineKeywords",
+            "OCRConfigurationKeywords",
             "ReadImageKeywords",
             "SaveImageKeywords",
             "SmoothingImageKeywords"]
@@ -5,75 +5,80 @@ This module is responsible for creating binary images (thresholding), and applyi
 """
 from ..utils.exceptions.exception_handler import \
     (verify_valid_kernel_size, verify_valid_iteration, raise_invalid_kernel_type, verify_valid_image,
-    verify_valid_image_path, verify_valid_threshold_values)
+    verify_valid_image_or_path, verify_valid_threshold_values)
 from ..utils.helpers.robot_conversions import \
     (convert_to_valid_kernel_size)
 from ..utils.imageprocessing.image_processing_gray import \
     (process_to_binary_image, process_to_binary_otsu_image, process_to_tozero_image,
-    process_to_tozero_otsu_image, process_to_trunc_image, process_to_trunc_otsu_image,
-    process_erosion_with_rect_kernel, process_erosion_with_ellipse_kernel, process_erosion_with_cross_kernel,
-    process_dilation_with_rect_kernel, process_dilation_with_ellipse_kernel, process_dilation_with_cross_kernel,
-    process_opening_with_rect_kernel, process_opening_with_ellipse_kernel, process_opening_with_cross_kernel,
-    process_closing_with_rect_kernel, process_closing_with_ellipse_kernel, process_closing_with_cross_kernel,
-    process_gradient_with_rect_kernel, process_gradient_with_ellipse_kernel, process_gradient_with_cross_kernel,
-    process_tophat_with_rect_kernel, process_tophat_with_ellipse_kernel, process_tophat_with_cross_kernel,
-    process_blackhat_with_rect_kernel, process_blackhat_with_ellipse_kernel, process_blackhat_with_cross_kernel)
+    process_to_tozero_otsu_image, process_to_trunc_image, process_to_trunc_otsu_image, process_morphology)
+from ..utils.imageprocessing.image_processing_generic import get_destination
+from ..utils.imageprocessing.imagetransformation.structuring_element import KERNEL_TYPES
 
 class ImageThresholdingKeywords:
     """
     ImageThresholdingKeywords Class
     Reference: https://docs.opencv.org/4.5.2/d7/d4d/tutorial_py_thresholding.html
     """
-    def get_binary_image(self, img_path, apply_otsu=False, inverse=False, max_threshold=255, threshold=127):
+    def get_binary_image(self, img_path, apply_otsu=False, inverse=False, max_threshold=255, threshold=127, in_place=False):
         """
-        Converts an image to a binary image.
+        Converts an image to a binary image. ``img_path`` is the path to the image, or an image already read or processed
+        (i.e. returned by ``Read Image``), so several thresholds can be tried on the same image without reading it again.
+
+        Example:
+        | ${img}=    Read Image    ${img_path}
+        | ${binary_img}=    Get Binary Image    ${img}    threshold=100
+        | ${binary_inv_img}=    Get Binary Image    ${img}    inverse=True    threshold=200
 
         See `introduction` for details about using arguments.
 
         For more details about this transformation see the OpenCV image thresholding documentation in the `Information On Image Transformations` section of the introduction.
         """
-        verify_valid_image_path(img_path)
+        verify_valid_image_or_path(img_path)
         verify_valid_threshold_values(threshold, max_threshold)
         if apply_otsu:
-            processed_image = process_to_binary_otsu_image(img_path, inverse, max_threshold)
+            processed_image = process_to_binary_otsu_image(img_path, inverse, max_threshold, get_destination(img_path, in_place))
         else:
-            processed_image = process_to_binary_image(img_path, inverse, threshold, max_threshold)
+            processed_image = process_to_binary_image(img_path, inverse, threshold, max_threshold, get_destination(img_path, in_place))
         return processed_image
 
-    def get_to_zero_image(self, img_path, apply_otsu=False, inverse=False, max_threshold=255, threshold=127):
+    def get_to_zero_image(self, img_path, apply_otsu=False, inverse=False, max_threshold=255, threshold=127, in_place=False):
         """
         Converts an image to a tozero image.
         All values considered black (if inverse is False) will be set to black, the rest of
         the image will remain in gray scale. If inverse is true, the values considered to be white will be set to black,
         the rest of the image will remain in gray scale.
 
+        ``img_path`` is the path to the image, or an image already read or processed (see ``Get Binary Image``).
+
         See `introduction` for details about using the arguments.
 
         For more details about this transformation see the OpenCV image thresholding documentation in the `Information On Image Transformations` section of the introduction.
         """
-        verify_valid_image_path(img_path)
+        verify_valid_image_or_path(img_path)
         verify_valid_threshold_values(threshold, max_threshold)
         if apply_otsu:
-            processed_image = process_to_tozero_otsu_image(img_path, inverse, max_threshold)
+            processed_image = process_to_tozero_otsu_image(img_path, inverse, max_threshold, get_destination(img_path, in_place))
         else:
-            processed_image = process_to_tozero_image(img_path, inverse, threshold, max_threshold)
+            processed_image = process_to_tozero_image(img_path, inverse, threshold, max_threshold, get_destination(img_path, in_place))
         return processed_image
 
-    def get_trunc_image(self, img_path, apply_otsu=False, max_threshold=255, threshold=127):
+    def get_trunc_image(self, img_path, apply_otsu=False, max_threshold=255, threshold=127, in_place=False):
         """
         Converts an image to gray scale and applies truncation threshold. Values considered to be white will be set to white, the
         rest of the image will remain gray scale.
 
+        ``img_path`` is the path to the image, or an image already read or processed (see ``Get Binary Image``).
+
         See `introduction` for details about using the arguments.
 
         For more details about this transformation see the OpenCV image thresholding documentation in the `Information On Image Transformations` section of the introduction.
         """
-        verify_valid_image_path(img_path)
+        verify_valid_image_or_path(img_path)
         verify_valid_threshold_values(threshold, max_threshold)
         if apply_otsu:
-            processed_image = process_to_trunc_otsu_image(img_path, max_threshold)
+            processed_image = process_to_trunc_otsu_image(img_path, max_threshold, get_destination(img_path, in_place))
         else:
-            processed_image = process_to_trunc_image(img_path, threshold, max_threshold)
+            processed_image = process_to_trunc_image(img_path, threshold, max_threshold, get_destination(img_path, in_place))
         return processed_image
 
 class MorphologicalTransformationKeywords:
@@ -82,7 +87,7 @@ class MorphologicalTransformationKeywords:
     Reference: https://docs.opencv.org/4.5.2/d9/d61/tutorial_py_morphological_ops.html
     """
 
-    def apply_erosion_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_erosion_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the erosion morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -100,17 +105,11 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_erosion_with_rect_kernel(processed_img, kernel_size, iteration)
-        elif kernel_type == 1:
-            transformed_image = process_erosion_with_ellipse_kernel(processed_img, kernel_size, iteration)
-        elif kernel_type == 2:
-            transformed_image = process_erosion_with_cross_kernel(processed_img, kernel_size, iteration)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_morphology(processed_img, 'erosion', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
 
-    def apply_dilation_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_dilation_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the dilation morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -124,17 +123,11 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_dilation_with_rect_kernel(processed_img, kernel_size, iteration)
-        elif kernel_type == 1:
-            transformed_image = process_dilation_with_ellipse_kernel(processed_img, kernel_size, iteration)
-        elif kernel_type == 2:
-            transformed_image = process_dilation_with_cross_kernel(processed_img, kernel_size, iteration)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_morphology(processed_img, 'dilation', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
 
-    def apply_opening_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_opening_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the opening morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -148,17 +141,11 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_opening_with_rect_kernel(processed_img, kernel_size)
-        elif kernel_type == 1:
-            transformed_image = process_opening_with_ellipse_kernel(processed_img, kernel_size)
-        elif kernel_type == 2:
-            transformed_image = process_opening_with_cross_kernel(processed_img, kernel_size)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_morphology(processed_img, 'opening', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
 
-    def apply_closing_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_closing_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the closing morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -172,17 +159,11 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_closing_with_rect_kernel(processed_img, kernel_size)
-        elif kernel_type == 1:
-            transformed_image = process_closing_with_ellipse_kernel(processed_img, kernel_size)
-        elif kernel_type == 2:
-            transformed_image = process_closing_with_cross_kernel(processed_img, kernel_size)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_morphology(processed_img, 'closing', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
 
-    def apply_gradient_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_gradient_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the gradient morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -196,17 +177,11 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_gradient_with_rect_kernel(processed_img, kernel_size)
-        elif kernel_type == 1:
-            transformed_image = process_gradient_with_ellipse_kernel(processed_img, kernel_size)
-        elif kernel_type == 2:
-            transformed_image = process_gradient_with_cross_kernel(processed_img, kernel_size)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_morphology(processed_img, 'gradient', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
 
-    def apply_top_hat_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_top_hat_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the top hat morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -220,17 +195,11 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_tophat_with_rect_kernel(processed_img, kernel_size)
-        elif kernel_type == 1:
-            transformed_image = process_tophat_with_ellipse_kernel(processed_img, kernel_size)
-        elif kernel_type == 2:
-            transformed_image = process_tophat_with_cross_kernel(processed_img, kernel_size)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_morphology(processed_img, 'top_hat', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
 
-    def apply_black_hat_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1):
+    def apply_black_hat_to_image(self, processed_img, kernel_size, kernel_type=0, iteration=1, in_place=False):
         """
         Applies the black hat morphological transformation to a binary image. Kernel size must be a tuple/list of positive ints.
 
@@ -244,12 +213,6 @@ class MorphologicalTransformationKeywords:
         verify_valid_kernel_size(kernel_size)
         verify_valid_iteration(iteration)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        if kernel_type == 0:
-            transformed_image = process_blackhat_with_rect_kernel(processed_img, kernel_size)
-        elif kernel_type == 1:
-            transformed_image = process_blackhat_with_ellipse_kernel(processed_img, kernel_size)
-        elif kernel_type == 2:
-            transformed_image = process_blackhat_with_cross_kernel(processed_img, kernel_size)
-        else:
-            raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        if kernel_type not in KERNEL_TYPES:
+            return raise_invalid_kernel_type(kernel_type)
+        return process_morphology(processed_img, 'black_hat', kernel_type, kernel_size, iteration, get_destination(processed_img, in_place))
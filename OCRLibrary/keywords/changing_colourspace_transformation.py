@@ -4,11 +4,13 @@ colourImageProcessing module.
 This module is responsible for changing the colourspace of an image.
 """
 from ..utils.exceptions.exception_handler import \
-    (verify_valid_image, verify_valid_colour_bounds)
+    (verify_valid_image, verify_valid_colour_bounds, verify_valid_colour_ranges, verify_valid_colour_image)
 from ..utils.helpers.robot_conversions import \
     (convert_to_valid_colour_bounds)
 from ..utils.imageprocessing.image_processing_colour import \
-    (process_to_gray_scale, process_colour_image_to_hsv, mask_colour_bgr_or_hsv, mask_colours_bgr_or_hsv)
+    (process_to_gray_scale, process_colour_image_to_hsv, mask_colour_bgr_or_hsv, mask_colours_bgr_or_hsv,
+    mask_colour_ranges_bgr_or_hsv)
+from ..utils.imageprocessing.image_processing_generic import get_destination
 
 class ChangingColourspaceKeywords:
     """
@@ -27,7 +29,7 @@ class ChangingColourspaceKeywords:
         verify_valid_image(processed_img)
         return process_to_gray_scale(processed_img)
 
-    def convert_image_to_HSV(self, processed_img):
+    def convert_image_to_HSV(self, processed_img, in_place=False):
         """
         Converts any image read as bgr into hsv colour scheme.
 
@@ -37,9 +39,9 @@ class ChangingColourspaceKeywords:
         | ${hsv_img}=     Convert Image To HSV    ${processed_img}
         """
         verify_valid_image(processed_img)
-        return process_colour_image_to_hsv(processed_img)
+        return process_colour_image_to_hsv(processed_img, get_destination(processed_img, in_place))
 
-    def mask_colour(self, processed_img, lower_bound_colour, upper_bound_colour):
+    def mask_colour(self, processed_img, lower_bound_colour, upper_bound_colour, in_place=False):
         """
         Mask all colours in an image that are not within the provided bounds. Masked colours become black.
 
@@ -52,14 +54,14 @@ class ChangingColourspaceKeywords:
 
         For more details about this transformation see the OpenCV changing colourspaces documentation in the `Information On Image Transformations` section of the introduction.
         """
-        verify_valid_image(processed_img)
+        verify_valid_colour_image(processed_img)
         colours = convert_to_valid_colour_bounds(lower_bound_colour, upper_bound_colour)
         lower_bound_colour = colours[0]
         upper_bound_colour = colours[1]
         verify_valid_colour_bounds(lower_bound_colour, upper_bound_colour)
-        return mask_colour_bgr_or_hsv(processed_img, lower_bound_colour, upper_bound_colour)
+        return mask_colour_bgr_or_hsv(processed_img, lower_bound_colour, upper_bound_colour, get_destination(processed_img, in_place))
 
-    def mask_colours(self, processed_img, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2):
+    def mask_colours(self, processed_img, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2, in_place=False):
         """
         Mask all colours in an image that are not within the two provided bounds. Masked colours become black.
 
@@ -79,6 +81,30 @@ class ChangingColourspaceKeywords:
         upper_bound_colour1 = colours[1]
         lower_bound_colour2 = colours[2]
         upper_bound_colour2 = colours[3]
-        verify_valid_image(processed_img)
+        verify_valid_colour_image(processed_img)
         verify_valid_colour_bounds(lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2)
-        return mask_colours_bgr_or_hsv(processed_img, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2)
+        return mask_colours_bgr_or_hsv(processed_img, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2, get_destination(processed_img, in_place))
+
+    def mask_colour_ranges(self, processed_img, *bounds, in_place=False):
+        """
+        Mask all colours in an image that are not within one of the provided bounds. Masked colours become black. The bounds
+        are given as pairs of lower and upper bounds, any number of pairs can be given.
+
+        Example of masking all colours but red, green and blue in a BGR image:
+        | ${img_path}=     Capture Page Screenshot
+        | ${processed_img}=    Read Image   ${img_path}
+        | ${lower1}=   Create List     0   0   200
+        | ${upper1}=   Create List     0   0   255
+        | ${lower2}=   Create List     0   200  0
+        | ${upper2}=   Create List     0   255  0
+        | ${lower3}=   Create List     200   0  0
+        | ${upper3}=   Create List     255   0  0
+        | ${masked_img}=    Mask Colour Ranges    ${processed_img}    ${lower1}    ${upper1}    ${lower2}    ${upper2}    ${lower3}    ${upper3}
+
+        See `Masking Colours` for how the cost of the keyword grows with the number of bounds.
+        """
+        verify_valid_colour_image(processed_img)
+        colours = convert_to_valid_colour_bounds(*bounds)
+        verify_valid_colour_ranges(*colours)
+        bounds = tuple(zip(colours[0::2], colours[1::2]))
+        return mask_colour_ranges_bgr_or_hsv(processed_img, bounds, get_destination(processed_img, in_place))
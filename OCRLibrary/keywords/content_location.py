@@ -2,7 +2,23 @@
 content_location module.
 """
 from ..utils.exceptions.exception_handler \
-    import (verify_valid_image)
+    import (verify_valid_image, verify_valid_image_or_document, verify_valid_match_mode, verify_valid_confidence,
+    verify_valid_image_list, verify_valid_worker_count, verify_batch_succeeded, verify_valid_region, verify_valid_ocr_document,
+    verify_valid_padding, verify_valid_colour_bounds, verify_valid_min_area, verify_valid_image_or_path,
+    verify_valid_template_threshold, verify_valid_template_scales, verify_valid_colour_image)
+from ..utils.helpers.robot_conversions \
+    import (convert_to_valid_int, convert_to_optional_int, convert_to_valid_region, convert_to_valid_colour_bounds,
+    convert_to_scale_list)
+from ..utils.imageprocessing.colour_regions \
+    import (return_colour_regions)
+from ..utils.imageprocessing.template_matching \
+    import (return_template_coordinates, return_multiple_template_bounds)
+from ..utils.imagereading.batch_reading \
+    import (return_text_coordinates_in_images)
+from ..utils.imagereading.incremental_reading \
+    import (update_ocr_document)
+from ..utils.imagereading.ocr_document \
+    import (create_ocr_document)
 from ..utils.imagereading.text_locating \
     import (return_text_coordinates, return_multiple_text_coordinates,
     return_text_bounds, return_multiple_text_bounds)
@@ -11,37 +27,90 @@ class ContentLocationKeywords:
     """
     ContentLocationKeywords Class
     """
-    def locate_text_coordinates(self, processed_img, text, pyt_conf='--psm 6', lang='eng'):
+    def get_ocr_document(self, processed_img, pyt_conf='--psm 6', lang='eng', min_confidence=None, region=None):
+        """
+        Reads the provided image once and returns an OCR document. The OCR document can be given to any of the ``Locate``
+        keywords instead of an image, each lookup then uses the words already read instead of running OCR again.
+
+        Words read with a confidence lower than ``min_confidence`` (0 to 100) are left out of the OCR document.
+
+        Example:
+        | ${document}=    Get OCR Document    ${processed_img}
+        | ${ok_coordinates}=    Locate Text Coordinates    ${document}    Ok
+        | ${cancel_bounds}=    Locate Text Bounds    ${document}    Cancel
+
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_image(processed_img)
+        verify_valid_confidence(min_confidence)
+        verify_valid_region(region, processed_img)
+        if min_confidence is not None:
+            min_confidence = float(min_confidence)
+        return create_ocr_document(processed_img, pyt_conf, lang, min_confidence, convert_to_valid_region(region),
+            keep_image=True)
+
+    def update_ocr_document(self, document, processed_img, padding=8):
+        """
+        Returns the OCR document of a new version of the image read by ``Get OCR Document`` (i.e. a new screenshot of the
+        same screen after a small update). Only the parts of the image that changed are read again, with ``padding`` pixels
+        around them, and the words read are spliced into the words of the document. The given document is not modified.
+
+        The configuration, language, minimum confidence and region of the document are used to read the new image. If the
+        size of the image changed, or if most of the image changed, the full image is read again.
+
+        Example:
+        | ${document}=    Get OCR Document    ${processed_img}
+        | Click Button    Next
+        | ${document}=    Update OCR Document    ${document}    ${new_processed_img}
+        | ${coordinates}=    Locate Text Coordinates    ${document}    Finish
+
+        See `Locating Text` for details about using an OCR document.
+        """
+        verify_valid_ocr_document(document)
+        verify_valid_image(processed_img)
+        verify_valid_padding(padding)
+        return update_ocr_document(document, processed_img, convert_to_valid_int(padding))
+
+    def locate_text_coordinates(self, processed_img, text, pyt_conf='--psm 6', lang='eng', match_mode='exact', region=None):
         """
         Locates the coordinates of the provided text. This keyword gets the first occurrance of the text.
         Use ``Locate Multiple Text Coordinates`` if there is more than one occurrance of the text.
         The coordinates found are returned as a tuple (x, y). If nothing is found, None is returned.
 
         See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Locating Text` for details about using an OCR document and the match_mode argument.
+        See `Regions Of Interest` for details about the region argument.
 
         Please note: as of version 1.2.0 this keyword only finds the coordinates of a single word. This will not
         work for sentances.
         """
-        verify_valid_image(processed_img)
-        coordinates = return_text_coordinates(processed_img, text, pyt_conf, lang)
+        verify_valid_image_or_document(processed_img)
+        verify_valid_match_mode(match_mode)
+        verify_valid_region(region, processed_img)
+        coordinates = return_text_coordinates(processed_img, text, pyt_conf, lang, match_mode, convert_to_valid_region(region))
         return coordinates
 
-    def locate_multiple_text_coordinates(self, processed_img, text, pyt_conf='--psm 6', lang='eng'):
+    def locate_multiple_text_coordinates(self, processed_img, text, pyt_conf='--psm 6', lang='eng', match_mode='exact', region=None):
         """
         Locates the coordiantes of more than one instance of the provided text. This keyword can also be used if there is only
         one occurrance of the text. A list of coordinates found is return, each index stores a tuple (x, y).
         If nothing is found, None is returned.
 
         See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Locating Text` for details about using an OCR document and the match_mode argument.
+        See `Regions Of Interest` for details about the region argument.
 
         Please note: as of version 1.2.0 this keyword only finds the coordinates of a single word. This will not
         work for sentances.
         """
-        verify_valid_image(processed_img)
-        multiple_coordinates = return_multiple_text_coordinates(processed_img, text, pyt_conf, lang)
+        verify_valid_image_or_document(processed_img)
+        verify_valid_match_mode(match_mode)
+        verify_valid_region(region, processed_img)
+        multiple_coordinates = return_multiple_text_coordinates(processed_img, text, pyt_conf, lang, match_mode, convert_to_valid_region(region))
         return multiple_coordinates
 
-    def locate_text_bounds(self, processed_img, text, pyt_conf='--psm 6', lang='eng'):
+    def locate_text_bounds(self, processed_img, text, pyt_conf='--psm 6', lang='eng', match_mode='exact', region=None):
         """
         Locates the bounds found around the provided text. This keyword gets the first occurrance of the text.
         Use ``Locate Multiple Text Bounds`` if there is more than one occurrance of the text.
@@ -61,15 +130,19 @@ class ContentLocationKeywords:
         - h represents the height of the bound.
 
         See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Locating Text` for details about using an OCR document and the match_mode argument.
+        See `Regions Of Interest` for details about the region argument.
 
         Please note: as of version 1.2.0 this keyword only finds the coordinates of a single word. This will not
         work for sentances.
         """
-        verify_valid_image(processed_img)
-        bounds = return_text_bounds(processed_img, text, pyt_conf, lang)
+        verify_valid_image_or_document(processed_img)
+        verify_valid_match_mode(match_mode)
+        verify_valid_region(region, processed_img)
+        bounds = return_text_bounds(processed_img, text, pyt_conf, lang, match_mode, convert_to_valid_region(region))
         return bounds
 
-    def locate_multiple_text_bounds(self, processed_img, text, pyt_conf='--psm 6', lang='eng'):
+    def locate_multiple_text_bounds(self, processed_img, text, pyt_conf='--psm 6', lang='eng', match_mode='exact', region=None):
         """
         Locates the bounds found around more than one instance of the provided text. This keyword can also be used if there is one occurrance
         of the text. A list of tuples containing the bounds are returned if the text is found. Returns None if nothing is found.
@@ -77,10 +150,107 @@ class ContentLocationKeywords:
         See ``Locate Text Bounds`` documentation for an example of what each index in the tuple corresponds to.
 
         See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Locating Text` for details about using an OCR document and the match_mode argument.
+        See `Regions Of Interest` for details about the region argument.
 
         Please note: as of version 1.2.0 this keyword only finds the coordinates of a single word. This will not
         work for sentances.
         """
-        verify_valid_image(processed_img)
-        multiple_bounds = return_multiple_text_bounds(processed_img, text, pyt_conf, lang)
+        verify_valid_image_or_document(processed_img)
+        verify_valid_match_mode(match_mode)
+        verify_valid_region(region, processed_img)
+        multiple_bounds = return_multiple_text_bounds(processed_img, text, pyt_conf, lang, match_mode, convert_to_valid_region(region))
         return multiple_bounds
+
+    def locate_text_in_images(self, images, text, pyt_conf='--psm 6', lang='eng', match_mode='exact', workers=None, queue_size=None,
+        continue_on_failure=False):
+        """
+        Locates the coordinates of the first occurrence of the provided text in each of the provided images. The images can be
+        processed images or image paths. Returns a list with a tuple (x, y) for each image, in the same order as the images.
+        None is returned for an image where the text is not found.
+
+        The images are read in parallel by ``workers`` processes (defaults to the number of CPUs). At most ``queue_size``
+        images (defaults to twice the number of workers) are waiting to be read at any time.
+
+        If an image cannot be read, ``BatchOCRFailed`` is raised listing every image that failed. When ``continue_on_failure``
+        is True, a warning is logged for each image that failed and its coordinates are None instead.
+
+        Example:
+        | ${images}=    Create List    ${img_path1}    ${img_path2}
+        | ${coordinates}=    Locate Text In Images    ${images}    Ok    workers=2
+
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Locating Text` for details about the match_mode argument.
+        """
+        verify_valid_image_list(images)
+        verify_valid_match_mode(match_mode)
+        verify_valid_worker_count(workers, queue_size)
+        coordinates, errors = return_text_coordinates_in_images(images, text, pyt_conf, lang, match_mode,
+            convert_to_optional_int(workers), convert_to_optional_int(queue_size))
+        verify_batch_succeeded(errors, continue_on_failure)
+        return coordinates
+
+    def locate_colour_regions(self, processed_img, lower_bound_colour, upper_bound_colour, min_area=1, region=None):
+        """
+        Locates the regions of the image whose colour is within the provided bounds, without reading the image. Pixels within
+        the bounds that touch each other (including diagonally) form a region, and regions with fewer than ``min_area`` pixels
+        are left out. A list of dictionaries is returned, one per region from the top of the image to the bottom, with the
+        keys:
+        - bounds: tuple (x, y, w, h) of the box around the region.
+        - centroid: tuple (x, y) of the center of the pixels of the region.
+        - area: the number of pixels of the region.
+        Returns None if no region is found.
+
+        Example of locating the red badges of a BGR screenshot:
+        | ${lower}=   Create List     0   0   200
+        | ${upper}=   Create List     60   60   255
+        | ${badges}=    Locate Colour Regions    ${processed_img}    ${lower}    ${upper}    min_area=50
+        | ${x}    ${y}=    Set Variable    ${badges}[0][centroid]
+
+        See `Masking Colours` for details about the bounds.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_colour_image(processed_img)
+        colours = convert_to_valid_colour_bounds(lower_bound_colour, upper_bound_colour)
+        verify_valid_colour_bounds(*colours)
+        verify_valid_min_area(min_area)
+        verify_valid_region(region, processed_img)
+        return return_colour_regions(processed_img, (tuple(colours),), convert_to_valid_int(min_area), convert_to_valid_region(region))
+
+    def locate_image_template(self, processed_img, template, threshold=0.9, scales=1, region=None):
+        """
+        Locates the coordinates of the best match of the template image (i.e. an icon or a button) in the provided image,
+        without reading the image. The template can be an image or an image path. The coordinates of the center of the match
+        are returned as a tuple (x, y). If no part of the image is as similar to the template as the ``threshold`` (0 to 1),
+        None is returned.
+
+        Example:
+        | ${coordinates}=    Locate Image Template    ${processed_img}    ${CURDIR}/icons/save.png
+        | ${coordinates}=    Locate Image Template    ${processed_img}    ${CURDIR}/icons/save.png    threshold=0.8    scales=1,2
+
+        See `Locating Images` for details about the threshold and scales arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_image(processed_img)
+        verify_valid_image_or_path(template)
+        verify_valid_template_threshold(threshold)
+        verify_valid_template_scales(scales)
+        verify_valid_region(region, processed_img)
+        return return_template_coordinates(processed_img, template, float(threshold), convert_to_scale_list(scales),
+            convert_to_valid_region(region))
+
+    def locate_all_image_templates(self, processed_img, template, threshold=0.9, scales=1, region=None):
+        """
+        Locates the bounds of every match of the template image in the provided image, without reading the image. A list of
+        tuples (x, y, w, h) is returned, the best match first. Returns None if the template is not found.
+
+        See ``Locate Text Bounds`` documentation for an example of what each index in the tuple corresponds to.
+        See ``Locate Image Template`` documentation for details about the arguments.
+        """
+        verify_valid_image(processed_img)
+        verify_valid_image_or_path(template)
+        verify_valid_template_threshold(threshold)
+        verify_valid_template_scales(scales)
+        verify_valid_region(region, processed_img)
+        return return_multiple_template_bounds(processed_img, template, float(threshold), convert_to_scale_list(scales),
+            convert_to_valid_region(region))
@@ -2,29 +2,164 @@
 content_validation module.
 """
 from ..utils.exceptions.exception_handler \
-    import (verify_valid_image, verify_content)
+    import (verify_valid_image, verify_valid_image_or_document, verify_content, verify_valid_image_list, verify_valid_worker_count,
+    verify_batch_succeeded, verify_valid_region, verify_valid_confidence, verify_valid_ocr_outputs, verify_valid_colour_bounds,
+    verify_valid_min_area, verify_valid_padding, verify_valid_regions, verify_valid_colour_image)
+from ..utils.helpers.robot_conversions \
+    import (convert_to_valid_int, convert_to_optional_int, convert_to_valid_region, convert_to_output_list,
+    convert_to_valid_colour_bounds, convert_to_valid_regions)
+from ..utils.imagereading.batch_reading \
+    import (return_images_content)
+from ..utils.imagereading.colour_guided_reading \
+    import (return_colour_regions_content)
 from ..utils.imagereading.image_reading \
     import (return_image_content)
+from ..utils.imagereading.mosaic_reading \
+    import (return_regions_content)
+from ..utils.imagereading.ocr_document \
+    import (OCRDocument, DOCUMENT_OUTPUTS, create_ocr_outputs)
+
+def _read_content(processed_img, pyt_conf, lang, region):
+    """
+    Returns the text of the image, or the text of the OCR document (limited to the region if any).
+    """
+    if isinstance(processed_img, OCRDocument):
+        return (processed_img if region is None else processed_img.within(region)).text
+    return return_image_content(processed_img, pyt_conf, lang, region)
 
 class ContentValidationKeywords:
     """
     ContentValidationKeywords Class
     """
-    def validate_image_content(self, processed_img, expected_content, pyt_conf='--psm 6', lang='eng'):
+    def validate_image_content(self, processed_img, expected_content, pyt_conf='--psm 6', lang='eng', region=None):
         """
         Confirms that an image contains the expected content. If the content is not found, ``ContentNotFound`` will be raised.
 
+        An OCR document returned by ``Get OCR Document`` can be given instead of an image, the text read when the document
+        was created is then validated without running OCR again.
+
         See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
         """
-        verify_valid_image(processed_img)
-        actual_content = return_image_content(processed_img, pyt_conf, lang)
+        verify_valid_image_or_document(processed_img)
+        verify_valid_region(region, processed_img)
+        actual_content = _read_content(processed_img, pyt_conf, lang, convert_to_valid_region(region))
         return verify_content(expected_content, actual_content)
 
-    def get_image_content(self, processed_img, pyt_conf='--psm 6', lang='eng'):
+    def get_image_content(self, processed_img, pyt_conf='--psm 6', lang='eng', region=None):
+        """
+        Gets the text found within the provided processed image, or within the provided OCR document.
+
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_image_or_document(processed_img)
+        verify_valid_region(region, processed_img)
+        return _read_content(processed_img, pyt_conf, lang, convert_to_valid_region(region))
+
+    def get_image_ocr_outputs(self, processed_img, outputs='text,document', pyt_conf='--psm 6', lang='eng', min_confidence=None, region=None):
+        """
+        Reads the provided image once and returns a dictionary with each of the requested outputs. ``outputs`` is a list or
+        a comma separated string of:
+        - ``text`` the text found within the image (see ``Get Image Content``).
+        - ``document`` the OCR document of the image (see ``Get OCR Document``), its text is the text found within the image.
+        - ``hocr`` the hOCR (HTML) of the image.
+        - ``alto`` the ALTO XML of the image.
+
+        Example:
+        | ${outputs}=    Get Image OCR Outputs    ${processed_img}    text,document,hocr
+        | Should Contain    ${outputs}[text]    Welcome
+        | ${coordinates}=    Locate Text Coordinates    ${outputs}[document]    Continue
+
+        See `Reading Multiple Outputs` for more details.
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_image(processed_img)
+        verify_valid_ocr_outputs(outputs, DOCUMENT_OUTPUTS)
+        verify_valid_confidence(min_confidence)
+        verify_valid_region(region, processed_img)
+        if min_confidence is not None:
+            min_confidence = float(min_confidence)
+        return create_ocr_outputs(processed_img, pyt_conf, lang, convert_to_output_list(outputs), min_confidence,
+            convert_to_valid_region(region), keep_image=True)
+
+    def get_images_content(self, images, pyt_conf='--psm 6', lang='eng', workers=None, queue_size=None, continue_on_failure=False):
         """
-        Gets the text found within the provided processed image.
+        Gets the text found within each of the provided images. The images can be processed images or image paths.
+        Returns a list with the text of each image, in the same order as the images.
+
+        The images are read in parallel by ``workers`` processes (defaults to the number of CPUs). At most ``queue_size``
+        images (defaults to twice the number of workers) are waiting to be read at any time.
+
+        If an image cannot be read, ``BatchOCRFailed`` is raised listing every image that failed. When ``continue_on_failure``
+        is True, a warning is logged for each image that failed and its text is None instead.
+
+        Example:
+        | ${images}=    Create List    ${img_path1}    ${img_path2}    ${processed_img}
+        | ${contents}=    Get Images Content    ${images}    workers=4
+
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        """
+        verify_valid_image_list(images)
+        verify_valid_worker_count(workers, queue_size)
+        contents, errors = return_images_content(images, pyt_conf, lang, convert_to_optional_int(workers), convert_to_optional_int(queue_size))
+        verify_batch_succeeded(errors, continue_on_failure)
+        return contents
+
+    def read_text_in_colour_regions(self, processed_img, lower_bound_colour, upper_bound_colour, pyt_conf='--psm 6', lang='eng',
+        min_area=100, padding=0, workers=None, region=None):
+        """
+        Reads the text inside each region of the image whose colour is within the provided bounds (i.e. highlighted rows or
+        coloured buttons). The regions are found as with ``Locate Colour Regions``, regions with fewer than ``min_area`` pixels
+        are not read, and only the box around each region, grown by ``padding`` pixels, is read. Regions inside the box of
+        another region (i.e. the inside of the letters written on a coloured row) are not read on their own. The boxes are
+        read in parallel by ``workers`` threads (defaults to the number of CPUs).
+
+        A list of dictionaries is returned, one per region from the top of the image to the bottom, with the keys:
+        - bounds: tuple (x, y, w, h) of the part of the image read, relative to the full image.
+        - text: the text read in the region, without trailing white space.
+        Returns None if no region is found.
+
+        Example of reading the rows highlighted in yellow of a BGR screenshot:
+        | ${lower}=   Create List     0   200   200
+        | ${upper}=   Create List     80   255   255
+        | ${rows}=    Read Text In Colour Regions    ${processed_img}    ${lower}    ${upper}
+        | Should Be Equal    ${rows}[0][text]    Invoice 1042
+
+        See `Masking Colours` for details about the bounds.
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_colour_image(processed_img)
+        colours = convert_to_valid_colour_bounds(lower_bound_colour, upper_bound_colour)
+        verify_valid_colour_bounds(*colours)
+        verify_valid_min_area(min_area)
+        verify_valid_padding(padding)
+        verify_valid_worker_count(workers)
+        verify_valid_region(region, processed_img)
+        return return_colour_regions_content(processed_img, (tuple(colours),), pyt_conf, lang, convert_to_valid_int(min_area),
+            convert_to_valid_int(padding), convert_to_optional_int(workers), convert_to_valid_region(region))
+
+    def read_text_in_regions(self, processed_img, regions, pyt_conf='--psm 6', lang='eng', padding=10):
+        """
+        Reads the text of many small regions of the provided image (i.e. prices, counters or labels) with a single OCR run.
+        ``regions`` is a dictionary of names to regions (x, y, w, h). Returns a dictionary of the names to the text read in
+        each region, without trailing white space.
+
+        The regions are stacked one below the other in a single image, with ``padding`` pixels around each region, which is
+        read once. This is much faster than reading each region on its own with ``Get Image Content``, especially with the
+        pytesseract OCR engine which starts a new process for each read.
+
+        Example:
+        | &{regions}=    Create Dictionary    price=${{(1200, 340, 160, 40)}}    quantity=${{(1200, 400, 80, 40)}}
+        | ${contents}=    Read Text In Regions    ${processed_img}    ${regions}
+        | Should Be Equal    ${contents}[price]    $12.99
 
         See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the regions.
         """
         verify_valid_image(processed_img)
-        return return_image_content(processed_img, pyt_conf, lang)
+        verify_valid_regions(regions, processed_img)
+        verify_valid_padding(padding)
+        return return_regions_content(processed_img, convert_to_valid_regions(regions), pyt_conf, lang, convert_to_valid_int(padding))
@@ -0,0 +1,62 @@
+"""
+content_waiting module.
+"""
+from ..utils.exceptions.exception_handler \
+    import (verify_valid_screenshot, verify_valid_wait_arguments, verify_valid_region)
+from ..utils.exceptions.exceptions \
+    import (ContentNotFound, ContentStillFound)
+from ..utils.helpers.robot_conversions \
+    import (convert_to_seconds, convert_to_valid_region)
+from ..utils.imagereading.content_waiting \
+    import (capture_frame, wait_for_content)
+
+class ContentWaitingKeywords:
+    """
+    ContentWaitingKeywords Class
+    """
+    def wait_until_text_is_visible(self, screenshot, expected_content, timeout='10s', poll_interval='0.5s', backoff=1.0,
+            pyt_conf='--psm 6', lang='eng', region=None):
+        """
+        Waits until the expected content is found within the screenshots taken. Returns the first screenshot (numpy.ndarray)
+        containing the expected content. If the content is not found before the timeout, ``ContentNotFound`` will be raised.
+
+        Example:
+        | ${screen}=    Wait Until Text Is Visible    Take Screenshot Of Application    Saved    timeout=30s
+
+        See `Waiting For Text` for details about the screenshot, timeout, poll_interval and backoff arguments.
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_screenshot(screenshot)
+        verify_valid_wait_arguments(timeout, poll_interval, backoff)
+        verify_valid_region(region)
+        first_frame = capture_frame(screenshot)
+        verify_valid_region(region, first_frame)
+        found, frame, content = wait_for_content(screenshot, expected_content, True, convert_to_seconds(timeout),
+            convert_to_seconds(poll_interval), float(backoff), pyt_conf, lang, convert_to_valid_region(region), first_frame)
+        if not found:
+            raise ContentNotFound(f"The expected content: {expected_content} was not found within {timeout}. Last content read: {content}")
+        return frame
+
+    def wait_until_text_disappears(self, screenshot, expected_content, timeout='10s', poll_interval='0.5s', backoff=1.0,
+            pyt_conf='--psm 6', lang='eng', region=None):
+        """
+        Waits until the expected content is no longer found within the screenshots taken. If the content is still found
+        after the timeout, ``ContentStillFound`` will be raised.
+
+        Example:
+        | Wait Until Text Disappears    ${CURDIR}/screen.png    Loading...    timeout=1 minute    backoff=1.5
+
+        See `Waiting For Text` for details about the screenshot, timeout, poll_interval and backoff arguments.
+        See `Pytesseract Configuration Strings` for details about pyt_conf and lang arguments.
+        See `Regions Of Interest` for details about the region argument.
+        """
+        verify_valid_screenshot(screenshot)
+        verify_valid_wait_arguments(timeout, poll_interval, backoff)
+        verify_valid_region(region)
+        first_frame = capture_frame(screenshot)
+        verify_valid_region(region, first_frame)
+        disappeared, _, content = wait_for_content(screenshot, expected_content, False, convert_to_seconds(timeout),
+            convert_to_seconds(poll_interval), float(backoff), pyt_conf, lang, convert_to_valid_region(region), first_frame)
+        if not disappeared:
+            raise ContentStillFound(f"The content: {expected_content} was still found after {timeout}. Last content read: {content}")
@@ -0,0 +1,35 @@
+"""
+image_pipeline module.
+
+This module is responsible for applying several image transformations to an image in one keyword call.
+"""
+from ..utils.exceptions.exception_handler \
+    import (verify_valid_image, verify_valid_pipeline)
+from ..utils.helpers.robot_conversions \
+    import (convert_to_pipeline_definition)
+from ..utils.imageprocessing.image_pipeline \
+    import (get_compiled_pipeline, compile_pipeline)
+
+class ImagePipelineKeywords:
+    """
+    ImagePipelineKeywords Class
+    """
+    def apply_pipeline(self, processed_img, steps):
+        """
+        Applies the steps of a pipeline to the provided image, in order, and returns the transformed image. The given image
+        is not modified.
+
+        Example:
+        | ${processed_img}=    Read Image    ${img_path}
+        | @{steps}=    Create List    gray_scale    threshold threshold=150    morph_opening kernel_size=3,3    blur type=median kernel_size=3
+        | ${pipeline_img}=    Apply Pipeline    ${processed_img}    ${steps}
+
+        See `Image Pipelines` for details about the steps and their arguments.
+        """
+        verify_valid_image(processed_img)
+        definition = convert_to_pipeline_definition(steps)
+        pipeline = get_compiled_pipeline(definition)
+        if pipeline is None:
+            verify_valid_pipeline(definition)
+            pipeline = compile_pipeline(definition)
+        return pipeline(processed_img)
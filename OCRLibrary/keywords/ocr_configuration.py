@@ -0,0 +1,136 @@
+"""
+ocr_configuration module.
+
+This module is responsible for configuring how the OCR keywords read images.
+"""
+from robot.utils import is_truthy
+from ..utils.exceptions.exception_handler \
+    import (verify_valid_ocr_engine, verify_valid_cache_size, verify_valid_tiling, verify_valid_worker_count,
+    verify_valid_kernel_size, verify_valid_padding)
+from ..utils.helpers.robot_conversions \
+    import (convert_to_valid_int, convert_to_optional_int, convert_to_valid_kernel_size)
+from ..utils.imagereading.image_reading \
+    import (OCR_RESULT_CACHE)
+from ..utils.imagereading.line_detection \
+    import (OCR_LINE_DETECTION, set_ocr_line_detection)
+from ..utils.imagereading.ocr_engine \
+    import (OCR_ENGINE_NAMES, get_ocr_engine, set_ocr_engine)
+from ..utils.imagereading.tiled_reading \
+    import (OCR_TILING, set_ocr_tiling)
+
+class OCRConfigurationKeywords:
+    """
+    OCRConfigurationKeywords Class
+    """
+    def set_ocr_engine(self, engine='auto'):
+        """
+        Selects the OCR engine used by every keyword that reads text from an image. Returns the name of the engine in use.
+
+        Available engines:
+        - ``auto`` uses ``tesseract_api`` when libtesseract can be loaded, otherwise ``pytesseract``.
+        - ``tesseract_api`` keeps tesseract and its language models loaded in the robot process (Tesseract C API).
+        - ``pytesseract`` starts a new tesseract process for every keyword call.
+
+        Example:
+        | ${engine}=    Set OCR Engine    pytesseract
+
+        See `OCR Engines` for more details.
+        """
+        verify_valid_ocr_engine(engine, OCR_ENGINE_NAMES)
+        return set_ocr_engine(engine)
+
+    def get_ocr_engine(self):
+        """
+        Returns the name of the OCR engine used by every keyword that reads text from an image.
+
+        See `OCR Engines` for more details.
+        """
+        return get_ocr_engine().name
+
+    def set_ocr_cache_size(self, max_entries=128, max_bytes=33554432):
+        """
+        Sets the budget of the OCR result cache. Setting ``max_entries`` or ``max_bytes`` to 0 disables the cache.
+
+        Example:
+        | Set OCR Cache Size    max_entries=256    max_bytes=67108864
+
+        See `OCR Result Cache` for more details.
+        """
+        verify_valid_cache_size(max_entries, max_bytes)
+        OCR_RESULT_CACHE.resize(convert_to_valid_int(max_entries), convert_to_valid_int(max_bytes))
+
+    def get_ocr_cache_statistics(self):
+        """
+        Returns a dictionary with the statistics of the OCR result cache:
+        ``hits``, ``misses``, ``entries``, ``bytes``, ``max_entries`` and ``max_bytes``.
+
+        Example:
+        | ${stats}=    Get OCR Cache Statistics
+        | Log    ${stats}[hits]
+
+        See `OCR Result Cache` for more details.
+        """
+        return OCR_RESULT_CACHE.statistics()
+
+    def clear_ocr_cache(self):
+        """
+        Removes every result from the OCR result cache and resets its statistics.
+
+        See `OCR Result Cache` for more details.
+        """
+        OCR_RESULT_CACHE.clear()
+
+    def set_ocr_tiling(self, tile_size=0, overlap=100, workers=None):
+        """
+        Sets the tiling used to read very large images. Images wider or taller than ``tile_size`` pixels are split in
+        overlapping tiles of ``tile_size`` by ``tile_size`` pixels, and the tiles are read in parallel by ``workers`` threads
+        (defaults to the number of CPUs). Setting ``tile_size`` to 0 disables tiling (default).
+
+        ``overlap`` is the number of pixels shared by neighbouring tiles, it must be larger than the largest word in the image.
+
+        Example:
+        | Set OCR Tiling    tile_size=1024    overlap=128
+
+        See `Tiled Reading` for more details.
+        """
+        verify_valid_tiling(tile_size, overlap)
+        verify_valid_worker_count(workers)
+        set_ocr_tiling(convert_to_valid_int(tile_size), convert_to_valid_int(overlap), convert_to_optional_int(workers))
+
+    def get_ocr_tiling(self):
+        """
+        Returns a dictionary with the tiling used to read very large images: ``tile_size``, ``overlap`` and ``workers``.
+
+        See `Tiled Reading` for more details.
+        """
+        return dict(OCR_TILING)
+
+    def set_ocr_line_detection(self, enabled=True, kernel_size=(35, 5), padding=4, workers=None):
+        """
+        Enables or disables reading images line by line. When enabled, the lines of text of an image are detected first and
+        each line, grown by ``padding`` pixels, is read as a single line of text, the lines being read in parallel by
+        ``workers`` threads (defaults to the number of CPUs). Line detection is disabled by default.
+
+        ``kernel_size`` is the size of the rectangle kernel joining the characters of a line, its width must be larger than the
+        space between two words of a line, and its height smaller than the space between two lines.
+
+        Example:
+        | Set OCR Line Detection
+        | ${coordinates}=    Locate Text Coordinates    ${processed_img}    Submit
+        | Set OCR Line Detection    enabled=False
+
+        See `Text Line Detection` for more details.
+        """
+        verify_valid_kernel_size(kernel_size)
+        verify_valid_padding(padding)
+        verify_valid_worker_count(workers)
+        set_ocr_line_detection(is_truthy(enabled), convert_to_valid_kernel_size(kernel_size), convert_to_valid_int(padding),
+            convert_to_optional_int(workers))
+
+    def get_ocr_line_detection(self):
+        """
+        Returns a dictionary with the line detection used to read images: ``enabled``, ``kernel_size``, ``padding`` and ``workers``.
+
+        See `Text Line Detection` for more details.
+        """
+        return dict(OCR_LINE_DETECTION)
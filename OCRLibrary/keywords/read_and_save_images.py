@@ -3,25 +3,102 @@ genericImageProcessing module.
 """
 import os
 import cv2
-from ..utils.exceptions.exception_handler import verify_valid_image_path
+from ..utils.exceptions.exception_handler \
+    import (verify_valid_image_path, verify_valid_read_mode, verify_valid_cache_size, verify_valid_image_bytes,
+    verify_image_decoded)
 from ..utils.helpers.logging import get_log_dir, log_info
+from ..utils.helpers.robot_conversions import convert_to_valid_int
+from ..utils.imageprocessing.image_decoding \
+    import (DECODED_IMAGE_CACHE, decode_image, decode_image_bytes, decode_image_base64)
 
 class ReadImageKeywords:
     """
     ReadImageKeywords Class
     """
-    def read_image(self, img_path):
+    def read_image(self, img_path, mode='colour'):
         """
-        Reads an image.
+        Reads an image. The ``mode`` argument selects how the image is decoded:
+        - ``colour`` the image is decoded to a BGR colour image (default).
+        - ``grayscale`` the image is decoded directly to a gray scale image.
+        - ``reduced_colour_2``, ``reduced_colour_4`` and ``reduced_colour_8`` the image is decoded to a colour image of half,
+        a quarter or an eighth of its width and height.
+        - ``reduced_grayscale_2``, ``reduced_grayscale_4`` and ``reduced_grayscale_8`` the image is decoded to a gray scale
+        image of half, a quarter or an eighth of its width and height.
 
         Example:
         | ${img_path}=    Capture Page Screenshot
         | ${read_image}=    Read Image    ${img_path}
+        | ${half_size_gray_image}=    Read Image    ${img_path}    mode=reduced_grayscale_2
 
-        See `Reading And Saving Images` for details about valid images to provide.
+        The image returned is read only, see `Reading And Saving Images` for details about valid images to provide and the
+        decoded image cache.
         """
         verify_valid_image_path(img_path)
-        return cv2.imread(img_path)
+        verify_valid_read_mode(mode)
+        return decode_image(img_path, mode)
+
+    def read_image_from_bytes(self, img_bytes, mode='colour'):
+        """
+        Reads an image from the bytes of an encoded image (i.e. the PNG bytes of a screenshot), without writing it to a file.
+        See ``Read Image`` for details about the mode argument.
+
+        Example:
+        | ${screenshot}=    Take Screenshot    return_as=bytes
+        | ${read_image}=    Read Image From Bytes    ${screenshot}
+
+        See `Reading And Saving Images` for details about valid images to provide.
+        """
+        verify_valid_image_bytes(img_bytes)
+        verify_valid_read_mode(mode)
+        img = decode_image_bytes(img_bytes, mode)
+        verify_image_decoded(img)
+        return img
+
+    def read_image_from_base64(self, img_base64, mode='colour'):
+        """
+        Reads an image from the base64 string of an encoded image (i.e. a PNG screenshot), without writing it to a file.
+        A data URI prefix such as ``data:image/png;base64,`` is ignored. See ``Read Image`` for details about the mode argument.
+
+        Example:
+        | ${screenshot}=    Take Screenshot    return_as=base64
+        | ${read_image}=    Read Image From Base64    ${screenshot}    mode=grayscale
+
+        See `Reading And Saving Images` for details about valid images to provide.
+        """
+        verify_valid_image_bytes(img_base64, 'base64')
+        verify_valid_read_mode(mode)
+        img = decode_image_base64(img_base64, mode)
+        verify_image_decoded(img)
+        return img
+
+    def set_image_cache_size(self, max_entries=32, max_bytes=268435456):
+        """
+        Sets the budget of the decoded image cache. Setting ``max_entries`` or ``max_bytes`` to 0 disables the cache.
+
+        Example:
+        | Set Image Cache Size    max_entries=8    max_bytes=67108864
+
+        See `Reading And Saving Images` for more details.
+        """
+        verify_valid_cache_size(max_entries, max_bytes)
+        DECODED_IMAGE_CACHE.resize(convert_to_valid_int(max_entries), convert_to_valid_int(max_bytes))
+
+    def get_image_cache_statistics(self):
+        """
+        Returns a dictionary with the statistics of the decoded image cache:
+        ``hits``, ``misses``, ``entries``, ``bytes``, ``max_entries`` and ``max_bytes``.
+
+        See `Reading And Saving Images` for more details.
+        """
+        return DECODED_IMAGE_CACHE.statistics()
+
+    def clear_image_cache(self):
+        """
+        Removes every image from the decoded image cache and resets its statistics.
+
+        See `Reading And Saving Images` for more details.
+        """
+        DECODED_IMAGE_CACHE.clear()
 
 class SaveImageKeywords:
     """
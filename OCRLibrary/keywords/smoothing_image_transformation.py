@@ -9,15 +9,15 @@ from ..utils.exceptions.exception_handler \
 from ..utils.helpers.robot_conversions \
     import (convert_to_valid_kernel_size, convert_to_valid_int)
 from ..utils.imageprocessing.image_processing_generic \
-    import (process_image_filtering_with_rect_kernel, process_image_filtering_with_ellipse_kernel, process_image_filtering_with_cross_kernel,
-    process_median_filtering, process_blurring_averaging, process_blurring_gaussian)
+    import (process_image_filtering, process_median_filtering, process_blurring_averaging, process_blurring_gaussian, get_destination)
+from ..utils.imageprocessing.imagetransformation.structuring_element import KERNEL_TYPES
 
 class SmoothingImageKeywords:
     """
     SmoothingImageKeywords Class
     Reference: https://docs.opencv.org/4.5.2/d4/d13/tutorial_py_filtering.html
     """
-    def apply_filter2D_to_image(self, processed_img, kernel_size, kernel_type=0, depth=-1):
+    def apply_filter2D_to_image(self, processed_img, kernel_size, kernel_type=0, depth=-1, in_place=False):
         """
         Applies the filter2D filter to the provided image. Kernel size must be a tuple/list of positive ints.
 
@@ -37,17 +37,11 @@ class SmoothingImageKeywords:
         depth = convert_to_valid_int(depth)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
         kernel_type = convert_to_valid_int(kernel_type)
-        if kernel_type == 0:
-            transformed_image = process_image_filtering_with_rect_kernel(processed_img, kernel_size, depth)
-        elif kernel_type == 1:
-            transformed_image = process_image_filtering_with_ellipse_kernel(processed_img, kernel_size, depth)
-        elif kernel_type == 2:
-            transformed_image = process_image_filtering_with_cross_kernel(processed_img, kernel_size, depth)
-        else:
+        if kernel_type not in KERNEL_TYPES:
             return raise_invalid_kernel_type(kernel_type)
-        return transformed_image
+        return process_image_filtering(processed_img, kernel_type, kernel_size, depth, get_destination(processed_img, in_place))
 
-    def apply_median_filtering_to_image(self, processed_img, kernel_size):
+    def apply_median_filtering_to_image(self, processed_img, kernel_size, in_place=False):
         """
         Applies the median filter to the provided image.
         ``kernel_size`` takes an integer that is odd and greater than 0. Not a tuple/list.
@@ -59,9 +53,9 @@ class SmoothingImageKeywords:
         verify_valid_image(processed_img)
         verify_valid_kernel_size_non_tuple(kernel_size)
         kernel_size = convert_to_valid_int(kernel_size)
-        return process_median_filtering(processed_img, kernel_size)
+        return process_median_filtering(processed_img, kernel_size, get_destination(processed_img, in_place))
 
-    def apply_averaging_blur_to_image(self, processed_img, kernel_size):
+    def apply_averaging_blur_to_image(self, processed_img, kernel_size, in_place=False):
         """
         Applies the averaging blur to the provided image.  Kernel size must be a tuple/list of positive ints.
 
@@ -74,9 +68,9 @@ class SmoothingImageKeywords:
         verify_valid_image(processed_img)
         verify_valid_kernel_size(kernel_size)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        return process_blurring_averaging(processed_img, kernel_size)
+        return process_blurring_averaging(processed_img, kernel_size, get_destination(processed_img, in_place))
 
-    def apply_gaussian_blur_to_image(self, processed_img, kernel_size):
+    def apply_gaussian_blur_to_image(self, processed_img, kernel_size, in_place=False):
         """
         Applies the gaussian blur to the provided image. Kernel size must be a tuple/list of positive and odd ints.
 
@@ -87,4 +81,4 @@ class SmoothingImageKeywords:
         verify_valid_image(processed_img)
         verify_valid_kernel_size_only_odds(kernel_size)
         kernel_size = convert_to_valid_kernel_size(kernel_size)
-        return process_blurring_gaussian(processed_img, kernel_size)
+        return process_blurring_gaussian(processed_img, kernel_size, get_destination(processed_img, in_place))
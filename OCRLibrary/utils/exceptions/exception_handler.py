@@ -3,9 +3,17 @@ Exception handler module.
 """
 import numpy
 import cv2
+from robot.utils import is_truthy, timestr_to_secs
 from OCRLibrary.utils.exceptions.exceptions \
     import (InvalidKernelSize, InvalidKernelType, InvalidIteration, ContentNotFound, InvalidImageArgument,
-    InvalidColourBoundArguments, InvalidImagePath, InvalidThresholdValue, InvalidDepthArgument)
+    InvalidColourBoundArguments, InvalidImagePath, InvalidThresholdValue, InvalidDepthArgument, InvalidOCREngine,
+    InvalidCacheSize, InvalidMatchMode, InvalidConfidenceValue, InvalidWorkerCount, BatchOCRFailed,
+    InvalidRegionArgument, InvalidTilingArgument, InvalidWaitArgument,
+    InvalidOCROutput, InvalidReadMode, InvalidPipelineStep, InvalidTemplateArgument)
+from OCRLibrary.utils.imageprocessing.image_decoding import READ_MODES, get_read_mode
+from OCRLibrary.utils.imageprocessing.image_pipeline import PIPELINE_STEPS, THRESHOLD_TYPES, BLUR_TYPES
+from OCRLibrary.utils.imagereading.ocr_document import OCRDocument, MATCH_MODES
+from OCRLibrary.utils.helpers.logging import log_warning
 
 def verify_content(expected_content, actual_content):
     """
@@ -74,6 +82,112 @@ def verify_valid_image(processed_img):
         return True
     raise InvalidImageArgument("The image argument provided is invalid. Please give an image that has been returned from any of the image processing keywords.")
 
+def verify_valid_colour_image(processed_img):
+    """
+    Function verifies if the given image is a valid colour image.
+    That is an image that meets the conditions of verify_valid_image, with 3 (BGR or HSV) or 4 (BGRA) channels.
+    """
+    verify_valid_image(processed_img)
+    if processed_img.ndim == 3 and processed_img.shape[2] in (3, 4):
+        return True
+    raise InvalidImageArgument("The image argument provided is invalid. Please give a colour image, gray or binary images have no colours to mask.")
+
+def verify_valid_image_or_document(processed_img):
+    """
+    Function verifies if the given image is valid or is an OCR document returned by the Get OCR Document keyword.
+    """
+    if isinstance(processed_img, (numpy.ndarray, OCRDocument)):
+        return True
+    raise InvalidImageArgument("The image argument provided is invalid. Please give an image that has been returned from any of the image processing keywords, or an OCR document returned by Get OCR Document.")
+
+def verify_valid_ocr_document(document):
+    """
+    Function verifies if the given document is an OCR document returned by the Get OCR Document keyword.
+    """
+    if isinstance(document, OCRDocument) and document.image is not None:
+        return True
+    raise InvalidImageArgument("The document argument provided is invalid. Please give an OCR document returned by Get OCR Document or Update OCR Document.")
+
+def verify_valid_padding(padding):
+    """
+    Function verifies if the given padding around a region is valid. Must be an int greater than or equal to 0.
+    """
+    try:
+        if isinstance(padding, (int, str, float)) and int(float(padding)) >= 0:
+            return True
+    except ValueError:
+        pass
+    raise InvalidRegionArgument(f"The provided padding: {padding} is invalid. Please provide an integer that is greater than or equal to 0.")
+
+def verify_valid_regions(regions, processed_img=None):
+    """
+    Function verifies if the given named regions of interest are valid. Must be a non empty dictionary of names to regions,
+    each region must be valid (see verify_valid_region).
+    """
+    if not isinstance(regions, dict) or not regions:
+        raise InvalidRegionArgument(f"The provided regions: {regions} are invalid. Please provide a dictionary of names to regions (x, y, w, h).")
+    for region in regions.values():
+        if region is None:
+            raise InvalidRegionArgument("The provided regions contain no region. Please provide a region (x, y, w, h) for each name.")
+        verify_valid_region(region, processed_img)
+    return True
+
+def verify_valid_min_area(min_area):
+    """
+    Function verifies if the given minimum area of a region is valid. Must be an int greater than or equal to 1.
+    """
+    try:
+        if isinstance(min_area, (int, str, float)) and int(float(min_area)) >= 1:
+            return True
+    except ValueError:
+        pass
+    raise InvalidRegionArgument(f"The provided minimum area: {min_area} is invalid. Please provide an integer that is greater than or equal to 1.")
+
+def verify_valid_template_threshold(threshold):
+    """
+    Function verifies if the given similarity threshold of a template match is valid. Must be a number between 0 and 1.
+    """
+    try:
+        if isinstance(threshold, (int, str, float)) and 0 <= float(threshold) <= 1:
+            return True
+    except ValueError:
+        pass
+    raise InvalidTemplateArgument(f"The provided threshold: {threshold} is invalid. Please provide a number between 0 and 1.")
+
+def verify_valid_template_scales(scales):
+    """
+    Function verifies if the given scales of a template are valid. Must be a number, a list of numbers or a comma separated
+    string of numbers, each greater than 0.
+    """
+    values = scales.split(',') if isinstance(scales, str) else scales
+    if not isinstance(values, (list, tuple)):
+        values = (values,)
+    try:
+        if values and all(isinstance(value, (int, str, float)) and float(value) > 0 for value in values):
+            return True
+    except ValueError:
+        pass
+    raise InvalidTemplateArgument(f"The provided scales: {scales} are invalid. Please provide a number or a list of numbers greater than 0.")
+
+def verify_valid_ocr_outputs(outputs, names):
+    """
+    Function verifies if the given OCR outputs are valid. Must be a non empty list or comma separated string of the given names.
+    """
+    if isinstance(outputs, str):
+        outputs = outputs.split(',')
+    if isinstance(outputs, (list, tuple)) and outputs and \
+            all(isinstance(output, str) and output.strip().lower() in names for output in outputs):
+        return True
+    raise InvalidOCROutput(f"The provided outputs: {outputs} are invalid. Please provide a list or comma separated string of {', '.join(names)}.")
+
+def verify_valid_match_mode(match_mode):
+    """
+    Function verifies if the given text match mode is one of 'exact', 'ignore_case' or 'normalized'.
+    """
+    if match_mode in MATCH_MODES:
+        return True
+    raise InvalidMatchMode(f"The provided match mode: {match_mode} is invalid. Please provide one of: {', '.join(MATCH_MODES)}.")
+
 def verify_valid_colour_bounds(*arg):
     """
     Function verifies if the given bgr or hsv bounds are valid.
@@ -88,6 +202,15 @@ def verify_valid_colour_bounds(*arg):
             raise InvalidColourBoundArguments("The bound(s) provided are invalid. Please provide an int between 0 and 255.")
     return True
 
+def verify_valid_colour_ranges(*arg):
+    """
+    Function verifies if the given bgr or hsv bounds are pairs of valid lower and upper bounds.
+    At least one pair must be given, and each bound must meet the conditions of verify_valid_colour_bounds.
+    """
+    if len(arg) == 0 or len(arg) % 2 != 0:
+        raise InvalidColourBoundArguments(f"The bounds provided are invalid. Please provide pairs of lower and upper bounds, {len(arg)} bound(s) were given.")
+    return verify_valid_colour_bounds(*arg)
+
 def verify_valid_image_path(filename, read=True):
     """
     Function verifies if the given image can be encoded/decoded by OpenCV.
@@ -102,6 +225,105 @@ def verify_valid_image_path(filename, read=True):
         return True
     raise InvalidImagePath("The provided filename cannot be encoded by OpenCV. Please insure your desired file format is supported.")
 
+def verify_valid_image_or_path(img):
+    """
+    Function verifies if the given image is valid (see verify_valid_image), or is a path to an image that can be decoded by OpenCV.
+    """
+    if isinstance(img, numpy.ndarray):
+        if img.ndim == 2 or (img.ndim == 3 and img.shape[2] in (1, 3, 4)):
+            return True
+        raise InvalidImageArgument(f"The image argument provided of shape {img.shape} is invalid. Please give a gray scale or colour image.")
+    if isinstance(img, str):
+        return verify_valid_image_path(img)
+    raise InvalidImagePath("The image argument provided is invalid. Please give an image path or an image that has been returned from any of the image processing keywords.")
+
+def verify_valid_image_bytes(data, encoding='bytes'):
+    """
+    Function verifies if the given encoded image is valid. Must be bytes (or a str if the encoding is base64) that is not empty.
+    """
+    types = (bytes, bytearray, memoryview, str) if encoding == 'base64' else (bytes, bytearray, memoryview)
+    if isinstance(data, types) and len(data):
+        return True
+    raise InvalidImageArgument(f"The provided image {encoding} are invalid. Please provide the {encoding} of an encoded image (i.e. a PNG screenshot).")
+
+def verify_image_decoded(img):
+    """
+    Function verifies if an encoded image was decoded. If not, an InvalidImageArgument error is raised.
+    """
+    if img is not None:
+        return True
+    raise InvalidImageArgument("The provided image could not be decoded. Please insure the data is a complete image in a format supported by OpenCV.")
+
+def verify_valid_read_mode(mode):
+    """
+    Function verifies if the given image read mode is one of the read modes of the Read Image keyword.
+    """
+    if isinstance(mode, str) and get_read_mode(mode) in READ_MODES:
+        return True
+    raise InvalidReadMode(f"The provided read mode: {mode} is invalid. Please provide one of {', '.join(READ_MODES)}.")
+
+def _is_number(value):
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+def _verify_valid_pipeline_arguments(name, args):
+    """
+    Function verifies the values of the arguments of a pipeline step, the missing arguments take their default values.
+    """
+    args = dict(PIPELINE_STEPS[name], **args)
+    if name == 'threshold':
+        if args['type'] not in THRESHOLD_TYPES:
+            raise InvalidPipelineStep(f"The threshold type: {args['type']} is invalid. Please provide one of: {', '.join(THRESHOLD_TYPES)}.")
+        if args['type'] == 'trunc' and is_truthy(args['inverse']):
+            raise InvalidPipelineStep("The trunc threshold cannot be inverted.")
+        if not (_is_number(args['threshold']) and _is_number(args['max_threshold'])):
+            raise InvalidThresholdValue(f"Either threshold value {args['threshold']} or {args['max_threshold']} are invalid. Please insure the thresholds are either of type int or float.")
+    if name == 'blur':
+        if args['type'] not in BLUR_TYPES:
+            raise InvalidPipelineStep(f"The blur type: {args['type']} is invalid. Please provide one of: {', '.join(BLUR_TYPES)}.")
+        if args['type'] == 'median':
+            verify_valid_kernel_size_non_tuple(args['kernel_size'])
+        elif args['type'] == 'gaussian':
+            verify_valid_kernel_size_only_odds(args['kernel_size'])
+        else:
+            verify_valid_kernel_size(args['kernel_size'])
+    elif 'kernel_size' in args:
+        verify_valid_kernel_size(args['kernel_size'])
+    if 'kernel_type' in args and not (_is_number(args['kernel_type']) and int(float(args['kernel_type'])) in (0, 1, 2)):
+        raise_invalid_kernel_type(args['kernel_type'])
+    if 'iteration' in args:
+        if not _is_number(args['iteration']):
+            raise InvalidIteration(f"The provided iteration: {args['iteration']} is invalid. Iteration must be an integer.")
+        verify_valid_iteration(int(float(args['iteration'])))
+    if name == 'mask':
+        bounds = (args['lower'], args['upper'])
+        if not all(isinstance(bound, (tuple, list)) and len(bound) == 3 and all(_is_number(value) for value in bound) for bound in bounds):
+            raise InvalidColourBoundArguments("The bound(s) provided are invalid. Please provide an int between 0 and 255.")
+        verify_valid_colour_bounds(*(tuple(int(float(value)) for value in bound) for bound in bounds))
+
+def verify_valid_pipeline(definition):
+    """
+    Function verifies if the given pipeline definition (see convert_to_pipeline_definition) is valid. The pipeline must have
+    at least one step, and every step must be one of the pipeline steps with valid arguments.
+    """
+    if not definition:
+        raise InvalidPipelineStep("The pipeline provided has no steps. Please provide a list of steps.")
+    for name, args in definition:
+        if not isinstance(name, str) or name not in PIPELINE_STEPS:
+            raise InvalidPipelineStep(f"The provided pipeline step: {name} is invalid. Please provide one of: {', '.join(PIPELINE_STEPS)}.")
+        arguments = PIPELINE_STEPS[name]
+        for key, value in args:
+            if key not in arguments or value is None:
+                raise InvalidPipelineStep(f"The argument: {key} of the pipeline step: {name} is invalid. Valid arguments are: {', '.join(arguments) or 'none'}.")
+        missing = [key for key, default in arguments.items() if default is None and key not in dict(args)]
+        if missing:
+            raise InvalidPipelineStep(f"The pipeline step: {name} requires the argument(s): {', '.join(missing)}.")
+        _verify_valid_pipeline_arguments(name, dict(args))
+    return True
+
 def verify_valid_threshold_values(threshold, max_threshold):
     """
     Function verifies if the given threshold values are valid. Threshold values must be an int or a float.
@@ -117,3 +339,137 @@ def verify_valid_depth(depth):
     if (isinstance(depth, (int, str, float)) and int(depth) < 0):
         return True
     raise InvalidDepthArgument("The depth value provided is invalid. Please provide a negative integer.")
+
+def verify_valid_ocr_engine(engine, engine_names):
+    """
+    Function verifies if the given OCR engine name is one of the available engine names.
+    """
+    if engine in engine_names:
+        return True
+    raise InvalidOCREngine(f"The provided OCR engine: {engine} is invalid. Please provide one of: {', '.join(engine_names)}.")
+
+def verify_valid_cache_size(*sizes):
+    """
+    Function verifies if the given cache budgets are valid. Each budget must be an int greater than or equal to 0.
+    """
+    for size in sizes:
+        try:
+            if isinstance(size, (int, str, float)) and int(float(size)) >= 0:
+                continue
+        except ValueError:
+            pass
+        raise InvalidCacheSize(f"The provided cache size: {size} is invalid. Please provide an integer that is greater than or equal to 0.")
+    return True
+
+def verify_valid_tiling(tile_size, overlap):
+    """
+    Function verifies if the given OCR tiling is valid. The tile size must be an int greater than or equal to 0, and the
+    overlap an int greater than or equal to 0 and smaller than the tile size.
+    """
+    try:
+        tile_size, overlap = int(float(tile_size)), int(float(overlap))
+    except (TypeError, ValueError):
+        tile_size = overlap = None
+    if tile_size is None:
+        raise InvalidTilingArgument("The provided tile size or overlap is invalid. Please provide integers.")
+    if tile_size < 0:
+        raise InvalidTilingArgument(f"The provided tile size: {tile_size} is invalid. Please provide an integer that is greater than or equal to 0.")
+    if overlap < 0 or (tile_size and overlap >= tile_size):
+        raise InvalidTilingArgument(f"The provided overlap: {overlap} is invalid. Please provide an integer that is greater than or equal to 0 and smaller than the tile size.")
+    return True
+
+def verify_valid_wait_arguments(timeout, poll_interval, backoff):
+    """
+    Function verifies if the given wait arguments are valid. The timeout and poll interval must be Robot Framework time
+    strings or numbers of seconds (timeout >= 0 and poll interval > 0), and the backoff a number greater than or equal to 1.
+    """
+    for name, value, minimum in (('timeout', timeout, 0), ('poll interval', poll_interval, 0.001)):
+        try:
+            seconds = timestr_to_secs(value)
+        except (TypeError, ValueError):
+            seconds = None
+        if seconds is None or seconds < minimum:
+            raise InvalidWaitArgument(f"The provided {name}: {value} is invalid. Please provide a positive time (i.e. 10s or 1 minute).")
+    try:
+        if isinstance(backoff, (int, str, float)) and float(backoff) >= 1:
+            return True
+    except ValueError:
+        pass
+    raise InvalidWaitArgument(f"The provided backoff: {backoff} is invalid. Please provide a number that is greater than or equal to 1.")
+
+def verify_valid_screenshot(screenshot):
+    """
+    Function verifies if the given screenshot source is valid. Must be a callable, an image path or a keyword name.
+    """
+    if callable(screenshot) or (isinstance(screenshot, str) and screenshot):
+        return True
+    raise InvalidImageArgument(f"The provided screenshot: {screenshot} is invalid. Please provide a keyword name or an image path.")
+
+def verify_valid_confidence(confidence):
+    """
+    Function verifies if the given OCR confidence is valid. Must be None or a number between 0 and 100.
+    """
+    if confidence is None:
+        return True
+    try:
+        if isinstance(confidence, (int, str, float)) and 0 <= float(confidence) <= 100:
+            return True
+    except ValueError:
+        pass
+    raise InvalidConfidenceValue(f"The provided confidence: {confidence} is invalid. Please provide a number between 0 and 100.")
+
+def verify_valid_image_list(images):
+    """
+    Function verifies if the given images are valid. Must be a list/tuple where each image is either an image that has
+    been processed by opencv (is of type numpy.ndarray) or a path to an image.
+    """
+    if isinstance(images, (list, tuple)) and all(isinstance(img, (numpy.ndarray, str)) for img in images):
+        return True
+    raise InvalidImageArgument("The images argument provided is invalid. Please give a list of images returned from any of the image processing keywords, or of image paths.")
+
+def verify_valid_worker_count(*counts):
+    """
+    Function verifies if the given number of workers (or queue size) is valid. Must be None or an int greater than 0.
+    """
+    for count in counts:
+        if count is None:
+            continue
+        try:
+            if isinstance(count, (int, str, float)) and int(float(count)) > 0:
+                continue
+        except ValueError:
+            pass
+        raise InvalidWorkerCount(f"The provided number: {count} is invalid. Please provide an integer that is greater than or equal to 1.")
+    return True
+
+def verify_batch_succeeded(errors, continue_on_failure=False):
+    """
+    Function verifies that every image of a batch was read. If not, a BatchOCRFailed error listing each failed image is raised.
+    If continue_on_failure is true, a warning is logged for each failed image instead and False is returned.
+    """
+    if not errors:
+        return True
+    if continue_on_failure:
+        for i, error in sorted(errors.items()):
+            log_warning(f"Image {i} of the batch could not be read: {error}")
+        return False
+    failures = '; '.join(f"image {i}: {error}" for i, error in sorted(errors.items()))
+    raise BatchOCRFailed(f"{len(errors)} image(s) of the batch could not be read. {failures}")
+
+def verify_valid_region(region, processed_img=None):
+    """
+    Function verifies if the given region of interest is valid. Must be None or a tuple/list (x, y, w, h) of ints where
+    x and y are positive or zero, and w and h are greater than zero. If an image is given, the region must overlap the image.
+    """
+    if region is None:
+        return True
+    try:
+        if isinstance(region, (tuple, list)) and len(region) == 4:
+            x, y, w, h = (int(float(value)) for value in region)
+            if x >= 0 and y >= 0 and w > 0 and h > 0:
+                if not isinstance(processed_img, numpy.ndarray) or (x < processed_img.shape[1] and y < processed_img.shape[0]):
+                    return True
+                raise InvalidRegionArgument(f"The provided region: {region} is outside of the image of size {processed_img.shape[1]}x{processed_img.shape[0]}.")
+    except (TypeError, ValueError):
+        pass
+    raise InvalidRegionArgument(f"The provided region: {region} is invalid. Please provide a tuple/list (x, y, w, h) where x and y are positive ints, and w and h are ints greater than 0.")
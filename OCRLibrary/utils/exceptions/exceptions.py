@@ -96,3 +96,143 @@ class InvalidDepthArgument(Error):
     """
     def __init__(self, message):
         self.message = message
+
+class InvalidOCREngine(Error):
+    """
+    Purpose:
+        Exception is raised when the requested OCR engine does not exist or is not available.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidCacheSize(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid cache budget is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidMatchMode(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid text match mode is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidConfidenceValue(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid OCR confidence value is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidWorkerCount(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid number of workers or queue size is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class BatchOCRFailed(Error):
+    """
+    Purpose:
+        Exception is raised when one or more images of a batch could not be read.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidRegionArgument(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid region of interest is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidTilingArgument(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid OCR tile size or tile overlap is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class ContentStillFound(Error):
+    """
+    Purpose:
+        Exception raised when the content is still found within the image after waiting for it to disappear.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidWaitArgument(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid timeout, poll interval or backoff is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidOCROutput(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid OCR output name is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidReadMode(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid image read mode is supplied.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidPipelineStep(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid step, or an invalid argument of a step, is supplied to an image pipeline.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class InvalidTemplateArgument(Error):
+    """
+    Purpose:
+        Exception is raised when an invalid threshold or scale is supplied to locate a template image.
+    Attributes:
+        message - explanation of the error.
+    """
+    def __init__(self, message):
+        self.message = message
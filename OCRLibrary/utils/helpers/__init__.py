@@ -2,4 +2,4 @@
 helpers module
 """
 
-__all__ = ["robot_conversions"]
+__all__ = ["buffer_pool", "caching", "logging", "robot_conversions"]
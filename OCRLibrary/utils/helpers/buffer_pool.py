@@ -0,0 +1,96 @@
+"""
+Buffer pool module.
+
+Image transformations that need a temporary image (i.e. the mask of a colour range, or the intermediate images of an
+image pipeline) take an array of the same shape and type from the pool and give it back when they are done, instead of
+allocating a new full size array for every call.
+"""
+import threading
+from contextlib import contextmanager
+import numpy as np
+
+class BufferPool:
+    """
+    BufferPool Class
+
+    Thread safe pool of arrays keyed by their shape and type, bounded by a total number of bytes. A budget of 0 disables
+    the pool, every buffer is then allocated.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self._buffers = {}
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.reused = 0
+        self.allocated = 0
+
+    def acquire(self, shape, dtype=np.uint8):
+        """
+        Returns a buffer of the shape and type, its content is undefined. The buffer must be given back with release.
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            buffers = self._buffers.get(key)
+            if buffers:
+                buffer = buffers.pop()
+                self.current_bytes -= buffer.nbytes
+                self.reused += 1
+                return buffer
+            self.allocated += 1
+        return np.empty(shape, dtype)
+
+    def release(self, *buffers):
+        """
+        Gives the buffers back to the pool. Buffers that do not fit in the budget of the pool are dropped.
+        """
+        with self._lock:
+            for buffer in buffers:
+                if buffer is None or self.current_bytes + buffer.nbytes > self.max_bytes:
+                    continue
+                self._buffers.setdefault((buffer.shape, buffer.dtype.str), []).append(buffer)
+                self.current_bytes += buffer.nbytes
+
+    @contextmanager
+    def borrow(self, shape, dtype=np.uint8):
+        """
+        Context manager acquiring a buffer and releasing it at the end of the block.
+        """
+        buffer = self.acquire(shape, dtype)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    def resize(self, max_bytes):
+        """
+        Changes the budget of the pool and drops the buffers that no longer fit.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            for key in list(self._buffers):
+                buffers = self._buffers[key]
+                while buffers and self.current_bytes > self.max_bytes:
+                    self.current_bytes -= buffers.pop().nbytes
+                if not buffers:
+                    del self._buffers[key]
+
+    def clear(self):
+        """
+        Drops every buffer and resets the counters.
+        """
+        with self._lock:
+            self._buffers.clear()
+            self.current_bytes = 0
+            self.reused = 0
+            self.allocated = 0
+
+    def statistics(self):
+        """
+        Returns a dictionary with the number of buffers reused and allocated, the number of bytes kept and the budget of the pool.
+        """
+        with self._lock:
+            return {'reused': self.reused, 'allocated': self.allocated, 'buffers': sum(len(buffers) for buffers in self._buffers.values()),
+                'bytes': self.current_bytes, 'max_bytes': self.max_bytes}
+
+# Buffers shared by the image processing functions.
+BUFFER_POOL = BufferPool()
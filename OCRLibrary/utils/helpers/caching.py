@@ -0,0 +1,140 @@
+"""
+Caching module.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+
+def hash_image(img):
+    """
+    Purpose:
+        Computes a fast content hash of an image buffer. Two arrays with the same shape, type and pixels have the same hash.
+        A region of an image (a view whose rows are not contiguous) is hashed row by row, without copying it.
+    Args:
+        img - the image (numpy.ndarray).
+    Returns:
+        The hash as bytes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{img.shape}{img.dtype.str}'.encode())
+    if img.flags.c_contiguous:
+        digest.update(memoryview(img).cast('B'))
+    elif img.ndim > 1 and img[0].flags.c_contiguous:
+        for row in img:
+            digest.update(memoryview(row).cast('B'))
+    else:
+        digest.update(memoryview(np.ascontiguousarray(img)).cast('B'))
+    return digest.digest()
+
+def estimate_size(value):
+    """
+    Purpose:
+        Estimates the number of bytes used by a cached value.
+    Args:
+        value - str, bytes, numpy.ndarray, or a dict/list/tuple of those.
+    Returns:
+        Estimated size in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+class LRUCache:
+    """
+    LRUCache Class
+
+    Thread safe least recently used cache bounded by a number of entries and a total number of bytes.
+    A budget of 0 disables the cache.
+    """
+    def __init__(self, max_entries=128, max_bytes=32 * 1024 * 1024):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        """
+        True if the budget of the cache allows storing entries.
+        """
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for the key and marks it as recently used, otherwise returns default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key, default=None):
+        """
+        Returns the cached value for the key and marks it as recently used, otherwise returns default. The lookup is not
+        counted as a hit or a miss (i.e. for a value only used when it is already cached).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        """
+        Stores the value and evicts the least recently used entries until the cache fits its budget.
+        Values larger than the byte budget are not stored.
+        """
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if not self.enabled or size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            self._evict()
+
+    def resize(self, max_entries, max_bytes):
+        """
+        Changes the budget of the cache and evicts entries that no longer fit.
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """
+        Removes every entry and resets the hit/miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self):
+        """
+        Returns a dictionary with the hits, misses, number of entries, number of bytes and the budget of the cache.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                'bytes': self.current_bytes, 'max_entries': self.max_entries, 'max_bytes': self.max_bytes}
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes):
+            self.current_bytes -= self._entries.popitem(last=False)[1][1]
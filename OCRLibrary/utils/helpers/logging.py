@@ -21,3 +21,9 @@ def log_info(message, html):
     Function logs the provided message at the info level
     """
     logger.info(message, html)
+
+def log_warning(message):
+    """
+    Function logs the provided message at the warn level
+    """
+    logger.warn(message)
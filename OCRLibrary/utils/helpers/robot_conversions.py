@@ -1,6 +1,7 @@
 """
 Robot conversions module.
 """
+from robot.utils import timestr_to_secs
 
 def convert_to_valid_kernel_size(size):
     """
@@ -25,6 +26,82 @@ def convert_to_valid_int(value):
     """
     return int(float(value))
 
+def convert_to_optional_int(value):
+    """
+    Purpose:
+        Converts a string to an int, None is kept as None.
+    Args:
+        value - string/float/None
+    Returns:
+        value - of type int or None.
+    """
+    if value is None:
+        return None
+    return convert_to_valid_int(value)
+
+def convert_to_seconds(value):
+    """
+    Purpose:
+        Converts a Robot Framework time string (i.e. '10s', '1 minute' or '1.5') to a number of seconds.
+    Args:
+        value - string/float/int
+    Returns:
+        value - of type float.
+    """
+    return float(timestr_to_secs(value))
+
+def convert_to_output_list(outputs):
+    """
+    Purpose:
+        Converts a list or a comma separated string given in robot to a list of output names.
+    Args:
+        outputs - list/tuple of strings, or string (i.e. 'text,hocr').
+    Returns:
+        outputs - list of stripped lowercase strings.
+    """
+    if isinstance(outputs, str):
+        outputs = outputs.split(',')
+    return [output.strip().lower() for output in outputs]
+
+def convert_to_scale_list(scales):
+    """
+    Purpose:
+        Converts a scale, a list of scales or a comma separated string of scales given in robot to a tuple of floats.
+    Args:
+        scales - int/float/string (i.e. '1,2'), or list/tuple of those.
+    Returns:
+        scales - tuple of floats without duplicates.
+    """
+    if isinstance(scales, str):
+        scales = scales.split(',')
+    elif not isinstance(scales, (list, tuple)):
+        scales = (scales,)
+    return tuple(sorted(set(float(scale) for scale in scales)))
+
+def convert_to_valid_region(region):
+    """
+    Purpose:
+        Converts a region given in robot to a tuple of ints, None is kept as None.
+    Args:
+        region - list/tuple of strings, length 4 (x, y, w, h).
+    Returns:
+        region - A tuple of ints or None.
+    """
+    if region is None:
+        return None
+    return tuple(int(float(value)) for value in region)
+
+def convert_to_valid_regions(regions):
+    """
+    Purpose:
+        Converts named regions given in robot to a dictionary of tuples of ints.
+    Args:
+        regions - dictionary of names to list/tuple of strings, length 4 (x, y, w, h).
+    Returns:
+        regions - A dictionary of names to tuples of ints, in the order of the given dictionary.
+    """
+    return {name: convert_to_valid_region(region) for name, region in regions.items()}
+
 def convert_to_valid_colour_bounds(*arg):
     """
     Purpose:
@@ -39,3 +116,46 @@ def convert_to_valid_colour_bounds(*arg):
     for i in range(0, args_num):
         colours.append((int(float(arg[i][0])), int(float(arg[i][1])), int(float(arg[i][2]))))
     return colours
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    return value
+
+def _convert_to_pipeline_step(step):
+    if isinstance(step, str):
+        tokens = step.split()
+        name = tokens[0] if tokens else ''
+        args = {}
+        for token in tokens[1:]:
+            key, separator, value = token.partition('=')
+            if not separator:
+                value = None
+            elif ',' in value:
+                value = tuple(value.split(','))
+            args[key] = value
+    elif isinstance(step, dict):
+        name = step.get('name')
+        args = {key: value for key, value in step.items() if key != 'name'}
+    else:
+        name, args = step, {}
+    if isinstance(name, str):
+        name = name.strip().lower()
+    return _freeze(name), _freeze(args)
+
+def convert_to_pipeline_definition(steps):
+    """
+    Purpose:
+        Converts the steps of a pipeline given in robot to a definition that can be validated and compiled once, and used
+        as the key of the compiled pipeline.
+    Args:
+        steps - list/tuple of steps. A step is a dictionary with the name of the step and its arguments, or a string with
+                the name of the step followed by its arguments (i.e. 'morph_opening kernel_size=3,3 iteration=2').
+    Returns:
+        definition - tuple of (name, arguments) where the arguments are a sorted tuple of (name, value).
+    """
+    if not isinstance(steps, (list, tuple)):
+        steps = [steps]
+    return tuple(_convert_to_pipeline_step(step) for step in steps)
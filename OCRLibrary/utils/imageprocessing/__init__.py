@@ -2,4 +2,4 @@
 imageprocessing module
 """
 
-__all__ = ['imagetransformation', 'image_processing_gray', 'image_processing_colour']
+__all__ = ['imagetransformation', 'colour_regions', 'image_decoding', 'image_pipeline', 'image_processing_gray', 'image_processing_colour', 'template_matching']
@@ -0,0 +1,59 @@
+"""
+Colour regions module.
+
+This module is responsible for locating the parts of an image of a given colour (i.e. a red error badge) without
+reading the image: the pixels in the range of the colour are masked with cv2.inRange and grouped into regions with
+connected components.
+"""
+import cv2
+import numpy as np
+from OCRLibrary.utils.helpers.buffer_pool import BUFFER_POOL
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imageprocessing.imagetransformation.changing_colourspaces import get_colour_mask
+
+def get_colour_regions(img, bounds, min_area=1, region=None):
+    """
+    Purpose:
+        Gets the regions of connected pixels (8-connectivity) whose colour is in the range of the bounds of one of the
+        provided colours.
+    Args:
+        img - provided read image (result of cv2.imread()).
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples in BGR (or HSV) format.
+        min_area - regions with fewer pixels are left out (optional).
+        region - (x, y, w, h) of the part of the image to search, None searches the full image (optional).
+    Returns:
+        Array with one row (x, y, w, h, area) per region, relative to the full image, in order of the top row of the regions,
+        and the array of their centroids (x, y).
+    """
+    x, y = (region[0], region[1]) if region is not None else (0, 0)
+    img = get_region_of_interest(img, region) if region is not None else img
+    if img.size == 0:
+        return np.zeros((0, 5), dtype=np.int64), np.zeros((0, 2))
+    with BUFFER_POOL.borrow(img.shape[:2]) as mask, BUFFER_POOL.borrow(img.shape[:2], np.int32) as labels:
+        get_colour_mask(img, bounds, mask)
+        _, _, stats, centroids = cv2.connectedComponentsWithStats(mask, labels, connectivity=8)
+    stats, centroids = stats[1:].astype(np.int64), centroids[1:]
+    kept = stats[:, cv2.CC_STAT_AREA] >= min_area
+    stats, centroids = stats[kept], centroids[kept] + (x, y)
+    stats[:, 0] += x
+    stats[:, 1] += y
+    return stats, centroids
+
+def return_colour_regions(img, bounds, min_area=1, region=None):
+    """
+    Purpose:
+        Locates the regions of the image in the range of the bounds of one of the provided colours.
+    Args:
+        img - provided read image (result of cv2.imread()).
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples in BGR (or HSV) format.
+        min_area - regions with fewer pixels are left out (optional).
+        region - (x, y, w, h) of the part of the image to search, None searches the full image (optional).
+    Returns:
+        List of dictionaries with the bounds (x, y, w, h), the centroid (x, y) and the area of each region, None if no
+        region is found.
+    """
+    stats, centroids = get_colour_regions(img, bounds, min_area, region)
+    if len(stats) == 0:
+        return None
+    return [{'bounds': tuple(stat[:4]), 'centroid': (int(round(centroid_x)), int(round(centroid_y))), 'area': stat[4]}
+            for stat, (centroid_x, centroid_y) in zip(stats.tolist(), centroids.tolist())]
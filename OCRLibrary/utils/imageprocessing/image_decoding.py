@@ -0,0 +1,105 @@
+"""
+Image decoding module.
+
+This module is responsible for decoding images from files. Images can be decoded directly to gray scale, or to a half,
+a quarter or an eighth of their resolution, which avoids allocating and filling a full resolution colour image that
+would be converted or resized right away.
+
+Decoded images are cached by the absolute path, the modification time and the size of the file, so reading the same
+file again only costs a stat of the file. A file that is overwritten is decoded again. Decoded images are read only,
+so an image shared through the cache cannot be modified by accident.
+"""
+import base64
+import binascii
+import os
+import cv2
+import numpy as np
+from OCRLibrary.utils.helpers.caching import LRUCache
+
+READ_MODES = {
+    'colour': cv2.IMREAD_COLOR,
+    'grayscale': cv2.IMREAD_GRAYSCALE,
+    'reduced_colour_2': cv2.IMREAD_REDUCED_COLOR_2,
+    'reduced_colour_4': cv2.IMREAD_REDUCED_COLOR_4,
+    'reduced_colour_8': cv2.IMREAD_REDUCED_COLOR_8,
+    'reduced_grayscale_2': cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    'reduced_grayscale_4': cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    'reduced_grayscale_8': cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+# Decoded images keyed by the absolute path, the modification time and the size of the file, and the read mode.
+DECODED_IMAGE_CACHE = LRUCache(max_entries=32, max_bytes=256 * 1024 * 1024)
+
+def get_read_mode(mode):
+    """
+    Purpose:
+        Returns the name of the read mode in READ_MODES, the American spelling (i.e. 'reduced_color_2') is accepted.
+    Args:
+        mode - name of the read mode, case insensitive.
+    """
+    return mode.strip().lower().replace('colour', 'color').replace('color', 'colour')
+
+def decode_image(img_path, mode='colour'):
+    """
+    Purpose:
+        Decodes an image file.
+    Args:
+        img_path - path to the image.
+        mode - one of READ_MODES (optional).
+    Returns:
+        The decoded read only image: BGR for the colour modes, single channel for the grayscale modes. None if the
+        image cannot be decoded.
+    """
+    mode = get_read_mode(mode)
+    key = None
+    if DECODED_IMAGE_CACHE.enabled:
+        try:
+            file_stat = os.stat(img_path)
+            key = (os.path.abspath(img_path), file_stat.st_mtime_ns, file_stat.st_size, mode)
+        except OSError:
+            pass
+    if key is not None:
+        img = DECODED_IMAGE_CACHE.get(key)
+        if img is not None:
+            return img
+    img = cv2.imread(img_path, READ_MODES[mode])
+    if img is None:
+        return None
+    img.setflags(write=False)
+    if key is not None:
+        DECODED_IMAGE_CACHE.put(key, img, img.nbytes)
+    return img
+
+def decode_image_bytes(data, mode='colour'):
+    """
+    Purpose:
+        Decodes an encoded image (i.e. PNG bytes of a screenshot) in memory. The bytes are wrapped without a copy.
+    Args:
+        data - bytes/bytearray/memoryview of the encoded image.
+        mode - one of READ_MODES (optional).
+    Returns:
+        The decoded image: BGR for the colour modes, single channel for the grayscale modes. None if the image cannot be decoded.
+    """
+    if not len(data):
+        return None
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), READ_MODES[get_read_mode(mode)])
+
+def decode_image_base64(data, mode='colour'):
+    """
+    Purpose:
+        Decodes a base64 encoded image, a data URI prefix (i.e. 'data:image/png;base64,') is ignored.
+    Args:
+        data - str/bytes of the base64 encoded image.
+        mode - one of READ_MODES (optional).
+    Returns:
+        The decoded image, or None if the data is not valid base64 or the image cannot be decoded.
+    """
+    if isinstance(data, str):
+        data = data.encode('ascii', 'ignore')
+    if data[:5] == b'data:':
+        data = data.partition(b',')[2]
+    try:
+        data = base64.b64decode(data)
+    except (binascii.Error, ValueError):
+        return None
+    return decode_image_bytes(data, mode)
@@ -0,0 +1,171 @@
+"""
+Image pipeline module.
+
+This module is responsible for compiling a list of image transformations into a single callable. The arguments of
+every step are converted and the kernels created once when the pipeline is compiled. When the pipeline runs, each step
+writes its result into a buffer of the buffer pool, and the buffer read by the step is given back to the pool right
+away, so a pipeline only uses two intermediate buffers (used in turn) and only the final image is allocated on every
+run. The image given to the pipeline is never modified.
+"""
+import cv2
+import numpy as np
+from robot.utils import is_truthy
+from OCRLibrary.utils.exceptions.exceptions import InvalidImageArgument
+from OCRLibrary.utils.helpers.buffer_pool import BUFFER_POOL
+from OCRLibrary.utils.helpers.caching import LRUCache
+from OCRLibrary.utils.helpers.robot_conversions \
+    import (convert_to_valid_kernel_size, convert_to_valid_int, convert_to_valid_colour_bounds)
+from OCRLibrary.utils.imageprocessing.image_processing_gray import MORPH_TRANSFORMATIONS
+from OCRLibrary.utils.imageprocessing.imagetransformation.changing_colourspaces \
+    import (convert_bgr_to_gray, convert_bgr_to_hsv, mask_single_colour)
+from OCRLibrary.utils.imageprocessing.imagetransformation.image_smoothing \
+    import (image_filtering, blurring_averaging, blurring_gaussian, median_filtering)
+from OCRLibrary.utils.imageprocessing.imagetransformation.structuring_element import get_kernel
+
+# Steps of a pipeline and their arguments with the default values, arguments without a default (None) are required.
+_MORPH_ARGUMENTS = {'kernel_size': None, 'kernel_type': 0, 'iteration': 1}
+PIPELINE_STEPS = {
+    'gray_scale': {},
+    'hsv': {},
+    'threshold': {'type': 'binary', 'inverse': False, 'otsu': False, 'threshold': 127, 'max_threshold': 255},
+    'morph_erosion': _MORPH_ARGUMENTS,
+    'morph_dilation': _MORPH_ARGUMENTS,
+    'morph_opening': _MORPH_ARGUMENTS,
+    'morph_closing': _MORPH_ARGUMENTS,
+    'morph_gradient': _MORPH_ARGUMENTS,
+    'morph_top_hat': _MORPH_ARGUMENTS,
+    'morph_black_hat': _MORPH_ARGUMENTS,
+    'blur': {'type': 'averaging', 'kernel_size': None},
+    'filter_2d': {'kernel_size': None, 'kernel_type': 0},
+    'mask': {'lower': None, 'upper': None},
+}
+
+THRESHOLD_TYPES = {'binary': (cv2.THRESH_BINARY, cv2.THRESH_BINARY_INV), 'tozero': (cv2.THRESH_TOZERO, cv2.THRESH_TOZERO_INV),
+    'trunc': (cv2.THRESH_TRUNC, None)}
+BLUR_TYPES = ('averaging', 'gaussian', 'median')
+
+
+# Compiled pipelines keyed by their definition (see convert_to_pipeline_definition).
+COMPILED_PIPELINES = LRUCache(max_entries=16)
+
+def _to_gray(src, dst):
+    if src.ndim == 2:
+        np.copyto(dst, src)
+        return dst
+    if src.shape[2] == 1:
+        np.copyto(dst, src[:, :, 0])
+        return dst
+    if src.shape[2] == 4:
+        return cv2.cvtColor(src, cv2.COLOR_BGRA2GRAY, dst=dst)
+    return convert_bgr_to_gray(src, dst)
+
+def _compile_threshold(args):
+    flag = THRESHOLD_TYPES[args['type']][1 if is_truthy(args['inverse']) else 0]
+    if is_truthy(args['otsu']):
+        flag += cv2.THRESH_OTSU
+    threshold, max_threshold = float(args['threshold']), float(args['max_threshold'])
+    def threshold_step(src, dst):
+        if src.ndim == 3:
+            src = _to_gray(src, dst)
+        return cv2.threshold(src, threshold, max_threshold, flag, dst=dst)[1]
+    return threshold_step
+
+def _compile_morphology(name, args):
+    kernel = get_kernel(convert_to_valid_int(args['kernel_type']), convert_to_valid_kernel_size(args['kernel_size']))
+    iteration = convert_to_valid_int(args['iteration'])
+    transformation = MORPH_TRANSFORMATIONS[name[len('morph_'):]]
+    return lambda src, dst: transformation(src, kernel, iteration, dst)
+
+def _compile_blur(args):
+    if args['type'] == 'median':
+        kernel_size = convert_to_valid_int(args['kernel_size'])
+        return lambda src, dst: median_filtering(src, kernel_size, dst)
+    kernel_size = convert_to_valid_kernel_size(args['kernel_size'])
+    if args['type'] == 'gaussian':
+        return lambda src, dst: blurring_gaussian(src, kernel_size, dst)
+    return lambda src, dst: blurring_averaging(src, kernel_size, dst)
+
+def _compile_filter_2d(args):
+    kernel = get_kernel(convert_to_valid_int(args['kernel_type']), convert_to_valid_kernel_size(args['kernel_size']))
+    return lambda src, dst: image_filtering(src, -1, kernel, dst)
+
+def _compile_mask(args):
+    lower, upper = convert_to_valid_colour_bounds(args['lower'], args['upper'])
+    return lambda src, dst: mask_single_colour(src, lower, upper, dst)
+
+def _compile_step(name, args):
+    """
+    Returns the function of a step, called with the input image and the buffer to write the result to.
+    """
+    args = dict(PIPELINE_STEPS[name], **args)
+    if name == 'gray_scale':
+        return _to_gray
+    if name == 'hsv':
+        return lambda src, dst: convert_bgr_to_hsv(src, dst)
+    if name == 'threshold':
+        return _compile_threshold(args)
+    if name.startswith('morph_'):
+        return _compile_morphology(name, args)
+    if name == 'blur':
+        return _compile_blur(args)
+    if name == 'filter_2d':
+        return _compile_filter_2d(args)
+    return _compile_mask(args)
+
+class ImagePipeline:
+    """
+    ImagePipeline Class
+
+    Callable applying the compiled steps of a pipeline to an image. The intermediate images are written to buffers of
+    the buffer pool, so a pipeline can be called from several threads at once.
+    """
+    def __init__(self, definition):
+        self.definition = definition
+        self._steps = [(name, _compile_step(name, dict(args))) for name, args in definition]
+
+    def _output_shapes(self, img):
+        shapes = []
+        shape = img.shape
+        for name, _ in self._steps:
+            if name in ('hsv', 'mask') and (len(shape) != 3 or shape[2] != 3):
+                raise InvalidImageArgument(f"The pipeline step: {name} requires a colour image, the image given to the step is of shape {shape}.")
+            if name in ('gray_scale', 'threshold'):
+                shape = shape[:2]
+            shapes.append(shape)
+        return shapes
+
+    def __call__(self, img):
+        """
+        Applies the steps to the image and returns the new image.
+        """
+        shapes = self._output_shapes(img)
+        last = len(self._steps) - 1
+        result, previous = img, None
+        for i, ((_, step), shape) in enumerate(zip(self._steps, shapes)):
+            dst = np.empty(shape, img.dtype) if i == last else BUFFER_POOL.acquire(shape, img.dtype)
+            result = step(result, dst)
+            BUFFER_POOL.release(previous)
+            previous = dst if i < last else None
+        return result
+
+def get_compiled_pipeline(definition):
+    """
+    Purpose:
+        Returns the pipeline already compiled for the definition, or None.
+    Args:
+        definition - the steps of the pipeline returned by convert_to_pipeline_definition.
+    """
+    return COMPILED_PIPELINES.get(definition)
+
+def compile_pipeline(definition):
+    """
+    Purpose:
+        Compiles the steps of a pipeline and caches the compiled pipeline by its definition.
+    Args:
+        definition - the steps of the pipeline returned by convert_to_pipeline_definition, validated with verify_valid_pipeline.
+    Returns:
+        ImagePipeline, called with an image it returns the transformed image.
+    """
+    pipeline = ImagePipeline(definition)
+    COMPILED_PIPELINES.put(definition, pipeline, 0)
+    return pipeline
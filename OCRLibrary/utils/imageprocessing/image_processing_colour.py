@@ -2,7 +2,8 @@
 Image processing colour module.
 """
 from OCRLibrary.utils.imageprocessing.imagetransformation.changing_colourspaces \
-    import (convert_bgr_to_gray, convert_bgr_to_hsv, mask_single_colour, mask_double_colour)
+    import (convert_bgr_to_gray, convert_bgr_to_hsv, mask_single_colour, mask_double_colour,
+    mask_colour_ranges)
 
 def process_to_gray_scale(img):
     """
@@ -15,18 +16,19 @@ def process_to_gray_scale(img):
     """
     return convert_bgr_to_gray(img)
 
-def process_colour_image_to_hsv(img):
+def process_colour_image_to_hsv(img, dst=None):
     """
     Purpose:
         Converts image from BGR to HSV.
     Args:
         img - provided read image (result of cv2.imread()).
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         Image in HSV.
     """
-    return convert_bgr_to_hsv(img)
+    return convert_bgr_to_hsv(img, dst)
 
-def mask_colour_bgr_or_hsv(processed_image, lower_bound_colour, upper_bound_colour):
+def mask_colour_bgr_or_hsv(processed_image, lower_bound_colour, upper_bound_colour, dst=None):
     """
     Purpose:
         Maskes any colour that is not in the range of the bounds of the provided colour.
@@ -34,12 +36,13 @@ def mask_colour_bgr_or_hsv(processed_image, lower_bound_colour, upper_bound_colo
         processed_img - provided read image (result of cv2.imread()).
         lower_bound_colour - the lower bound of the colour to not mask in BGR format.
         upper_bound_colour - the upper bound of the colour to not mask in BGR format.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         result - image with colours masked.
     """
-    return mask_single_colour(processed_image, lower_bound_colour, upper_bound_colour)
+    return mask_single_colour(processed_image, lower_bound_colour, upper_bound_colour, dst)
 
-def mask_colours_bgr_or_hsv(processed_image, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2):
+def mask_colours_bgr_or_hsv(processed_image, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2, dst=None):
     """
     Purpose:
         Maskes any colour that is not in the range of the bounds of the two provided colours.
@@ -49,7 +52,21 @@ def mask_colours_bgr_or_hsv(processed_image, lower_bound_colour1, upper_bound_co
         upper_bound_colour1 - the upper bound of the first colour to not mask in BGR format.
         lower_bound_colour2 - the lower bound of the second colour to not mask in BGR format.
         upper_bound_colour2 - the upper bound of the second colour to not mask in BGR format.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         result - image with colours masked.
     """
-    return mask_double_colour(processed_image, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2)
+    return mask_double_colour(processed_image, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2, dst)
+
+def mask_colour_ranges_bgr_or_hsv(processed_image, bounds, dst=None):
+    """
+    Purpose:
+        Maskes any colour that is not in the range of the bounds of one of the provided colours.
+    Args:
+        processed_img - provided read image (result of cv2.imread()).
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples in BGR or HSV format.
+        dst - image the result is written to, may be the image itself (optional).
+    Returns:
+        result - image with colours masked.
+    """
+    return mask_colour_ranges(processed_image, bounds, dst)
@@ -1,85 +1,92 @@
 """
 High level functions to apply image processing to any photo (i.e. colour or gray/binary).
 """
+import numpy as np
+from robot.utils import is_truthy
 from OCRLibrary.utils.imageprocessing.imagetransformation.structuring_element \
-    import get_rect_kernel, get_ellipse_kernel, get_cross_kernel
+    import get_kernel
 from OCRLibrary.utils.imageprocessing.imagetransformation.image_smoothing \
     import image_filtering, blurring_averaging, blurring_gaussian, median_filtering
 
-def process_image_filtering_with_rect_kernel(img, kernel_size, depth):
+def process_image_filtering(img, kernel_type, kernel_size, depth, dst=None):
     """
     Purpose:
-        Apply 2D image filter with a rectange kernel to an image.
+        Apply 2D image filter with a kernel of the specified type and size to an image.
     Args:
         img - the processed image.
+        kernel_type - shape of the kernel: 0 for a rectangle, 1 for an ellipse and 2 for a cross.
         kernel_size - size of the kernel.
         depth - desired depth of the destination image.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    kernel = get_rect_kernel(kernel_size)
-    return image_filtering(img, depth, kernel)
+    kernel = get_kernel(int(kernel_type), kernel_size)
+    return image_filtering(img, depth, kernel, dst)
 
-def process_image_filtering_with_ellipse_kernel(img, kernel_size, depth):
+def process_median_filtering(img, kernel_size, dst=None):
     """
     Purpose:
-        Apply 2D image filter with an ellipse kernel to an image.
+        Apply median image filter to an image.
     Args:
         img - the processed image.
         kernel_size - size of the kernel.
-        depth - desired depth of the destination image.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    kernel = get_ellipse_kernel(kernel_size)
-    return image_filtering(img, depth, kernel)
+    return median_filtering(img, kernel_size, dst)
 
-def process_image_filtering_with_cross_kernel(img, kernel_size, depth):
+def process_blurring_averaging(img, kernel_size, dst=None):
     """
     Purpose:
-        Apply 2D image filter with a cross kernel to an image.
+        Apply blurring averaging filter to an image.
     Args:
         img - the processed image.
         kernel_size - size of the kernel.
-        depth - desired depth of the destination image.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    kernel = get_cross_kernel(kernel_size)
-    return image_filtering(img, depth, kernel)
+    return blurring_averaging(img, kernel_size, dst)
 
-def process_median_filtering(img, kernel_size):
+def process_blurring_gaussian(img, kernel_size, dst=None):
     """
     Purpose:
-        Apply median image filter to an image.
+        Apply blurring gaussian filter to an image.
     Args:
         img - the processed image.
         kernel_size - size of the kernel.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    return median_filtering(img, kernel_size)
+    return blurring_gaussian(img, kernel_size, dst)
 
-def process_blurring_averaging(img, kernel_size):
+def get_destination(img, in_place=False):
     """
     Purpose:
-        Apply blurring averaging filter to an image.
+        Returns the image the result of a transformation is written to when the transformation is applied in place.
     Args:
         img - the processed image.
-        kernel_size - size of the kernel.
+        in_place - true to write the result to the image itself (optional).
     Returns:
-        The filtered image.
+        The image itself if in_place is true and the image can be modified, otherwise None (a new image is allocated).
+        Read only images (i.e. returned by Read Image) are never modified.
     """
-    return blurring_averaging(img, kernel_size)
+    if is_truthy(in_place) and isinstance(img, np.ndarray) and img.flags.writeable:
+        return img
+    return None
 
-def process_blurring_gaussian(img, kernel_size):
+def get_region_of_interest(img, region):
     """
     Purpose:
-        Apply blurring gaussian filter to an image.
+        Gets the region of interest of an image without copying the image (numpy view).
     Args:
         img - the processed image.
-        kernel_size - size of the kernel.
+        region - (x, y, w, h) of the region. Parts of the region outside of the image are ignored.
     Returns:
-        The filtered image.
+        View of the image limited to the region.
     """
-    return blurring_gaussian(img, kernel_size)
+    x, y, w, h = region
+    return img[y:y + h, x:x + w]
@@ -2,6 +2,7 @@
 High level implementations of functions within image transformation/
 """
 import cv2
+from OCRLibrary.utils.imageprocessing.image_decoding import decode_image
 from OCRLibrary.utils.imageprocessing.imagetransformation.changing_colourspaces import convert_bgr_to_gray
 from OCRLibrary.utils.imageprocessing.imagetransformation.image_thresholding \
     import (threshold_binary, threshold_binary_inv, threshold_trunc, threshold_tozero, threshold_tozero_inv,
@@ -9,419 +10,188 @@ from OCRLibrary.utils.imageprocessing.imagetransformation.image_thresholding \
 from OCRLibrary.utils.imageprocessing.imagetransformation.morphological_transformations \
     import (morph_erosion, morph_dilation, morph_opening, morph_closing, morph_gradient,
     morph_top_hat, morph_black_hat)
-from OCRLibrary.utils.imageprocessing.imagetransformation.structuring_element \
-    import (get_rect_kernel, get_ellipse_kernel, get_cross_kernel)
+from OCRLibrary.utils.imageprocessing.imagetransformation.structuring_element import get_kernel
 
 ### Image thresholding
 
-def process_to_binary_image(img_path, inverse=False, threshold=127, max_threshold=255):
+def read_gray_image(img):
+    """
+    Purpose:
+        Returns the image in gray scale, the image is read first if a path is given.
+    Args:
+        img - path to the image, or the image (numpy.ndarray) already read or processed.
+    Returns:
+        Gray scale image. Images that are already in gray scale are returned as is.
+    """
+    if isinstance(img, str):
+        # Decoded in colour and converted, as decoding JPEG images directly to gray scale gives other gray values.
+        img = decode_image(img)
+    if img.ndim == 2:
+        return img
+    if img.shape[2] == 1:
+        return img[:, :, 0]
+    if img.shape[2] == 4:
+        return cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
+    return convert_bgr_to_gray(img)
+
+def _get_threshold_destination(img, gray_img, dst):
+    """
+    Returns the image the threshold is written to: the given gray scale image, otherwise the gray scale image converted
+    from a colour image which is only used by the threshold, so it is thresholded in place instead of allocating another image.
+    """
+    if dst is not None and dst.shape == gray_img.shape and dst.dtype == gray_img.dtype:
+        return dst
+    if gray_img is not img and gray_img.base is None and gray_img.flags.writeable:
+        return gray_img
+    return None
+
+def process_to_binary_image(img, inverse=False, threshold=127, max_threshold=255, dst=None):
     """
     Purpose:
          Process an image to binary colours.
     Args:
-        img_path - path to the image to process
+        img - path to the image to process, or the image (numpy.ndarray) already read or processed.
         inverse - if true an inverted binary thresholding will be applied (optional).
         threshold - threshold value used to classify the pixel values (optional).
         max_threshold - the max value to be given if a pixels value is more than the threshold value (optional).
+        dst - gray scale image the result is written to, may be the image itself (optional).
     Returns:
         A binary image.
     """
-    img = cv2.imread(img_path)
-    gray_img = convert_bgr_to_gray(img)
+    gray_img = read_gray_image(img)
+    dst = _get_threshold_destination(img, gray_img, dst)
     if inverse:
-        binary_image = threshold_binary_inv(gray_img, threshold, max_threshold)
+        binary_image = threshold_binary_inv(gray_img, threshold, max_threshold, dst)
     else:
-        binary_image = threshold_binary(gray_img, threshold, max_threshold)
+        binary_image = threshold_binary(gray_img, threshold, max_threshold, dst)
     return binary_image
 
-def process_to_binary_otsu_image(img_path, inverse=False, max_threshold=255):
+def process_to_binary_otsu_image(img, inverse=False, max_threshold=255, dst=None):
     """
     Purpose:
         Process an image to binary colours using binary otsu thresholding.
     Args:
-        img_path - path to the image to process
+        img - path to the image to process, or the image (numpy.ndarray) already read or processed.
         inverse - if true an inverted binary thresholding will be applied (optional).
         max_threshold - the max value to be given if a pixels value is more than the threshold value (optional).
+        dst - gray scale image the result is written to, may be the image itself (optional).
     Returns:
         binary_image_tuple[0] - optimal threshold value found by otsu threshold.
         binary_image_tuple[1] - binary image.
     """
-    img = cv2.imread(img_path)
-    gray_img = convert_bgr_to_gray(img)
+    gray_img = read_gray_image(img)
+    dst = _get_threshold_destination(img, gray_img, dst)
     if inverse:
-        binary_image_tuple = threshold_binary_inv_otsu(gray_img, max_threshold)
+        binary_image_tuple = threshold_binary_inv_otsu(gray_img, max_threshold, dst)
     else:
-        binary_image_tuple = threshold_binary_otsu(gray_img, max_threshold)
+        binary_image_tuple = threshold_binary_otsu(gray_img, max_threshold, dst)
     return binary_image_tuple
 
-def process_to_tozero_image(img_path, inverse=False, threshold=177, max_threshold=255):
+def process_to_tozero_image(img, inverse=False, threshold=177, max_threshold=255, dst=None):
     """
     Purpose:
         Process an image tozero. All values considered black (if no inverse) will be set to black, the rest of
         the image will remain in gray scale. If inverse is true, the values considered to be white will be set to black,
         the rest of the image will remain in gray scale.
     Args:
-        img_path - path to the image to process
+        img - path to the image to process, or the image (numpy.ndarray) already read or processed.
         inverse - if true an inverted binary thresholding will be applied (optional).
         threshold - threshold value used to classify the pixel values (optional).
         max_threshold - the max value to be given if a pixels value is more than the threshold value (optional).
+        dst - gray scale image the result is written to, may be the image itself (optional).
     Returns:
         Tozero grayscale/binary image.
     """
-    img = cv2.imread(img_path)
-    gray_img = convert_bgr_to_gray(img)
+    gray_img = read_gray_image(img)
+    dst = _get_threshold_destination(img, gray_img, dst)
     if inverse:
-        tozero_image = threshold_tozero_inv(gray_img, threshold, max_threshold)
+        tozero_image = threshold_tozero_inv(gray_img, threshold, max_threshold, dst)
     else:
-        tozero_image = threshold_tozero(gray_img, threshold, max_threshold)
+        tozero_image = threshold_tozero(gray_img, threshold, max_threshold, dst)
     return tozero_image
 
-def process_to_tozero_otsu_image(img_path, inverse=False, max_threshold=255):
+def process_to_tozero_otsu_image(img, inverse=False, max_threshold=255, dst=None):
     """
     Purpose:
         Process an image tozero colours using tozero otsu thresholding.
     Args:
-        img_path - path to the image to process
+        img - path to the image to process, or the image (numpy.ndarray) already read or processed.
         inverse - if true an inverted tozero thresholding will be applied (optional).
         max_threshold - the max value to be given if a pixels value is more than the threshold value (optional).
+        dst - gray scale image the result is written to, may be the image itself (optional).
     Returns:
         tozero_image_tuple[0] - optimal threshold value found by otsu threshold.
         tozero_image_tuple[1] - tozero binary/grayscale image.
     """
-    img = cv2.imread(img_path)
-    gray_img = convert_bgr_to_gray(img)
+    gray_img = read_gray_image(img)
+    dst = _get_threshold_destination(img, gray_img, dst)
     if inverse:
-        tozero_image_tuple = threshold_tozero_inv_otsu(gray_img, max_threshold)
+        tozero_image_tuple = threshold_tozero_inv_otsu(gray_img, max_threshold, dst)
     else:
-        tozero_image_tuple = threshold_tozero_otsu(gray_img, max_threshold)
+        tozero_image_tuple = threshold_tozero_otsu(gray_img, max_threshold, dst)
     return tozero_image_tuple
 
-def process_to_trunc_image(img_path, threshold=177, max_threshold=255):
+def process_to_trunc_image(img, threshold=177, max_threshold=255, dst=None):
     """
     Purpose:
         Process an image to gray scale and apply truncation threshold (values considered to be white will be set to white, the
         rest of the image will remain gray scale).
     Args:
-        img_path - path to the image to process
+        img - path to the image to process, or the image (numpy.ndarray) already read or processed.
         threshold - threshold value used to classify the pixel values (optional).
         max_threshold - the max value to be given if a pixels value is more than the threshold value (optional).
+        dst - gray scale image the result is written to, may be the image itself (optional).
     Returns:
         Truncated binary/grayscale image.
     """
-    img = cv2.imread(img_path)
-    gray_img = convert_bgr_to_gray(img)
-    trunc_image = threshold_trunc(gray_img, threshold, max_threshold)
+    gray_img = read_gray_image(img)
+    dst = _get_threshold_destination(img, gray_img, dst)
+    trunc_image = threshold_trunc(gray_img, threshold, max_threshold, dst)
     return trunc_image
 
-def process_to_trunc_otsu_image(img_path, max_threshold=255):
+def process_to_trunc_otsu_image(img, max_threshold=255, dst=None):
     """
     Purpose:
         Process an image to gray scale and apply truncation and otsu threshold (values considered to be white will be set to white, the
         rest of the image will remain gray scale).
     Args:
-        img_path - path to the image to process
+        img - path to the image to process, or the image (numpy.ndarray) already read or processed.
         max_threshold - the max value to be given if a pixels value is more than the threshold value (optional).
+        dst - gray scale image the result is written to, may be the image itself (optional).
     Returns:
         thrunc_image_tuple[0] - optimal threshold value found by otsu threshold.
         thrunc_image_tuple[1] - trunc binary/grayscale image.
     """
-    img = cv2.imread(img_path)
-    gray_img = convert_bgr_to_gray(img)
-    trunc_image_tuple = threshold_trunc_otsu(gray_img, max_threshold)
+    gray_img = read_gray_image(img)
+    dst = _get_threshold_destination(img, gray_img, dst)
+    trunc_image_tuple = threshold_trunc_otsu(gray_img, max_threshold, dst)
     return trunc_image_tuple
 
 ### Morphological transformations
 
-def process_erosion_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies erosion morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_erosion(img, kernel, iteration)
-
-def process_erosion_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies erosion morph with a ellispe shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_erosion(img, kernel, iteration)
-
-def process_erosion_with_cross_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies erosion morph with a cross shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_erosion(img, kernel, iteration)
-
-def process_dilation_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies dilation morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_dilation(img, kernel, iteration)
-
-def process_dilation_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies dilation morph with ellisple shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_dilation(img, kernel, iteration)
-
-def process_dilation_with_cross_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies dilation morph with cross shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_dilation(img, kernel, iteration)
-
-def process_opening_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies opening morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_opening(img, kernel, iteration)
-
-def process_opening_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies opening morph with ellisple shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_opening(img, kernel, iteration)
-
-def process_opening_with_cross_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies opening morph with cross shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_opening(img, kernel, iteration)
-
-def process_closing_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies closing morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_closing(img, kernel, iteration)
-
-def process_closing_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies closing morph with ellisple shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_closing(img, kernel, iteration)
-
-def process_closing_with_cross_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies closing morph with cross shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_closing(img, kernel, iteration)
-
-def process_gradient_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies gradient morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_gradient(img, kernel, iteration)
-
-def process_gradient_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies gradient morph with ellisple shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_gradient(img, kernel, iteration)
-
-def process_gradient_with_cross_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies gradient morph with cross shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_gradient(img, kernel, iteration)
-
-def process_tophat_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies tophat morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_top_hat(img, kernel, iteration)
-
-def process_tophat_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies tophat morph with ellisple shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_top_hat(img, kernel, iteration)
-
-def process_tophat_with_cross_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies tophat morph with cross shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_top_hat(img, kernel, iteration)
-
-def process_blackhat_with_rect_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies blackhat morph with a rectangle shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_rect_kernel(kernel_size)
-    return morph_black_hat(img, kernel, iteration)
-
-def process_blackhat_with_ellipse_kernel(img, kernel_size, iteration=1):
-    """
-    Purpose:
-        Applies blackhat morph with ellisple shaped kernel of the specified size, to the image.
-    Args:
-        img - binary image.
-        kernel_size - the size of the kernel to use in morphological transformation.
-        iteration - Number of times the morph is performed (defaults to 1)
-    Returns:
-        Image with applied morphological transformation.
-    """
-    kernel = get_ellipse_kernel(kernel_size)
-    return morph_black_hat(img, kernel, iteration)
+MORPH_TRANSFORMATIONS = {
+    'erosion': morph_erosion,
+    'dilation': morph_dilation,
+    'opening': morph_opening,
+    'closing': morph_closing,
+    'gradient': morph_gradient,
+    'top_hat': morph_top_hat,
+    'black_hat': morph_black_hat,
+}
 
-def process_blackhat_with_cross_kernel(img, kernel_size, iteration=1):
+def process_morphology(img, transformation, kernel_type, kernel_size, iteration=1, dst=None):
     """
     Purpose:
-        Applies blackhat morph with cross shaped kernel of the specified size, to the image.
+        Applies a morphological transformation with a kernel of the specified type and size, to the image.
     Args:
         img - binary image.
+        transformation - name of the transformation (see MORPH_TRANSFORMATIONS).
+        kernel_type - shape of the kernel: 0 for a rectangle, 1 for an ellipse and 2 for a cross.
         kernel_size - the size of the kernel to use in morphological transformation.
         iteration - Number of times the morph is performed (defaults to 1)
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         Image with applied morphological transformation.
     """
-    kernel = get_cross_kernel(kernel_size)
-    return morph_black_hat(img, kernel, iteration)
+    kernel = get_kernel(int(kernel_type), kernel_size)
+    return MORPH_TRANSFORMATIONS[transformation](img, kernel, iteration, dst)
@@ -1,32 +1,55 @@
 """
 Changing colourspaces module.
 """
+from functools import lru_cache
 import cv2
 import numpy as np
+from OCRLibrary.utils.helpers.buffer_pool import BUFFER_POOL
 
-def convert_bgr_to_gray(img):
+def convert_bgr_to_gray(img, dst=None):
     """
     Purpose:
         Converts image from BGR to gray scale.
     Args:
         img - provided read image (result of cv2.imread()).
+        dst - image the result is written to (optional).
     Returns:
         Image in gray scale.
     """
-    return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=dst)
 
-def convert_bgr_to_hsv(img):
+def convert_bgr_to_hsv(img, dst=None):
     """
     Purpose:
         Converts image from BGR to HSV.
     Args:
         img - provided read image (result of cv2.imread()).
+        dst - image the result is written to (optional).
     Returns:
         Image in HSV.
     """
-    return cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+    return cv2.cvtColor(img, cv2.COLOR_BGR2HSV, dst=dst)
 
-def mask_single_colour(img, lower_bound_colour, upper_bound_colour):
+def apply_mask(img, mask, dst=None):
+    """
+    Purpose:
+        Keeps the pixels of the image where the mask is set, the other pixels become black.
+    Args:
+        img - provided read image (result of cv2.imread()).
+        mask - single channel image of the same size, the mask is modified when the result is written to the image itself.
+        dst - image the result is written to, may be the image itself (optional).
+    Returns:
+        result - image with colours masked.
+    """
+    if dst is None or dst.shape != img.shape or dst.dtype != img.dtype:
+        return cv2.bitwise_and(img, img, mask=mask)
+    if dst is img:
+        cv2.bitwise_not(mask, dst=mask)
+        return cv2.bitwise_and(img, (0, 0, 0, 0), dst=img, mask=mask)
+    dst.fill(0)
+    return cv2.bitwise_and(img, img, dst=dst, mask=mask)
+
+def mask_single_colour(img, lower_bound_colour, upper_bound_colour, dst=None):
     """
     Purpose:
         Maskes any colour that is not in the range of the bounds of the provided colour.
@@ -34,16 +57,15 @@ def mask_single_colour(img, lower_bound_colour, upper_bound_colour):
         img - provided read image (result of cv2.imread()).
         lower_bound_colour - the lower bound of the colour to not mask in BGR format.
         upper_bound_colour - the upper bound of the colour to not mask in BGR format.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         result - image with colours masked.
     """
-    lower_bound_colour = np.array(lower_bound_colour)
-    upper_bound_colour = np.array(upper_bound_colour)
-    mask = cv2.inRange(img, lower_bound_colour, upper_bound_colour)
-    result = cv2.bitwise_and(img, img, mask=mask)
-    return result
+    with BUFFER_POOL.borrow(img.shape[:2]) as mask:
+        get_colour_mask(img, ((lower_bound_colour, upper_bound_colour),), mask)
+        return apply_mask(img, mask, dst)
 
-def mask_double_colour(img, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2):
+def mask_double_colour(img, lower_bound_colour1, upper_bound_colour1, lower_bound_colour2, upper_bound_colour2, dst=None):
     """
     Purpose:
         Maskes any colour that is not in the range of the bounds of the two provided colours.
@@ -53,6 +75,7 @@ def mask_double_colour(img, lower_bound_colour1, upper_bound_colour1, lower_boun
         upper_bound_colour1 - the upper bound of the first colour to not mask in BGR format.
         lower_bound_colour2 - the lower bound of the second colour to not mask in BGR format.
         upper_bound_colour2 - the upper bound of the second colour to not mask in BGR format.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         result - image with colours masked.
     """
@@ -60,9 +83,92 @@ def mask_double_colour(img, lower_bound_colour1, upper_bound_colour1, lower_boun
     upper_bound_colour1 = np.array(upper_bound_colour1)
     lower_bound_colour2 = np.array(lower_bound_colour2)
     upper_bound_colour2 = np.array(upper_bound_colour2)
-    mask1 = cv2.inRange(img, lower_bound_colour1, upper_bound_colour1)
-    mask2 = cv2.inRange(img, lower_bound_colour2, upper_bound_colour2)
-    mask = cv2.bitwise_or(mask1, mask2)
-    result = cv2.bitwise_and(img, img, mask=mask)
-    return result
-    
\ No newline at end of file
+    with BUFFER_POOL.borrow(img.shape[:2]) as mask1, BUFFER_POOL.borrow(img.shape[:2]) as mask2:
+        cv2.inRange(img, lower_bound_colour1, upper_bound_colour1, dst=mask1)
+        cv2.inRange(img, lower_bound_colour2, upper_bound_colour2, dst=mask2)
+        cv2.bitwise_or(mask1, mask2, dst=mask1)
+        return apply_mask(img, mask1, dst)
+
+# Number of ranges from which mask_colour_ranges uses lookup tables instead of one cv2.inRange per range.
+LUT_MIN_RANGES = 6
+# Number of ranges sharing one lookup table, one bit per range in the int32 entries.
+_RANGES_PER_LUT = 32
+
+@lru_cache(maxsize=64)
+def get_colour_range_luts(bounds):
+    """
+    Purpose:
+        Compiles colour ranges into lookup tables, one table per channel and per group of 32 ranges. The entry of a
+        channel value has the bit of a range set when the value is inside the bounds of the range for that channel, so a
+        pixel is inside a range when the bit of the range is set in the entries of its three channels.
+    Args:
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples.
+    Returns:
+        List of (blue_lut, green_lut, red_lut), one per group of ranges. The tables are read only.
+    """
+    values = np.arange(256)
+    groups = []
+    for start in range(0, len(bounds), _RANGES_PER_LUT):
+        luts = np.zeros((3, 256), dtype=np.uint32)
+        for bit, (lower, upper) in enumerate(bounds[start:start + _RANGES_PER_LUT]):
+            for channel in range(3):
+                luts[channel] |= ((values >= lower[channel]) & (values <= upper[channel])).astype(np.uint32) << bit
+        luts = luts.view(np.int32)
+        luts.setflags(write=False)
+        groups.append(tuple(luts))
+    return groups
+
+def get_colour_mask(img, bounds, mask):
+    """
+    Purpose:
+        Gets the mask of the pixels in the range of the bounds of one of the provided colours. With a few ranges each
+        range is masked with cv2.inRange, with more ranges the ranges are compiled into lookup tables (see
+        get_colour_range_luts) and every group of 32 ranges is masked in a single pass over the image.
+    Args:
+        img - provided read image (result of cv2.imread()), with 3 (or 4, the alpha channel is ignored) channels.
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples in BGR (or HSV) format.
+        mask - single channel image of the same size the mask is written to.
+    Returns:
+        mask - 255 where the colour of the pixel is in one of the ranges, 0 elsewhere.
+    """
+    shape = img.shape[:2]
+    with BUFFER_POOL.borrow(shape) as range_mask:
+        if len(bounds) < LUT_MIN_RANGES:
+            # The alpha channel of a BGRA image is not part of the colour, any alpha is in the range.
+            alpha = ((0,), (255,)) if img.shape[2] == 4 else ((), ())
+            for index, (lower, upper) in enumerate(bounds):
+                cv2.inRange(img, np.array(tuple(lower) + alpha[0]), np.array(tuple(upper) + alpha[1]),
+                    dst=mask if index == 0 else range_mask)
+                if index > 0:
+                    cv2.bitwise_or(mask, range_mask, dst=mask)
+            return mask
+        mask.fill(0)
+        channels = cv2.split(img)
+        bits = [BUFFER_POOL.acquire(shape, np.int32) for _ in range(2)]
+        try:
+            for blue_lut, green_lut, red_lut in get_colour_range_luts(bounds):
+                cv2.LUT(channels[0], blue_lut, dst=bits[0])
+                cv2.LUT(channels[1], green_lut, dst=bits[1])
+                cv2.bitwise_and(bits[0], bits[1], dst=bits[0])
+                cv2.LUT(channels[2], red_lut, dst=bits[1])
+                cv2.bitwise_and(bits[0], bits[1], dst=bits[0])
+                cv2.compare(bits[0], 0, cv2.CMP_NE, dst=range_mask)
+                cv2.bitwise_or(mask, range_mask, dst=mask)
+        finally:
+            BUFFER_POOL.release(*bits)
+        return mask
+
+def mask_colour_ranges(img, bounds, dst=None):
+    """
+    Purpose:
+        Maskes any colour that is not in the range of the bounds of one of the provided colours (see get_colour_mask).
+    Args:
+        img - provided read image (result of cv2.imread()).
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples in BGR (or HSV) format.
+        dst - image the result is written to, may be the image itself (optional).
+    Returns:
+        result - image with colours masked.
+    """
+    with BUFFER_POOL.borrow(img.shape[:2]) as mask:
+        get_colour_mask(img, bounds, mask)
+        return apply_mask(img, mask, dst)
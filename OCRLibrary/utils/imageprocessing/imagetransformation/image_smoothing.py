@@ -3,7 +3,7 @@ Image blurring module.
 """
 import cv2
 
-def image_filtering(img, depth, kernel):
+def image_filtering(img, depth, kernel, dst=None):
     """
     Purpose:
         Removes noise if filtered with a low-pass filter. Finds edges if filtered with a high-pass filter.
@@ -11,12 +11,13 @@ def image_filtering(img, depth, kernel):
         img - provided read image (result of cv2.imread()).
         depth - desired depth of the destination image.
         kernel - correlation kernel.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    return cv2.filter2D(img, depth, kernel)
+    return cv2.filter2D(img, depth, kernel, dst=dst)
 
-def blurring_averaging(img, kernel):
+def blurring_averaging(img, kernel, dst=None):
     """
     Purpose:
         Apply average filtering to image. Takes average of pixels under kernel and 
@@ -24,12 +25,13 @@ def blurring_averaging(img, kernel):
     Args:
         img - provided read image (result of cv2.imread()).
         kernel - correlation kernel.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    return cv2.blur(img, kernel)
+    return cv2.blur(img, kernel, dst=dst)
 
-def blurring_gaussian(img, kernel):
+def blurring_gaussian(img, kernel, dst=None):
     """
     Purpose:
         Apply gaussian blurring to image.
@@ -37,19 +39,21 @@ def blurring_gaussian(img, kernel):
     Args:
         img - provided read image (result of cv2.imread()).
         kernel - correlation kernel.
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    return cv2.GaussianBlur(img, kernel, 0)
+    return cv2.GaussianBlur(img, kernel, 0, dst=dst)
 
-def median_filtering(img, kernel_size):
+def median_filtering(img, kernel_size, dst=None):
     """
     Purpose:
         Apply a filter based off the median of all the pizels under the kernel window.
     Args:
         img - the image to apply the filter to.
         kernel_size - the size of the kernel
+        dst - image the result is written to, may be the image itself (optional).
     Returns:
         The filtered image.
     """
-    return cv2.medianBlur(img, kernel_size)
+    return cv2.medianBlur(img, kernel_size, dst=dst)
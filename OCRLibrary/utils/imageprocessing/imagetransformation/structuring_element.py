@@ -1,8 +1,31 @@
 """
 Structuring element module.
+
+Kernels are created once per kernel type and size and shared by every transformation, they are read only so a shared
+kernel cannot be modified by accident.
 """
+from functools import lru_cache
 import cv2
 
+# Shapes of the structuring elements indexed by the kernel type: 0 rectangle, 1 ellipse and 2 cross.
+KERNEL_SHAPES = (cv2.MORPH_RECT, cv2.MORPH_ELLIPSE, cv2.MORPH_CROSS)
+KERNEL_TYPES = tuple(range(len(KERNEL_SHAPES)))
+
+@lru_cache(maxsize=256)
+def get_kernel(kernel_type, kernel_size):
+    """
+    Purpose:
+        Gets the kernel of the kernel type and size, the kernel is only created the first time it is requested.
+    Args:
+        kernel_type - int: 0 for a rectangle, 1 for an ellipse and 2 for a cross (see KERNEL_SHAPES).
+        kernel_size - tuple: size of the kernel.
+    Returns:
+        Read only 2D array representing the kernel.
+    """
+    kernel = cv2.getStructuringElement(KERNEL_SHAPES[kernel_type], tuple(kernel_size))
+    kernel.setflags(write=False)
+    return kernel
+
 def get_rect_kernel(kernel_size):
     """
     Purpose:
@@ -10,9 +33,9 @@ def get_rect_kernel(kernel_size):
     Args:
         kernel_size - tuple: size of the kernel.
     Returns:
-        2D array representing a rectangular kernel.
+        Read only 2D array representing a rectangular kernel.
     """
-    return cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
+    return get_kernel(0, tuple(kernel_size))
 
 def get_ellipse_kernel(kernel_size):
     """
@@ -21,17 +44,17 @@ def get_ellipse_kernel(kernel_size):
     Args:
         kernel_size - tuple: size of the kernel.
     Returns:
-        2D array representing an ellipse kernel.
+        Read only 2D array representing an ellipse kernel.
     """
-    return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, kernel_size)
+    return get_kernel(1, tuple(kernel_size))
 
 def get_cross_kernel(kernel_size):
     """
     Purpose:
-        Gets a rectangular shaped kernel
+        Gets a cross shaped kernel
     Args:
         kernel_size - tuple: size of the kernel.
     Returns:
-        2D array representing a rectangular kernel.
+        Read only 2D array representing a cross kernel.
     """
-    return cv2.getStructuringElement(cv2.MORPH_CROSS, kernel_size)
+    return get_kernel(2, tuple(kernel_size))
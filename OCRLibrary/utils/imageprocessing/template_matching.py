@@ -0,0 +1,172 @@
+"""
+Template matching module.
+
+This module is responsible for locating a template image (i.e. an icon or a button) in an image without reading the
+image. Matching a template over a full screenshot is slow, so the image and the template are searched coarse to fine:
+    - both are reduced in gray scale pyramids (cv2.pyrDown), until the template is about MIN_TEMPLATE_SIZE pixels.
+    - the template is matched over the full image at the coarsest level only, the peaks scoring more than the threshold
+      minus COARSE_MARGIN are kept as candidates.
+    - each candidate is refined at the next finer levels, by matching the template in a small window around its position.
+The template is matched at each of the given scales (i.e. 2 for a template captured at 100% and a HiDPI screenshot), the
+matches overlapping a better match are suppressed. The pyramids of the templates are cached by the template content.
+"""
+import cv2
+import numpy as np
+from OCRLibrary.utils.helpers.caching import LRUCache, hash_image
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imageprocessing.image_processing_gray import read_gray_image
+
+# Pyramids of the templates keyed by the template content and the scale.
+TEMPLATE_PYRAMID_CACHE = LRUCache(max_entries=64, max_bytes=64 * 1024 * 1024)
+
+# Smallest side of the template at the coarsest level of the pyramids.
+MIN_TEMPLATE_SIZE = 12
+# Candidates found at a coarse level are kept down to the threshold minus this margin, the scores are lower at coarse levels.
+COARSE_MARGIN = 0.2
+# Number of candidates refined per scale.
+MAX_CANDIDATES = 100
+# Matches overlapping a better match by more than this part of the smallest of the two are suppressed.
+MAX_OVERLAP = 0.5
+# Number of pixels searched around a candidate at the next finer level.
+_REFINE_MARGIN = 2
+
+def get_template_pyramid(template, scale):
+    """
+    Purpose:
+        Gets the gray scale pyramid of the template resized by the scale, from the cache if the template was already used.
+    Args:
+        template - the template image, or the path to the template image.
+        scale - scale of the template in the image.
+    Returns:
+        Tuple of read only images, the template at full size first. Empty if the template is empty at the scale.
+    """
+    gray = read_gray_image(template)
+    key = (hash_image(gray), scale)
+    pyramid = TEMPLATE_PYRAMID_CACHE.get(key)
+    if pyramid is not None:
+        return pyramid
+    width, height = int(round(gray.shape[1] * scale)), int(round(gray.shape[0] * scale))
+    if width < 1 or height < 1:
+        return ()
+    if (width, height) != (gray.shape[1], gray.shape[0]):
+        gray = cv2.resize(gray, (width, height), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+    levels = [np.ascontiguousarray(gray)]
+    while min(levels[-1].shape) // 2 >= MIN_TEMPLATE_SIZE:
+        levels.append(cv2.pyrDown(levels[-1]))
+    for level in levels:
+        level.setflags(write=False)
+    pyramid = tuple(levels)
+    TEMPLATE_PYRAMID_CACHE.put(key, pyramid, sum(level.nbytes for level in pyramid))
+    return pyramid
+
+def _match(img, template):
+    scores = cv2.matchTemplate(img, template, cv2.TM_CCOEFF_NORMED)
+    # A flat template (or a flat part of the image) gives a zero variance, and an undefined score.
+    return np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0, copy=False)
+
+def _find_peaks(scores, threshold, template_shape):
+    """
+    Returns the (x, y, score) of the local maxima of the scores above the threshold, best first.
+    """
+    size = (max(template_shape[1] // 2, 1) | 1, max(template_shape[0] // 2, 1) | 1)
+    maxima = cv2.dilate(scores, cv2.getStructuringElement(cv2.MORPH_RECT, size))
+    ys, xs = np.nonzero((scores >= threshold) & (scores >= maxima))
+    order = np.argsort(-scores[ys, xs], kind='stable')[:MAX_CANDIDATES]
+    return [(x, y, scores[y, x]) for x, y in zip(xs[order].tolist(), ys[order].tolist())]
+
+def _refine(img, template, x, y):
+    """
+    Matches the template in a window around (x, y) and returns the (x, y, score) of the best match.
+    """
+    x0, y0 = max(x - _REFINE_MARGIN, 0), max(y - _REFINE_MARGIN, 0)
+    x1 = min(x + template.shape[1] + _REFINE_MARGIN, img.shape[1])
+    y1 = min(y + template.shape[0] + _REFINE_MARGIN, img.shape[0])
+    if x1 - x0 < template.shape[1] or y1 - y0 < template.shape[0]:
+        return x, y, -1.0
+    _, score, _, (best_x, best_y) = cv2.minMaxLoc(_match(img[y0:y1, x0:x1], template))
+    return x0 + best_x, y0 + best_y, score
+
+def _match_scale(img_pyramid, template_pyramid, threshold):
+    """
+    Returns the (x, y, w, h, score) of the matches of one scale of the template, searched coarse to fine.
+    """
+    top = min(len(template_pyramid), len(img_pyramid)) - 1
+    while top >= 0 and (img_pyramid[top].shape[0] < template_pyramid[top].shape[0] or
+            img_pyramid[top].shape[1] < template_pyramid[top].shape[1]):
+        top -= 1
+    if top < 0:
+        return []
+    margin = COARSE_MARGIN if top > 0 else 0.0
+    candidates = _find_peaks(_match(img_pyramid[top], template_pyramid[top]), threshold - margin, template_pyramid[top].shape)
+    for level in range(top - 1, -1, -1):
+        level_threshold = threshold - COARSE_MARGIN if level > 0 else threshold
+        refined = (_refine(img_pyramid[level], template_pyramid[level], 2 * x, 2 * y) for x, y, _ in candidates)
+        candidates = [candidate for candidate in refined if candidate[2] >= level_threshold]
+    height, width = template_pyramid[0].shape
+    return [(x, y, width, height, score) for x, y, score in candidates]
+
+def _suppress_overlaps(matches):
+    """
+    Drops the matches overlapping a better match, best match first.
+    """
+    kept = []
+    for match in sorted(matches, key=lambda match: -match[4]):
+        x, y, w, h, _ = match
+        for other_x, other_y, other_w, other_h, _ in kept:
+            overlap_w = min(x + w, other_x + other_w) - max(x, other_x)
+            overlap_h = min(y + h, other_y + other_h) - max(y, other_y)
+            if overlap_w > 0 and overlap_h > 0 and overlap_w * overlap_h > MAX_OVERLAP * min(w * h, other_w * other_h):
+                break
+        else:
+            kept.append(match)
+    return kept
+
+def get_template_matches(img, template, threshold=0.9, scales=(1.0,), region=None):
+    """
+    Purpose:
+        Gets the matches of the template in the image.
+    Args:
+        img - provided read image (result of cv2.imread()).
+        template - the template image, or the path to the template image.
+        threshold - minimum similarity of a match, between 0 and 1 (optional).
+        scales - scales of the template in the image (optional).
+        region - (x, y, w, h) of the part of the image to search, None searches the full image (optional).
+    Returns:
+        List of (x, y, w, h, score) of the matches relative to the full image, best match first.
+    """
+    x, y = (region[0], region[1]) if region is not None else (0, 0)
+    img = get_region_of_interest(img, region) if region is not None else img
+    if img.size == 0:
+        return []
+    template = read_gray_image(template)
+    template_pyramids = [get_template_pyramid(template, scale) for scale in scales]
+    img_pyramid = [read_gray_image(img)]
+    while len(img_pyramid) < max(len(pyramid) for pyramid in template_pyramids) and min(img_pyramid[-1].shape) > 1:
+        img_pyramid.append(cv2.pyrDown(img_pyramid[-1]))
+    matches = []
+    for template_pyramid in template_pyramids:
+        if template_pyramid:
+            matches += _match_scale(img_pyramid, template_pyramid, threshold)
+    return [(match_x + x, match_y + y, w, h, score) for match_x, match_y, w, h, score in _suppress_overlaps(matches)]
+
+def return_template_coordinates(img, template, threshold=0.9, scales=(1.0,), region=None):
+    """
+    Purpose:
+        Locates the center (x, y) of the best match of the template in the image, None if the template is not found.
+    """
+    matches = get_template_matches(img, template, threshold, scales, region)
+    if not matches:
+        return None
+    x, y, w, h, _ = matches[0]
+    return (x + w / 2, y + h / 2)
+
+def return_multiple_template_bounds(img, template, threshold=0.9, scales=(1.0,), region=None):
+    """
+    Purpose:
+        Locates the bounds (x, y, w, h) of every match of the template in the image, best match first. None if the
+        template is not found.
+    """
+    matches = get_template_matches(img, template, threshold, scales, region)
+    if not matches:
+        return None
+    return [(x, y, w, h) for x, y, w, h, _ in matches]
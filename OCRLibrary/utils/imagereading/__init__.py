@@ -2,4 +2,4 @@
 imagereading module
 """
 
-__all__ = ["image_reading", "text_locating"]
+__all__ = ["batch_reading", "colour_guided_reading", "content_waiting", "image_reading", "incremental_reading", "line_detection", "mosaic_reading", "ocr_document", "ocr_engine", "text_locating", "tiled_reading"]
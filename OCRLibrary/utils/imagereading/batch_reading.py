@@ -0,0 +1,181 @@
+"""
+Batch reading module.
+
+This module is responsible for reading many images at once. The images are read in a pool of worker processes so
+OCR uses every core, at most queue_size images are waiting in the pool at any time, and the results are returned in
+the order of the images. The pool is kept between batches, so the worker processes (and the OCR engine they loaded)
+are reused. Worker processes do not share the state of the robot process, so the OCR settings (engine, tiling, line
+detection, cache size and tesseract command) are sent with each task and applied in the worker before reading.
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+import cv2
+import pytesseract as pt
+from OCRLibrary.utils.imagereading.image_reading import OCR_RESULT_CACHE, return_image_content
+from OCRLibrary.utils.imagereading.line_detection import OCR_LINE_DETECTION
+from OCRLibrary.utils.imagereading.ocr_engine import get_ocr_engine, set_ocr_engine
+from OCRLibrary.utils.imagereading.text_locating import return_text_coordinates
+from OCRLibrary.utils.imagereading.tiled_reading import OCR_TILING
+
+# Pool of worker processes kept between batches, replaced when the number of workers changes.
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+def _read_item(item):
+    """
+    Returns the image, reading it first if the item is a path.
+    """
+    if isinstance(item, str):
+        img = cv2.imread(item)
+        if img is None:
+            raise ValueError(f"The image {item} could not be read.")
+        return img
+    return item
+
+def get_ocr_settings():
+    """
+    Purpose:
+        Returns a snapshot of the OCR settings of the current process, to be applied in the worker processes.
+    """
+    return {'engine': get_ocr_engine().name, 'tiling': dict(OCR_TILING), 'line_detection': dict(OCR_LINE_DETECTION),
+        'cache_size': (OCR_RESULT_CACHE.max_entries, OCR_RESULT_CACHE.max_bytes),
+        'tesseract_cmd': pt.pytesseract.tesseract_cmd}
+
+def apply_ocr_settings(settings):
+    """
+    Purpose:
+        Applies the OCR settings returned by get_ocr_settings to the current process.
+    """
+    pt.pytesseract.tesseract_cmd = settings['tesseract_cmd']
+    OCR_TILING.update(settings['tiling'])
+    OCR_LINE_DETECTION.update(settings['line_detection'])
+    if (OCR_RESULT_CACHE.max_entries, OCR_RESULT_CACHE.max_bytes) != settings['cache_size']:
+        OCR_RESULT_CACHE.resize(*settings['cache_size'])
+    if get_ocr_engine().name != settings['engine']:
+        set_ocr_engine(settings['engine'])
+
+def read_content_task(item, settings, pyt_conf, lang):
+    """
+    Purpose:
+        Worker task returning the text of one image.
+    """
+    apply_ocr_settings(settings)
+    return return_image_content(_read_item(item), pyt_conf, lang)
+
+def locate_text_task(item, settings, text, pyt_conf, lang, match_mode):
+    """
+    Purpose:
+        Worker task returning the coordinates of the first occurrence of the text in one image.
+    """
+    apply_ocr_settings(settings)
+    return return_text_coordinates(_read_item(item), text, pyt_conf, lang, match_mode)
+
+def get_process_pool(workers):
+    """
+    Purpose:
+        Returns the pool of worker processes, the pool of the previous batch is reused if it has the same number of workers.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.shutdown(wait=True)
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+def shutdown_process_pool():
+    """
+    Purpose:
+        Stops the worker processes, the next batch starts a new pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+def run_batch(task, items, args, workers=None, queue_size=None):
+    """
+    Purpose:
+        Runs the task for every item in a pool of worker processes.
+    Args:
+        task - module level function called as task(item, settings, *args), settings being returned by get_ocr_settings.
+        items - list of images (numpy.ndarray) or image paths.
+        args - extra arguments given to the task.
+        workers - number of worker processes, defaults to the number of CPUs.
+        queue_size - max number of items submitted to the pool and not completed, defaults to twice the number of workers.
+    Returns:
+        results - list of the task results in the order of the items, None for the items that failed.
+        errors - dictionary of the index of each item that failed to the error raised.
+    """
+    workers = workers or os.cpu_count() or 1
+    queue_size = max(queue_size or 2 * workers, workers)
+    settings = get_ocr_settings()
+    results = [None] * len(items)
+    errors = {}
+    if min(workers, len(items)) <= 1:
+        for i, item in enumerate(items):
+            try:
+                results[i] = task(item, settings, *args)
+            except Exception as error: # pylint: disable=broad-except
+                errors[i] = error
+        return results, errors
+    executor = get_process_pool(workers)
+    pending = {}
+    next_index = 0
+    while next_index < len(items) or pending:
+        while next_index < len(items) and len(pending) < queue_size:
+            future = executor.submit(task, items[next_index], settings, *args)
+            pending[future] = next_index
+            next_index += 1
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            i = pending.pop(future)
+            try:
+                results[i] = future.result()
+            except Exception as error: # pylint: disable=broad-except
+                errors[i] = error
+    if any(isinstance(error, BrokenProcessPool) for error in errors.values()):
+        # A worker process died, the pool cannot run any other task.
+        shutdown_process_pool()
+    return results, errors
+
+def return_images_content(images, pyt_conf, lang, workers=None, queue_size=None):
+    """
+    Purpose:
+        Returns the text of every image, the images are read in parallel.
+    Args:
+        images - list of images (numpy.ndarray) or image paths.
+        pyt_conf - configuration to read the images.
+        lang - the language of the text to read.
+        workers - number of worker processes (optional).
+        queue_size - max number of images waiting in the pool (optional).
+    Returns:
+        results - list of the text of each image, None for the images that failed.
+        errors - dictionary of the index of each image that failed to the error raised.
+    """
+    return run_batch(read_content_task, images, (pyt_conf, lang), workers, queue_size)
+
+def return_text_coordinates_in_images(images, text, pyt_conf, lang, match_mode='exact', workers=None, queue_size=None):
+    """
+    Purpose:
+        Returns the coordinates of the first occurrence of the text in every image, the images are read in parallel.
+    Args:
+        images - list of images (numpy.ndarray) or image paths.
+        text - the text to locate.
+        pyt_conf - configuration to read the images.
+        lang - the language of the text to read.
+        match_mode - how the text is compared to the words read (optional).
+        workers - number of worker processes (optional).
+        queue_size - max number of images waiting in the pool (optional).
+    Returns:
+        results - list of the coordinates (x, y) found in each image, None for the images where the text was not found
+                  or that failed.
+        errors - dictionary of the index of each image that failed to the error raised.
+    """
+    return run_batch(locate_text_task, images, (text, pyt_conf, lang, match_mode), workers, queue_size)
@@ -0,0 +1,65 @@
+"""
+Colour guided reading module.
+
+This module is responsible for reading only the parts of an image of a given colour (i.e. highlighted rows or coloured
+buttons). The regions of the colour are located with connected components (see colour_regions), and only the box
+around each region is read, the boxes being read in parallel. Regions inside the box of another region (i.e. the inside
+of the letters written on a coloured row) are not read again. This is much faster than reading a masked image, which is
+mostly black, or the full image.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from OCRLibrary.utils.imageprocessing.colour_regions import get_colour_regions
+from OCRLibrary.utils.imagereading.image_reading import return_image_content
+
+def _pad_box(box, padding, width, height):
+    """
+    Grows the box (x, y, w, h) by the padding on each side, limited to the image.
+    """
+    x, y, w, h = box
+    x0, y0 = max(x - padding, 0), max(y - padding, 0)
+    x1, y1 = min(x + w + padding, width), min(y + h + padding, height)
+    return (x0, y0, x1 - x0, y1 - y0)
+
+def _remove_inner_boxes(boxes):
+    """
+    Drops the duplicate boxes (regions padded to the same box) and the boxes inside another box, i.e. the inside of the
+    letters written on a coloured row is a region of the colour of its own, and its text is already read with the row.
+    The boxes are checked largest first against the boxes kept only, the inner boxes being many and the kept boxes few.
+    """
+    def inside(box, other):
+        return other[0] <= box[0] and other[1] <= box[1] and \
+            box[0] + box[2] <= other[0] + other[2] and box[1] + box[3] <= other[1] + other[3]
+    boxes = list(dict.fromkeys(boxes))
+    kept = []
+    for box in sorted(boxes, key=lambda box: -box[2] * box[3]):
+        if not any(inside(box, other) for other in kept):
+            kept.append(box)
+    kept = set(kept)
+    return [box for box in boxes if box in kept]
+
+def return_colour_regions_content(img, bounds, config, lang, min_area=1, padding=0, workers=None, region=None):
+    """
+    Purpose:
+        Reads the text inside each region of the image in the range of the bounds of one of the provided colours.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        bounds - tuple of (lower_bound_colour, upper_bound_colour) tuples in BGR (or HSV) format.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+        min_area - regions with fewer pixels are not read (optional).
+        padding - number of pixels read around each region (optional).
+        workers - number of regions read in parallel, defaults to the number of CPUs (optional).
+        region - (x, y, w, h) of the part of the image to search, None searches the full image (optional).
+    Returns:
+        List of dictionaries with the bounds (x, y, w, h) of the part of the image read for each region, relative to the
+        full image, and the text read without its trailing white space. None if no region is found.
+    """
+    stats, _ = get_colour_regions(img, bounds, min_area, region)
+    if len(stats) == 0:
+        return None
+    boxes = _remove_inner_boxes([_pad_box(stat[:4], padding, img.shape[1], img.shape[0]) for stat in stats.tolist()])
+    workers = min(workers or os.cpu_count() or 1, len(boxes))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = list(executor.map(lambda box: return_image_content(img, config, lang, box), boxes))
+    return [{'bounds': box, 'text': content.rstrip()} for box, content in zip(boxes, contents)]
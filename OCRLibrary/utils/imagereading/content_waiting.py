@@ -0,0 +1,94 @@
+"""
+Content waiting module.
+
+This module is responsible for waiting until text appears in or disappears from the screen. Frames are captured at
+the poll interval and compared to the previous frame with a hash of their pixels, the OCR engine only reads a frame
+when its pixels changed. The same hash is the key of the frame in the OCR result cache, so each frame is hashed once.
+While the screen does not change the poll interval grows by the backoff factor.
+"""
+import os
+import time
+import cv2
+from robot.libraries.BuiltIn import BuiltIn
+from OCRLibrary.utils.helpers.caching import hash_image
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imagereading.image_reading import return_image_content
+
+IMAGE_EXTENSIONS = ('.bmp', '.gif', '.jpeg', '.jpg', '.png', '.pbm', '.pgm', '.ppm', '.tif', '.tiff', '.webp')
+
+def is_image_path(screenshot):
+    """
+    Purpose:
+        Checks if the screenshot argument is an image path rather than a keyword name.
+    Args:
+        screenshot - the name of a keyword or an image path.
+    Returns:
+        True if the screenshot contains a path separator or ends with an image extension.
+    """
+    return (os.sep in screenshot or '/' in screenshot or os.path.isfile(screenshot) or
+        screenshot.lower().endswith(IMAGE_EXTENSIONS))
+
+def capture_frame(screenshot):
+    """
+    Purpose:
+        Captures a new frame of the screen.
+    Args:
+        screenshot - a callable or the name of a keyword returning an image or an image path, or the path of an image
+                     that is overwritten by another process.
+    Returns:
+        The frame (numpy.ndarray), or None if the image could not be read (i.e. the file is missing or being written).
+    """
+    if callable(screenshot):
+        frame = screenshot()
+    elif is_image_path(screenshot):
+        frame = screenshot
+    else:
+        frame = BuiltIn().run_keyword(screenshot)
+    if isinstance(frame, str):
+        frame = cv2.imread(frame) if os.path.isfile(frame) else None
+    return frame
+
+def wait_for_content(screenshot, expected_content, visible, timeout, poll_interval, backoff, pyt_conf, lang, region=None,
+        first_frame=None):
+    """
+    Purpose:
+        Waits until the expected content is visible (or not visible) in the frames captured.
+    Args:
+        screenshot - see capture_frame.
+        expected_content - the text to wait for.
+        visible - True to wait until the text is visible, False to wait until it disappears.
+        timeout - max number of seconds to wait.
+        poll_interval - number of seconds between two frames.
+        backoff - factor applied to the poll interval after each unchanged frame.
+        pyt_conf - configuration to read the frames.
+        lang - the language of the text to read.
+        region - only this region (x, y, w, h) of the frames is compared and read (optional).
+        first_frame - the first frame, already captured (optional).
+    Returns:
+        succeeded - True if the text became visible (or disappeared) before the timeout.
+        frame - the last frame captured.
+        content - the text read in the last frame read.
+    """
+    deadline = time.monotonic() + timeout
+    interval = poll_interval
+    last_hash = None
+    frame = content = None
+    captured = capture_frame(screenshot) if first_frame is None else first_frame
+    while True:
+        if captured is not None:
+            frame = captured
+            roi = frame if region is None else get_region_of_interest(frame, region)
+            frame_hash = hash_image(roi)
+            if frame_hash != last_hash:
+                last_hash = frame_hash
+                interval = poll_interval
+                content = return_image_content(roi, pyt_conf, lang, image_hash=frame_hash) if roi.size else ''
+                if (expected_content in content) == visible:
+                    return True, frame, content
+            else:
+                interval *= backoff
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False, frame, content
+        time.sleep(min(interval, remaining))
+        captured = capture_frame(screenshot)
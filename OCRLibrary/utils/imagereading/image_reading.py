@@ -1,9 +1,101 @@
 """
-High level implementation of image reading (pytesseract) functionality
+High level implementation of image reading (OCR engine) functionality
 """
-import pytesseract as pt
+from OCRLibrary.utils.helpers.caching import LRUCache, hash_image
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imagereading.ocr_engine import OCR_OUTPUTS, get_ocr_engine
+from OCRLibrary.utils.imagereading.line_detection import OCR_LINE_DETECTION, use_line_detection, read_line_image_data
+from OCRLibrary.utils.imagereading.tiled_reading import OCR_TILING, use_tiling, read_tiled_image_data, image_data_to_text
 
-def return_image_content(img, config, lang):
+# Results of the OCR engine keyed by the image content, the output type, the configuration, the language and the engine.
+OCR_RESULT_CACHE = LRUCache(max_entries=128, max_bytes=32 * 1024 * 1024)
+
+def _cache_keys(img, outputs, config, lang, engine, image_hash=None):
+    if use_line_detection():
+        reading = ('lines', OCR_LINE_DETECTION['kernel_size'], OCR_LINE_DETECTION['padding'])
+    else:
+        reading = (OCR_TILING['tile_size'], OCR_TILING['overlap']) if use_tiling(img) else None
+    if image_hash is None:
+        image_hash = hash_image(img)
+    return {output: (image_hash, output, config, lang, engine.name, reading) for output in outputs}
+
+def _output_size(output, value):
+    if output == 'data':
+        return value.nbytes + sum(len(text) for text in value['text'])
+    return len(value)
+
+def _read_outputs(engine, img, config, lang, outputs):
+    """
+    Recognizes the image once and returns a dictionary of the outputs. With line detection the image is read line by line,
+    and tiled images are read tile by tile, for the text and the boxes, the other outputs are read from the full image.
+    """
+    if not use_line_detection() and not use_tiling(img):
+        results = engine.recognize(img, config, lang, outputs)
+    else:
+        if use_line_detection():
+            data = read_line_image_data(engine, img, config, lang)
+        else:
+            data = read_tiled_image_data(engine, img, config, lang)
+        results = {'data': data, 'text': image_data_to_text(data)}
+        other_outputs = tuple(output for output in outputs if output not in results)
+        if other_outputs:
+            results.update(engine.recognize(img, config, lang, other_outputs))
+    if 'data' in results:
+        results['data'].setflags(write=False)
+    return results
+
+def return_image_outputs(img, config, lang, outputs, region=None, image_hash=None, optional_outputs=()):
+    """
+    Purpose:
+        Returns several outputs of the OCR engine for the image, all the outputs that are not cached are read from a
+        single recognition of the image.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+        outputs - list of outputs to return (see OCR_OUTPUTS): 'text', 'data', 'hocr' and/or 'alto'.
+        region - only this region (x, y, w, h) of the image is read (optional).
+        image_hash - hash_image of the image read (of the region with a region), when the caller already computed it
+                     (optional).
+        optional_outputs - list of outputs only returned when they are cached or read by the same recognition as the
+                           outputs, they are never read on their own (optional).
+    Returns:
+        Dictionary of each output: the text, the boxes as a read only structured array (see return_image_data), the
+        hOCR and the ALTO XML. The optional outputs that are not available are left out.
+    Images are read line by line when line detection is enabled (see line_detection), and images larger than the OCR tile
+    size are read in overlapping tiles (see tiled_reading).
+    """
+    if region is not None:
+        img = get_region_of_interest(img, region)
+    outputs = tuple(output for output in OCR_OUTPUTS if output in outputs)
+    optional_outputs = tuple(output for output in OCR_OUTPUTS if output in optional_outputs and output not in outputs)
+    engine = get_ocr_engine()
+    if not OCR_RESULT_CACHE.enabled:
+        results = _read_outputs(engine, img, config, lang, outputs)
+        return {output: results[output] for output in outputs + optional_outputs if output in results}
+    keys = _cache_keys(img, OCR_OUTPUTS, config, lang, engine, image_hash)
+    results = {}
+    for output in outputs:
+        value = OCR_RESULT_CACHE.get(keys[output])
+        if value is not None:
+            results[output] = value
+    for output in optional_outputs:
+        value = OCR_RESULT_CACHE.peek(keys[output])
+        if value is not None:
+            results[output] = value
+    missing_outputs = [output for output in outputs if output not in results]
+    if missing_outputs:
+        # Outputs the engine returns together from memory are read together (see paired_outputs of the engines).
+        if set(missing_outputs) & set(engine.paired_outputs):
+            missing_outputs = [output for output in OCR_OUTPUTS if output in missing_outputs or output in engine.paired_outputs]
+        read_results = _read_outputs(engine, img, config, lang, tuple(missing_outputs))
+        for output, value in read_results.items():
+            OCR_RESULT_CACHE.put(keys[output], value, _output_size(output, value))
+        results.update((output, value) for output, value in read_results.items()
+            if output not in results and (output in outputs or output in optional_outputs))
+    return results
+
+def return_image_content(img, config, lang, region=None, image_hash=None):
     """
     Purpose:
         Returns the text from the image based on the config and languange
@@ -11,5 +103,41 @@ def return_image_content(img, config, lang):
         img - processed image returned from one of the image processing functions.
         config - configuration to read the image.
         lang - the language of the text to read.
+        region - only this region (x, y, w, h) of the image is read (optional).
+        image_hash - hash_image of the image read, when the caller already computed it (optional).
+    Images larger than the OCR tile size are read in overlapping tiles (see tiled_reading).
+    """
+    return return_image_outputs(img, config, lang, ('text',), region, image_hash)['text']
+
+def return_image_data(img, config, lang):
+    """
+    Purpose:
+        Returns the boxes (levels, bounds, confidences and text) found in the image based on the config and language.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+    Returns:
+        Read only structured array with one record per box, the fields are the columns of the tesseract TSV output
+        (level, left, top, width, height, conf, text, ...).
+    """
+    return return_image_outputs(img, config, lang, ('data',))['data']
+
+def offset_image_data(data, x, y):
+    """
+    Purpose:
+        Translates the boxes of image data read from a region of an image back to the coordinates of the full image.
+    Args:
+        data - structured array returned by return_image_data.
+        x - x coordinate of the region in the full image.
+        y - y coordinate of the region in the full image.
+    Returns:
+        Read only structured array with translated boxes.
     """
-    return pt.image_to_string(img, config=config, lang=lang)
+    if not x and not y:
+        return data
+    data = data.copy()
+    data['left'] += x
+    data['top'] += y
+    data.setflags(write=False)
+    return data
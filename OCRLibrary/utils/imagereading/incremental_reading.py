@@ -0,0 +1,107 @@
+"""
+Incremental reading module.
+
+This module is responsible for updating an OCR document when its image changes. The changed rectangles are found by
+comparing the previous and the new image, and only those rectangles are read again:
+    - the pixels that changed are grouped in rectangles with connected components, changes closer than the padding
+      are grouped together.
+    - each rectangle is grown to cover the words of the document it touches, so a word is never read in part.
+    - the words inside the rectangles are replaced by the words read in the rectangles of the new image.
+"""
+import cv2
+import numpy as np
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imagereading.image_reading import return_image_data, offset_image_data
+from OCRLibrary.utils.imagereading.ocr_document import OCRDocument, create_ocr_document
+from OCRLibrary.utils.imagereading.tiled_reading import number_lines
+
+# When the changed rectangles cover more than this part of the image, the full image is read again.
+MAX_CHANGED_AREA = 0.5
+
+def get_changed_rectangles(previous_img, img, padding):
+    """
+    Purpose:
+        Returns the rectangles of the image that changed.
+    Args:
+        previous_img - the previous image.
+        img - the new image, same shape as the previous image.
+        padding - number of pixels added around the pixels that changed.
+    Returns:
+        Array of rectangles (x, y, w, h), one row per group of changed pixels.
+    """
+    diff = cv2.absdiff(previous_img, img)
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+    changed = (diff > 0).astype(np.uint8)
+    if padding > 0:
+        changed = cv2.dilate(changed, cv2.getStructuringElement(cv2.MORPH_RECT, (2 * padding + 1, 2 * padding + 1)))
+    _, _, stats, _ = cv2.connectedComponentsWithStats(changed, connectivity=8)
+    return stats[1:, :4].astype(np.int64)
+
+def _overlaps(box, other):
+    return box[0] < other[2] and box[2] > other[0] and box[1] < other[3] and box[3] > other[1]
+
+def _union(box, other):
+    return [min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3])]
+
+def _cover_words(rectangles, bounds):
+    """
+    Grows the rectangles until none of them cuts a word or overlaps another rectangle. Returns the rectangles as a
+    list of [x0, y0, x1, y1].
+    """
+    boxes = [[x, y, x + w, y + h] for x, y, w, h in rectangles.tolist()]
+    words = [[x, y, x + w, y + h] for x, y, w, h in bounds.tolist()]
+    while True:
+        merged = []
+        for box in boxes:
+            for word in words:
+                if _overlaps(box, word):
+                    box = _union(box, word)
+            for i, other in enumerate(merged):
+                if _overlaps(box, other):
+                    merged[i] = _union(box, other)
+                    break
+            else:
+                merged.append(box)
+        if merged == boxes:
+            return boxes
+        boxes = merged
+
+def update_ocr_document(document, img, padding=8):
+    """
+    Purpose:
+        Returns the OCR document of the new image, only reading the parts of the image that changed since the document
+        was created.
+    Args:
+        document - OCR document returned by create_ocr_document (or a previous update).
+        img - the new image.
+        padding - number of pixels read around the pixels that changed (optional).
+    Returns:
+        OCRDocument of the new image. If the size of the image changed or most of the image changed, the full image is read again.
+    """
+    previous_roi, region = document.image, document.region
+    if document.image_shape != img.shape:
+        return create_ocr_document(img, document.config, document.lang, document.min_confidence, region, True)
+    x, y, w, h = region if region is not None else (0, 0, img.shape[1], img.shape[0])
+    roi = get_region_of_interest(img, (x, y, w, h))
+    if roi.size == 0:
+        return OCRDocument(document.data, document.config, document.lang, document.min_confidence, img, region, document.text)
+    data = document.data
+    words = data[data['text'] != '']
+    bounds = np.stack((words['left'] - x, words['top'] - y, words['width'], words['height']), axis=1).astype(np.int64)
+    boxes = _cover_words(get_changed_rectangles(previous_roi, roi, padding), bounds)
+    if not boxes:
+        return OCRDocument(data, document.config, document.lang, document.min_confidence, img, region, document.text)
+    if sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in boxes) > MAX_CHANGED_AREA * roi.shape[0] * roi.shape[1]:
+        return create_ocr_document(img, document.config, document.lang, document.min_confidence, region, True)
+    kept = np.ones(len(words), dtype=bool)
+    new_words = []
+    for x0, y0, x1, y1 in boxes:
+        x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, roi.shape[1]), min(y1, roi.shape[0])
+        kept &= ~((bounds[:, 0] >= x0) & (bounds[:, 1] >= y0) & (bounds[:, 0] + bounds[:, 2] <= x1) & (bounds[:, 1] + bounds[:, 3] <= y1))
+        box_data = return_image_data(get_region_of_interest(roi, (x0, y0, x1 - x0, y1 - y0)), document.config, document.lang)
+        box_data = offset_image_data(box_data, x + x0, y + y0)
+        new_words.append(box_data[box_data['text'] != ''])
+    data = number_lines(np.concatenate([words[kept]] + new_words))
+    data.setflags(write=False)
+    return OCRDocument(data, document.config, document.lang, document.min_confidence, img, region)
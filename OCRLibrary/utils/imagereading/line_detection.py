@@ -0,0 +1,116 @@
+"""
+Line detection module.
+
+This module is responsible for reading sparse images (i.e. UI screenshots) line by line. Most of the time spent reading
+a full screenshot goes to the layout analysis of the OCR engine and to empty areas, so the lines of text are detected
+with OpenCV first:
+    - the edges of the image are found with a morphological gradient and binarized with Otsu's threshold.
+    - the characters of a line are joined by a closing with a wide rectangle kernel.
+    - the bounding boxes of the outer contours are the lines of text.
+Each line is then read as a single line of text (--psm 7), the lines being read in parallel. As with tiles, a word is
+only taken from the line whose box (without the padding) holds its center, so a word read by two overlapping lines is
+only kept once.
+"""
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+from OCRLibrary.utils.imageprocessing.image_processing_gray import read_gray_image, process_morphology, process_to_binary_otsu_image
+from OCRLibrary.utils.imagereading.ocr_engine import OCR_DATA_DTYPE
+from OCRLibrary.utils.imagereading.tiled_reading import number_lines
+
+# Line detection used by the image reading functions.
+OCR_LINE_DETECTION = {'enabled': False, 'kernel_size': (35, 5), 'padding': 4, 'workers': None}
+
+# Boxes smaller than this (width, height) are not lines of text (i.e. the dot of an i or a line of a table).
+MIN_LINE_SIZE = (4, 8)
+
+_PAGE_SEGMENTATION_MODE = re.compile(r'--psm\s+\d+')
+
+def set_ocr_line_detection(enabled, kernel_size=(35, 5), padding=4, workers=None):
+    """
+    Purpose:
+        Sets the line detection used by the image reading functions.
+    Args:
+        enabled - True to read images line by line.
+        kernel_size - size of the rectangle kernel joining the characters of a line (optional).
+        padding - number of pixels read around each line (optional).
+        workers - number of lines read in parallel, defaults to the number of CPUs (optional).
+    """
+    OCR_LINE_DETECTION['enabled'] = enabled
+    OCR_LINE_DETECTION['kernel_size'] = kernel_size
+    OCR_LINE_DETECTION['padding'] = padding
+    OCR_LINE_DETECTION['workers'] = workers
+
+def use_line_detection():
+    """
+    Purpose:
+        Returns True if images are read line by line.
+    """
+    return OCR_LINE_DETECTION['enabled']
+
+def get_line_config(config):
+    """
+    Purpose:
+        Returns the configuration reading a single line of text (--psm 7), the other options of the configuration are kept.
+    """
+    if _PAGE_SEGMENTATION_MODE.search(config):
+        return _PAGE_SEGMENTATION_MODE.sub('--psm 7', config)
+    return f'{config} --psm 7'.strip()
+
+def detect_text_lines(img, kernel_size=(35, 5)):
+    """
+    Purpose:
+        Detects the lines of text of an image.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        kernel_size - size of the rectangle kernel joining the characters of a line, the width must be larger than the
+        space between two words (optional).
+    Returns:
+        List of the boxes (x, y, w, h) of the lines, from the top of the image to the bottom.
+    """
+    edges = process_morphology(read_gray_image(img), 'gradient', 1, (3, 3))
+    edges = process_to_binary_otsu_image(edges, dst=edges)[1]
+    edges = process_morphology(edges, 'closing', 0, kernel_size, dst=edges)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    boxes = [cv2.boundingRect(contour) for contour in contours]
+    boxes = [box for box in boxes if box[2] >= MIN_LINE_SIZE[0] and box[3] >= MIN_LINE_SIZE[1]]
+    return sorted(boxes, key=lambda box: (box[1], box[0]))
+
+def _read_line(engine, img, line, padding, config, lang):
+    """
+    Reads the line grown by the padding, and returns the words whose center is inside the line, translated to the
+    coordinates of the image.
+    """
+    x, y, w, h = line
+    x0, y0 = max(x - padding, 0), max(y - padding, 0)
+    x1, y1 = min(x + w + padding, img.shape[1]), min(y + h + padding, img.shape[0])
+    data = engine.image_to_data(img[y0:y1, x0:x1], config, lang)
+    data = data[data['text'] != ''].copy()
+    data['left'] += x0
+    data['top'] += y0
+    center_x = data['left'] + data['width'] / 2
+    center_y = data['top'] + data['height'] / 2
+    return data[(center_x >= x) & (center_x < x + w) & (center_y >= y) & (center_y < y + h)]
+
+def read_line_image_data(engine, img, config, lang):
+    """
+    Purpose:
+        Detects the lines of text of the image and reads them in parallel.
+    Args:
+        engine - the OCR engine.
+        img - processed image returned from one of the image processing functions.
+        config - configuration to read the image, its page segmentation mode is replaced by --psm 7.
+        lang - the language of the text to read.
+    Returns:
+        Structured array (see OCR_DATA_DTYPE) with one record per word, numbered by line in reading order.
+    """
+    lines = detect_text_lines(img, OCR_LINE_DETECTION['kernel_size'])
+    if not lines:
+        return np.zeros(0, dtype=OCR_DATA_DTYPE)
+    line_config, padding = get_line_config(config), OCR_LINE_DETECTION['padding']
+    workers = OCR_LINE_DETECTION['workers'] or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(lines))) as executor:
+        lines_data = list(executor.map(lambda line: _read_line(engine, img, line, padding, line_config, lang), lines))
+    return number_lines(np.concatenate(lines_data))
@@ -0,0 +1,70 @@
+"""
+Mosaic reading module.
+
+This module is responsible for reading many small regions of an image (i.e. prices, counters or labels) with a single
+OCR run. Each OCR run has a fixed cost, so instead of reading each region on its own:
+    - the regions are cropped and stacked one below the other in a mosaic image, each region in its own slot with
+      padding around it. The padding takes the colour of the border of the region, so the text stands on the background
+      it was read on.
+    - the mosaic is read once.
+    - each word is given back to the region of the slot holding its center.
+"""
+import numpy as np
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imagereading.image_reading import return_image_data
+from OCRLibrary.utils.imagereading.tiled_reading import image_data_to_text
+
+def _border_colour(crop):
+    """
+    Returns the median colour of the pixels on the border of the crop.
+    """
+    border = np.concatenate((crop[0], crop[-1], crop[:, 0], crop[:, -1]))
+    return np.median(border, axis=0).astype(crop.dtype)
+
+def build_mosaic(img, regions, padding):
+    """
+    Purpose:
+        Stacks the regions of the image one below the other.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        regions - list of regions (x, y, w, h), the regions must overlap the image.
+        padding - number of pixels around each region.
+    Returns:
+        The mosaic image, and the list of the (top, bottom) rows of the slot of each region in the mosaic.
+    """
+    crops = [get_region_of_interest(img, region) for region in regions]
+    width = max(crop.shape[1] for crop in crops) + 2 * padding
+    height = sum(crop.shape[0] + 2 * padding for crop in crops)
+    mosaic = np.empty((height, width) + img.shape[2:], dtype=img.dtype)
+    slots, top = [], 0
+    for crop in crops:
+        bottom = top + crop.shape[0] + 2 * padding
+        mosaic[top:bottom] = _border_colour(crop)
+        mosaic[top + padding:top + padding + crop.shape[0], padding:padding + crop.shape[1]] = crop
+        slots.append((top, bottom))
+        top = bottom
+    return mosaic, slots
+
+def return_regions_content(img, regions, config, lang, padding=10):
+    """
+    Purpose:
+        Reads the text of several regions of the image with a single OCR run.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        regions - dictionary of region names to regions (x, y, w, h), the regions must overlap the image.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+        padding - number of pixels around each region in the mosaic (optional).
+    Returns:
+        Dictionary of the region names to the text read in the region, the lines separated by new lines, without
+        trailing white space.
+    """
+    names = list(regions)
+    mosaic, slots = build_mosaic(img, [regions[name] for name in names], padding)
+    data = return_image_data(mosaic, config, lang)
+    words = data[data['text'] != '']
+    center_y = words['top'] + words['height'] / 2
+    contents = {}
+    for name, (top, bottom) in zip(names, slots):
+        contents[name] = image_data_to_text(words[(center_y >= top) & (center_y < bottom)]).rstrip()
+    return contents
@@ -0,0 +1,205 @@
+"""
+OCR document module.
+
+An OCR document holds the result of a single OCR run (image_to_data) together with an index from word text to the
+bounds of the word, so any number of words can be located without running OCR again.
+"""
+import string
+import unicodedata
+import numpy as np
+from OCRLibrary.utils.imageprocessing.image_processing_generic import get_region_of_interest
+from OCRLibrary.utils.imagereading.image_reading import return_image_outputs, offset_image_data
+from OCRLibrary.utils.imagereading.tiled_reading import image_data_to_text
+
+MATCH_MODES = ('exact', 'ignore_case', 'normalized')
+
+# Outputs returned by create_ocr_outputs, the document replaces the boxes ('data') of return_image_outputs.
+DOCUMENT_OUTPUTS = ('text', 'document', 'hocr', 'alto')
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+_PUNCTUATION = string.punctuation + '‘’“”«»…–—'
+
+def normalize_text(text):
+    """
+    Purpose:
+        Normalizes a word so it can be matched regardless of case, unicode representation and surrounding punctuation.
+    Args:
+        text - the word to normalize.
+    Returns:
+        The normalized word (i.e. '"Ok,' becomes 'ok').
+    """
+    return unicodedata.normalize('NFKC', text).casefold().strip().strip(_PUNCTUATION)
+
+def _match_key(text, match_mode):
+    if match_mode == 'ignore_case':
+        return text.casefold()
+    if match_mode == 'normalized':
+        return normalize_text(text)
+    return text
+
+def hold_image(img, region=None):
+    """
+    Purpose:
+        Returns the pixels of the region of the image as a read only array that is not shared with the caller.
+    Args:
+        img - the image read.
+        region - (x, y, w, h) of the region read, None for the full image (optional).
+    Returns:
+        The read only pixels, the image itself if it already is a read only array owning its pixels (i.e. an image
+        returned by Read Image).
+    """
+    roi = get_region_of_interest(img, region) if region is not None else img
+    if not roi.flags.writeable and roi.flags.owndata:
+        return roi
+    roi = roi.copy()
+    roi.setflags(write=False)
+    return roi
+
+class OCRDocument:
+    """
+    OCRDocument Class
+
+    Result of one OCR run over an image. The words are kept as parallel numpy arrays (text, bounds, centers and
+    confidences) in the order tesseract read them, and indexed by their exact text, their case-folded text or their
+    normalized text. Each index is built the first time its match mode is used (the second time for the exact text, the
+    first exact lookup scans the words), so a document used for a single lookup builds at most one index. A lookup returns the row numbers of the matching words, so the bounds and centers of every
+    match are gathered in one vectorized operation.
+
+    When the image is given, the pixels of the region read (the full image when the region is None) and the shape of the
+    image read are kept so the document can be updated when the image changes (see incremental_reading). The pixels are
+    a read only copy, so transforming the image in place after reading it does not change the document. The text is the
+    text read by the same OCR run, or is rebuilt from the words the first time it is used when it is not given.
+    """
+    def __init__(self, data, config=None, lang=None, min_confidence=None, image=None, region=None, text=None):
+        self.data = data
+        self._text = text
+        self.config = config
+        self.lang = lang
+        self.min_confidence = min_confidence
+        self.image = hold_image(image, region) if image is not None else None
+        self.image_shape = image.shape if image is not None else None
+        self.region = region
+        words = data['text'] != ''
+        if min_confidence is not None:
+            words &= data['conf'] >= min_confidence
+        words = np.flatnonzero(words)
+        self.texts = data['text'][words]
+        self.confidences = data['conf'][words]
+        self.bounds = np.stack((data['left'][words], data['top'][words], data['width'][words], data['height'][words]), axis=1)
+        self.centers = self.bounds[:, :2] + self.bounds[:, 2:] / 2
+        self._indexes = {}
+
+    @property
+    def text(self):
+        """
+        The text read, rebuilt from the words the first time it is used when it was not given.
+        """
+        if self._text is None:
+            self._text = image_data_to_text(self.data)
+        return self._text
+
+    def _index(self, match_mode):
+        """
+        Returns the index of the words by their key in the match mode, built the first time the match mode is used.
+        """
+        index = self._indexes.get(match_mode)
+        if index is None:
+            rows = {}
+            for i, text in enumerate(self.texts.tolist()):
+                rows.setdefault(_match_key(text, match_mode), []).append(i)
+            index = {key: np.array(key_rows, dtype=np.intp) for key, key_rows in rows.items()}
+            self._indexes[match_mode] = index
+        return index
+
+    def __repr__(self):
+        return f'OCRDocument(words={len(self.texts)}, config={self.config!r}, lang={self.lang!r})'
+
+    def within(self, region):
+        """
+        Returns a new OCR document with only the words that are entirely inside the region (x, y, w, h).
+        """
+        x, y, w, h = region
+        data = self.data
+        inside = ((data['left'] >= x) & (data['top'] >= y) &
+            (data['left'] + data['width'] <= x + w) & (data['top'] + data['height'] <= y + h))
+        if self.region is not None:
+            x_end = min(x + w, self.region[0] + self.region[2])
+            y_end = min(y + h, self.region[1] + self.region[3])
+            x, y = max(x, self.region[0]), max(y, self.region[1])
+            w, h = max(x_end - x, 0), max(y_end - y, 0)
+        document = OCRDocument(data[inside], self.config, self.lang, self.min_confidence, region=(x, y, w, h))
+        if self.image is not None:
+            # The pixels of the region are a view of the read only copy of this document, relative to its region.
+            region_x, region_y = (self.region[0], self.region[1]) if self.region is not None else (0, 0)
+            document.image = get_region_of_interest(self.image, (x - region_x, y - region_y, w, h))
+            document.image_shape = self.image_shape
+        return document
+
+    def find(self, text, match_mode='exact'):
+        """
+        Returns the row numbers of every occurrence of the word, in reading order.
+        """
+        if match_mode == 'exact' and match_mode not in self._indexes:
+            # The first exact lookup scans the words, the index is only built when the document is used again.
+            self._indexes[match_mode] = None
+            return np.flatnonzero(self.texts == text)
+        return self._index(match_mode).get(_match_key(text, match_mode), _NO_ROWS)
+
+    def find_bounds(self, text, match_mode='exact'):
+        """
+        Returns the list of bounds (x, y, w, h) of every occurrence of the word, in reading order.
+        """
+        return [tuple(box_bounds) for box_bounds in self.bounds[self.find(text, match_mode)].tolist()]
+
+    def find_centers(self, text, match_mode='exact'):
+        """
+        Returns the list of center coordinates (x, y) of every occurrence of the word, in reading order.
+        """
+        return [tuple(center) for center in self.centers[self.find(text, match_mode)].tolist()]
+
+def create_ocr_outputs(img, config, lang, outputs, min_confidence=None, region=None, keep_image=False):
+    """
+    Purpose:
+        Reads the image once and returns several outputs of the OCR run.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+        outputs - list of outputs to return (see DOCUMENT_OUTPUTS): 'text', 'document', 'hocr' and/or 'alto'.
+        min_confidence - words with a lower confidence (0 to 100) are left out of the document (optional).
+        region - only this region (x, y, w, h) of the image is read, the bounds of the words in the document are still
+                 given in the coordinates of the full image (optional).
+        keep_image - True to keep a copy of the pixels read in the document, so it can be updated (optional). Only
+                     the documents returned to the user are updated, the documents used for a lookup do not copy the image.
+    Returns:
+        Dictionary of each output.
+    """
+    engine_outputs = ['data' if output == 'document' else output for output in outputs]
+    # The text of the document is the text read by the OCR engine when it is cached or read with the boxes, otherwise it
+    # is rebuilt from the boxes, so reading a document never reads a second output.
+    results = return_image_outputs(img, config, lang, engine_outputs, region, optional_outputs=('text',))
+    if 'document' in outputs:
+        data = results.pop('data')
+        if region is not None:
+            data = offset_image_data(data, region[0], region[1])
+        results['document'] = OCRDocument(data, config, lang, min_confidence, img if keep_image else None, region,
+            results.get('text'))
+    return {output: results[output] for output in outputs}
+
+def create_ocr_document(img, config, lang, min_confidence=None, region=None, keep_image=False):
+    """
+    Purpose:
+        Reads the image once and builds an OCR document from the result.
+    Args:
+        img - processed image returned from one of the image processing functions.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+        min_confidence - words with a lower confidence (0 to 100) are left out of the document (optional).
+        region - only this region (x, y, w, h) of the image is read, the bounds of the words are still given in the
+                 coordinates of the full image (optional).
+        keep_image - True to keep a copy of the pixels read in the document, so it can be updated (optional).
+    Returns:
+        OCRDocument of the image.
+    """
+    return create_ocr_outputs(img, config, lang, ('document',), min_confidence, region, keep_image)['document']
@@ -0,0 +1,559 @@
+"""
+OCR engine module.
+
+This module is responsible for the engines that perform the text recognition. Two engines are available:
+    tesseract_api - a long-lived engine that calls the Tesseract C API (libtesseract) through ctypes. The language
+                    models are loaded once per process and kept resident between keyword calls.
+    pytesseract   - runs one tesseract process per call, using the tesseract command configured in pytesseract. The
+                    pixels are piped to tesseract uncompressed (PBM/PGM/PPM) over stdin instead of being written to a
+                    temporary PNG file.
+By default the tesseract_api engine is used when libtesseract can be loaded, otherwise pytesseract is used.
+"""
+import ctypes
+import ctypes.util
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import cv2
+import numpy as np
+import pytesseract as pt
+from OCRLibrary.utils.exceptions.exceptions import InvalidOCREngine
+
+TSV_HEADER = ('level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+    'left', 'top', 'width', 'height', 'conf', 'text')
+
+OCR_DATA_DTYPE = np.dtype([('level', np.int32), ('page_num', np.int32), ('block_num', np.int32), ('par_num', np.int32),
+    ('line_num', np.int32), ('word_num', np.int32), ('left', np.int32), ('top', np.int32), ('width', np.int32),
+    ('height', np.int32), ('conf', np.float32), ('text', object)])
+
+OCR_ENGINE_NAMES = ('auto', 'tesseract_api', 'pytesseract')
+
+# Outputs an engine can return from a single recognition: the text, the boxes (see parse_tsv), hOCR and ALTO XML.
+OCR_OUTPUTS = ('text', 'data', 'hocr', 'alto')
+
+# Tesseract command line config file and output file extension of each output.
+_CLI_OUTPUTS = {'text': ('txt', '.txt'), 'data': ('tsv', '.tsv'), 'hocr': ('hocr', '.hocr'), 'alto': ('alto', '.xml')}
+
+# Document written around the page by the hOCR and ALTO renderers of tesseract (the tesseract command), the C API only
+# returns the page.
+_HOCR_HEADER = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN"\n'
+    '    "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+    ' <head>\n'
+    '  <title></title>\n'
+    '  <meta http-equiv="Content-Type" content="text/html;charset=utf-8"/>\n'
+    "  <meta name='ocr-system' content='tesseract {version}' />\n"
+    "  <meta name='ocr-capabilities' content='ocr_page ocr_carea ocr_par ocr_line ocrx_word ocrp_dir ocrp_lang ocrp_wconf{font_info}'/>\n"
+    ' </head>\n'
+    ' <body>\n')
+_HOCR_FOOTER = ' </body>\n</html>\n'
+_ALTO_HEADER = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:schemaLocation="http://www.loc.gov/standards/alto/ns-v3# http://www.loc.gov/alto/v3/alto-3-0.xsd">\n'
+    '\t<Description>\n'
+    '\t\t<MeasurementUnit>pixel</MeasurementUnit>\n'
+    '\t\t<sourceImageInformation>\n'
+    '\t\t\t<fileName></fileName>\n'
+    '\t\t</sourceImageInformation>\n'
+    '\t\t<OCRProcessing ID="OCR_0">\n'
+    '\t\t\t<ocrProcessingStep>\n'
+    '\t\t\t\t<processingSoftware>\n'
+    '\t\t\t\t\t<softwareName>tesseract {version}</softwareName>\n'
+    '\t\t\t\t</processingSoftware>\n'
+    '\t\t\t</ocrProcessingStep>\n'
+    '\t\t</OCRProcessing>\n'
+    '\t</Description>\n'
+    '\t<Layout>\n')
+_ALTO_FOOTER = '\t</Layout>\n</alto>\n'
+
+_LIBTESSERACT_NAMES = ('tesseract', 'libtesseract.so.5', 'libtesseract.so.4', 'libtesseract.5.dylib',
+    'libtesseract.dylib', 'libtesseract-5.dll', 'libtesseract-4.dll')
+
+def parse_tsv(tsv, has_header=True):
+    """
+    Purpose:
+        Parses tesseract TSV output into a numpy structured array with one record per box (see OCR_DATA_DTYPE).
+        The numeric columns of every row are parsed in a single numpy call instead of one int() per cell.
+    Args:
+        tsv - the TSV output of tesseract.
+        has_header - whether the first row of the TSV output is the header row.
+    Returns:
+        Structured array with the fields level, page_num, block_num, par_num, line_num, word_num, left, top, width,
+        height, conf and text.
+    """
+    text_index = len(TSV_HEADER) - 1
+    numeric_rows = []
+    texts = []
+    for row in tsv.split('\n')[1 if has_header else 0:]:
+        tabs = row.count('\t')
+        if tabs == text_index - 1:
+            # The text cell of the last row is missing when the text is empty.
+            numeric_rows.append(row)
+            texts.append('')
+        elif tabs >= text_index:
+            numeric_row, _, text = row.rpartition('\t')
+            numeric_rows.append(numeric_row)
+            texts.append(text)
+    data = np.zeros(len(texts), dtype=OCR_DATA_DTYPE)
+    if not texts:
+        return data
+    numbers = np.fromstring('\t'.join(numeric_rows), sep='\t').reshape(-1, text_index)
+    for i, column in enumerate(TSV_HEADER[:text_index]):
+        data[column] = numbers[:, i]
+    data['text'] = texts
+    return data
+
+def parse_config(config):
+    """
+    Purpose:
+        Parses a pytesseract configuration string into the settings understood by the tesseract_api engine.
+    Args:
+        config - configuration string (i.e. '--psm 6 -c tessedit_char_whitelist=0123456789').
+    Returns:
+        Dictionary of the parsed settings, or None if the configuration contains an option the tesseract_api engine
+        cannot apply (the call should then go through pytesseract).
+    """
+    settings = {'psm': 3, 'oem': 3, 'datapath': None, 'dpi': None, 'variables': []}
+    try:
+        tokens = shlex.split(config or '', posix=sys.platform != 'win32')
+    except ValueError:
+        return None
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        try:
+            if token == '--psm':
+                settings['psm'] = int(tokens[i + 1])
+                i += 2
+            elif token == '--oem':
+                settings['oem'] = int(tokens[i + 1])
+                i += 2
+            elif token == '--dpi':
+                settings['dpi'] = int(tokens[i + 1])
+                i += 2
+            elif token == '--tessdata-dir':
+                settings['datapath'] = tokens[i + 1]
+                i += 2
+            elif token == '-c':
+                name, value = tokens[i + 1].split('=', 1)
+                settings['variables'].append((name, value))
+                i += 2
+            elif token.startswith('-c') and '=' in token:
+                name, value = token[2:].split('=', 1)
+                settings['variables'].append((name, value))
+                i += 1
+            else:
+                return None
+        except (IndexError, ValueError):
+            return None
+    settings['variables'] = tuple(settings['variables'])
+    return settings
+
+def hocr_document(page, version, font_info=False):
+    """
+    Purpose:
+        Wraps the hOCR of a page returned by the C API in the document written by the hOCR renderer of tesseract.
+    Args:
+        page - the hOCR of the page (TessBaseAPIGetHOCRText).
+        version - the version of tesseract.
+        font_info - True if the font information is in the page (hocr_font_info variable).
+    Returns:
+        The hOCR document.
+    """
+    font_capabilities = ' ocrp_font ocrp_fsize' if font_info else ''
+    return _HOCR_HEADER.format(version=version, font_info=font_capabilities) + page + _HOCR_FOOTER
+
+def alto_document(page, version):
+    """
+    Purpose:
+        Wraps the ALTO XML of a page returned by the C API in the document written by the ALTO renderer of tesseract.
+    Args:
+        page - the ALTO XML of the page (TessBaseAPIGetAltoText).
+        version - the version of tesseract.
+    Returns:
+        The ALTO XML document.
+    """
+    return _ALTO_HEADER.format(version=version) + page + _ALTO_FOOTER
+
+def encode_pnm(img):
+    """
+    Purpose:
+        Encodes an image in the uncompressed netpbm format read by tesseract.
+    Args:
+        img - uint8 image with 1 or 3 channels.
+    Returns:
+        The encoded image, or None if the image cannot be encoded. Binary images (only 0 and 255) are encoded as 1 bit
+        per pixel PBM, other grayscale images as PGM and colour images as PPM. Colour images are encoded with their
+        channels in BGR order, the same data pytesseract hands to tesseract for an image read by OpenCV.
+    """
+    if getattr(img, 'dtype', None) is None or img.dtype.name != 'uint8' or img.size == 0:
+        return None
+    if img.ndim == 3 and img.shape[2] == 1:
+        img = img[:, :, 0]
+    height, width = img.shape[:2]
+    if img.ndim == 2:
+        if cv2.countNonZero(cv2.inRange(img, 1, 254)) == 0:
+            # PBM pixels are 1 for black, each row is padded to a whole byte.
+            return b'P4\n%d %d\n' % (width, height) + np.packbits(img == 0, axis=1).tobytes()
+        return b'P5\n%d %d\n255\n' % (width, height) + np.ascontiguousarray(img).tobytes()
+    if img.ndim == 3 and img.shape[2] == 3:
+        return b'P6\n%d %d\n255\n' % (width, height) + np.ascontiguousarray(img).tobytes()
+    return None
+
+class PytesseractEngine:
+    """
+    PytesseractEngine Class
+
+    Runs one tesseract process per call. The image is piped to tesseract over stdin and the result read from stdout,
+    so no file is written. Images that cannot be encoded as netpbm go through pytesseract.
+    """
+    name = 'pytesseract'
+    # Several outputs of one run are written to temporary files, so outputs are only read when requested.
+    paired_outputs = ()
+
+    @staticmethod
+    def _run(pnm, config, lang, output_base='stdout', config_files=()):
+        """
+        Runs tesseract on the encoded image and returns its standard output.
+        """
+        command = [pt.pytesseract.tesseract_cmd, 'stdin', output_base]
+        if lang:
+            command += ['-l', lang]
+        command += shlex.split(config or '', posix=sys.platform != 'win32')
+        command += list(config_files)
+        try:
+            process = subprocess.run(command, input=pnm, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        except OSError as error:
+            raise pt.TesseractNotFoundError() from error
+        if process.returncode:
+            raise pt.TesseractError(process.returncode, process.stderr.decode('utf-8', 'ignore').strip())
+        return process.stdout.decode('utf-8')
+
+    @staticmethod
+    def _recognize_with_pytesseract(img, config, lang, output):
+        if output == 'text':
+            return pt.image_to_string(img, config=config, lang=lang)
+        if output == 'data':
+            return pt.image_to_data(img, output_type=pt.Output.STRING, config=config, lang=lang)
+        if output == 'hocr':
+            return pt.image_to_pdf_or_hocr(img, extension='hocr', config=config, lang=lang).decode('utf-8')
+        return pt.image_to_alto_xml(img, config=config, lang=lang).decode('utf-8')
+
+    def recognize(self, img, config, lang, outputs):
+        """
+        Returns a dictionary with each of the outputs (see OCR_OUTPUTS) found in the image. A single output is read
+        from the standard output of tesseract, several outputs are written by one tesseract run to a temporary directory.
+        """
+        pnm = encode_pnm(img)
+        if pnm is None:
+            results = {output: self._recognize_with_pytesseract(img, config, lang, output) for output in outputs}
+        elif len(outputs) == 1:
+            config_file = _CLI_OUTPUTS[outputs[0]][0]
+            results = {outputs[0]: self._run(pnm, config, lang, config_files=() if config_file == 'txt' else (config_file,))}
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                output_base = os.path.join(directory, 'ocr')
+                self._run(pnm, config, lang, output_base, [_CLI_OUTPUTS[output][0] for output in outputs])
+                results = {}
+                for output in outputs:
+                    with open(output_base + _CLI_OUTPUTS[output][1], encoding='utf-8') as output_file:
+                        results[output] = output_file.read()
+        if 'data' in results:
+            results['data'] = parse_tsv(results['data'])
+        return results
+
+    def image_to_string(self, img, config, lang):
+        """
+        Returns the text found in the image.
+        """
+        return self.recognize(img, config, lang, ('text',))['text']
+
+    def image_to_data(self, img, config, lang):
+        """
+        Returns the boxes found in the image as a structured array (see parse_tsv).
+        """
+        return self.recognize(img, config, lang, ('data',))['data']
+
+    def close(self):
+        """
+        Nothing is kept alive between calls.
+        """
+
+class TesseractAPIEngine:
+    """
+    TesseractAPIEngine Class
+
+    Keeps initialized TessBaseAPI handles alive between calls. Handles are pooled per (datapath, lang, oem, variables)
+    so the traineddata is only loaded the first time a configuration is used. A handle is only used by one thread
+    at a time, concurrent callers get their own handle.
+    """
+    name = 'tesseract_api'
+    max_idle_handles = 8
+    # Outputs taken together from a single recognition, reading the text and then the boxes of the same image (or the
+    # opposite) only recognizes the image once.
+    paired_outputs = ('text', 'data')
+
+    def __init__(self, lib_path=None):
+        self._lib = self._load_library(lib_path)
+        self.version = self._lib.TessVersion().decode('utf-8')
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._fallback = PytesseractEngine()
+
+    @staticmethod
+    def _load_library(lib_path):
+        """
+        Loads libtesseract and declares the prototypes of the C API functions used by the engine.
+        """
+        candidates = [lib_path] if lib_path else [os.environ.get('OCRLIBRARY_LIBTESSERACT')]
+        if not lib_path:
+            candidates += [ctypes.util.find_library('tesseract')] + list(_LIBTESSERACT_NAMES)
+        lib = None
+        for candidate in candidates:
+            if not candidate:
+                continue
+            try:
+                lib = ctypes.CDLL(candidate)
+                break
+            except OSError:
+                continue
+        if lib is None:
+            raise OSError("libtesseract could not be loaded.")
+        handle = ctypes.c_void_p
+        lib.TessBaseAPICreate.restype = handle
+        lib.TessBaseAPICreate.argtypes = []
+        lib.TessBaseAPIInit2.restype = ctypes.c_int
+        lib.TessBaseAPIInit2.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        lib.TessBaseAPISetVariable.restype = ctypes.c_int
+        lib.TessBaseAPISetVariable.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p]
+        lib.TessBaseAPISetPageSegMode.restype = None
+        lib.TessBaseAPISetPageSegMode.argtypes = [handle, ctypes.c_int]
+        lib.TessBaseAPISetImage.restype = None
+        lib.TessBaseAPISetImage.argtypes = [handle, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.TessBaseAPISetSourceResolution.restype = None
+        lib.TessBaseAPISetSourceResolution.argtypes = [handle, ctypes.c_int]
+        lib.TessBaseAPIRecognize.restype = ctypes.c_int
+        lib.TessBaseAPIRecognize.argtypes = [handle, ctypes.c_void_p]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        lib.TessBaseAPIGetUTF8Text.argtypes = [handle]
+        lib.TessBaseAPIGetTsvText.restype = ctypes.c_void_p
+        lib.TessBaseAPIGetTsvText.argtypes = [handle, ctypes.c_int]
+        lib.TessBaseAPIGetHOCRText.restype = ctypes.c_void_p
+        lib.TessBaseAPIGetHOCRText.argtypes = [handle, ctypes.c_int]
+        if hasattr(lib, 'TessBaseAPIGetAltoText'):
+            lib.TessBaseAPIGetAltoText.restype = ctypes.c_void_p
+            lib.TessBaseAPIGetAltoText.argtypes = [handle, ctypes.c_int]
+        lib.TessVersion.restype = ctypes.c_char_p
+        lib.TessVersion.argtypes = []
+        lib.TessDeleteText.restype = None
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIClear.restype = None
+        lib.TessBaseAPIClear.argtypes = [handle]
+        lib.TessBaseAPIEnd.restype = None
+        lib.TessBaseAPIEnd.argtypes = [handle]
+        lib.TessBaseAPIDelete.restype = None
+        lib.TessBaseAPIDelete.argtypes = [handle]
+        return lib
+
+    def _acquire(self, key):
+        """
+        Returns an idle handle initialized for the key, or initializes a new one.
+        """
+        with self._lock:
+            handles = self._idle.get(key)
+            if handles:
+                return handles.pop()
+        datapath, lang, oem, variables = key
+        handle = self._lib.TessBaseAPICreate()
+        encoded_datapath = datapath.encode() if datapath else None
+        if self._lib.TessBaseAPIInit2(handle, encoded_datapath, lang.encode(), oem) != 0:
+            self._lib.TessBaseAPIDelete(handle)
+            return None
+        for name, value in variables:
+            if not self._lib.TessBaseAPISetVariable(handle, name.encode(), value.encode()):
+                self._destroy(handle)
+                return None
+        return handle
+
+    def _release(self, key, handle):
+        """
+        Returns the handle to the pool of idle handles.
+        """
+        self._lib.TessBaseAPIClear(handle)
+        with self._lock:
+            idle_count = sum(len(handles) for handles in self._idle.values())
+            if idle_count < self.max_idle_handles:
+                self._idle.setdefault(key, []).append(handle)
+                return
+        self._destroy(handle)
+
+    def _destroy(self, handle):
+        self._lib.TessBaseAPIEnd(handle)
+        self._lib.TessBaseAPIDelete(handle)
+
+    def _take_text(self, pointer):
+        """
+        Copies a string allocated by tesseract and frees it.
+        """
+        if not pointer:
+            return ''
+        try:
+            return ctypes.string_at(pointer).decode('utf-8')
+        finally:
+            self._lib.TessDeleteText(pointer)
+
+    @staticmethod
+    def _image_layout(img):
+        """
+        Returns the image (made row contiguous if needed) and its layout as (width, height, bytes per pixel,
+        bytes per line), or None if the image cannot be passed to the C API.
+
+        Colour images are passed with their channels in BGR order, this is the same data pytesseract hands to
+        tesseract for an image read by OpenCV, so both engines recognize the same pixels.
+        """
+        if getattr(img, 'dtype', None) is None or img.dtype.name != 'uint8' or img.ndim not in (2, 3):
+            return None
+        channels = 1 if img.ndim == 2 else img.shape[2]
+        if channels not in (1, 3, 4):
+            return None
+        if img.strides[1] != channels or (img.ndim == 3 and img.strides[2] != 1) or img.strides[0] <= 0:
+            img = img.copy()
+        return img, (img.shape[1], img.shape[0], channels, img.strides[0])
+
+    def _getter(self, output):
+        """
+        Returns the C API function returning the output of the last recognition, or None if libtesseract has none.
+        """
+        if output == 'text':
+            return self._lib.TessBaseAPIGetUTF8Text
+        if output == 'data':
+            return lambda handle: self._lib.TessBaseAPIGetTsvText(handle, 0)
+        if output == 'hocr':
+            return lambda handle: self._lib.TessBaseAPIGetHOCRText(handle, 0)
+        if hasattr(self._lib, 'TessBaseAPIGetAltoText'):
+            return lambda handle: self._lib.TessBaseAPIGetAltoText(handle, 0)
+        return None
+
+    def _recognize(self, img, config, lang, getters):
+        """
+        Recognizes the image once and returns the output of each getter, or None if the call must go through
+        the fallback engine.
+        """
+        settings = parse_config(config)
+        image_layout = self._image_layout(img)
+        if settings is None or image_layout is None or None in getters:
+            return None
+        img, (width, height, bytes_per_pixel, bytes_per_line) = image_layout
+        key = (settings['datapath'], lang or 'eng', settings['oem'], settings['variables'])
+        handle = self._acquire(key)
+        if handle is None:
+            return None
+        try:
+            self._lib.TessBaseAPISetPageSegMode(handle, settings['psm'])
+            self._lib.TessBaseAPISetImage(handle, img.ctypes.data, width, height, bytes_per_pixel, bytes_per_line)
+            if settings['dpi']:
+                self._lib.TessBaseAPISetSourceResolution(handle, settings['dpi'])
+            if self._lib.TessBaseAPIRecognize(handle, None) != 0:
+                return None
+            return [self._take_text(getter(handle)) for getter in getters]
+        finally:
+            self._release(key, handle)
+
+    def recognize(self, img, config, lang, outputs):
+        """
+        Returns a dictionary with each of the outputs (see OCR_OUTPUTS) found in the image. The image is recognized
+        once, then each output is taken from the result of the recognition. The hOCR and ALTO XML are complete documents,
+        as written by the tesseract command.
+        """
+        result = self._recognize(img, config, lang, [self._getter(output) for output in outputs])
+        if result is None:
+            return self._fallback.recognize(img, config, lang, outputs)
+        results = dict(zip(outputs, result))
+        if 'data' in results:
+            results['data'] = parse_tsv(results['data'], has_header=False)
+        if 'hocr' in results:
+            font_info = any(name == 'hocr_font_info' and value.strip().lower() in ('1', 't', 'true')
+                for name, value in parse_config(config)['variables'])
+            results['hocr'] = hocr_document(results['hocr'], self.version, font_info)
+        if 'alto' in results:
+            results['alto'] = alto_document(results['alto'], self.version)
+        return results
+
+    def image_to_string(self, img, config, lang):
+        """
+        Returns the text found in the image.
+        """
+        return self.recognize(img, config, lang, ('text',))['text']
+
+    def image_to_data(self, img, config, lang):
+        """
+        Returns the boxes found in the image as a structured array (see parse_tsv).
+        """
+        return self.recognize(img, config, lang, ('data',))['data']
+
+    def close(self):
+        """
+        Frees every idle handle.
+        """
+        with self._lock:
+            handles = [handle for idle in self._idle.values() for handle in idle]
+            self._idle = {}
+        for handle in handles:
+            self._destroy(handle)
+
+_engine = None
+_engine_name = 'auto'
+_engine_lock = threading.Lock()
+
+def create_ocr_engine(name):
+    """
+    Purpose:
+        Creates the OCR engine with the given name.
+    Args:
+        name - one of OCR_ENGINE_NAMES.
+    Returns:
+        The OCR engine. For 'auto' the tesseract_api engine is returned when libtesseract can be loaded, otherwise
+        the pytesseract engine.
+    """
+    if name == 'pytesseract':
+        return PytesseractEngine()
+    try:
+        return TesseractAPIEngine()
+    except (OSError, AttributeError) as error:
+        if name == 'tesseract_api':
+            raise InvalidOCREngine(f"The tesseract_api OCR engine is not available: {error}") from error
+        return PytesseractEngine()
+
+def get_ocr_engine():
+    """
+    Purpose:
+        Returns the OCR engine used by all the image reading functions. The engine is created on first use.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = create_ocr_engine(_engine_name)
+        return _engine
+
+def set_ocr_engine(name):
+    """
+    Purpose:
+        Selects the OCR engine used by all the image reading functions.
+    Args:
+        name - one of OCR_ENGINE_NAMES.
+    Returns:
+        The name of the engine that is now in use.
+    """
+    global _engine, _engine_name
+    engine = create_ocr_engine(name)
+    with _engine_lock:
+        previous_engine = _engine
+        _engine = engine
+        _engine_name = name
+    if previous_engine is not None:
+        previous_engine.close()
+    return engine.name
@@ -2,67 +2,48 @@
 Text locating module.
 """
 
-from pytesseract import image_to_data, Output
+from OCRLibrary.utils.imagereading.ocr_document import OCRDocument, create_ocr_document
 
-def return_text_coordinates(img, text, pyt_conf, lang):
+def _get_document(img, pyt_conf, lang, region):
+    """
+    Returns the OCR document of the image. If an OCR document is given it is used as is, limited to the region if any.
+    """
+    if isinstance(img, OCRDocument):
+        return img if region is None else img.within(region)
+    return create_ocr_document(img, pyt_conf, lang, region=region)
+
+def return_text_coordinates(img, text, pyt_conf, lang, match_mode='exact', region=None):
     """
     This keyword is find the coordinates of text in an image.
     """
-    data = image_to_data(img, output_type=Output.DICT, config=pyt_conf, lang=lang)
-    boxes = len(data['level'])
-    for i in range(boxes):
-        text_from_image = data['text'][i]
-        if text_from_image == text:
-            box_bounds = (int(data['left'][i]), int(data['top'][i]), int(data['width'][i]), int(data['height'][i]))
-            x = box_bounds[0] + box_bounds[2]/2
-            y = box_bounds[1] + box_bounds[3]/2
-            return x, y
-    return None
+    list_of_coordinates = _get_document(img, pyt_conf, lang, region).find_centers(text, match_mode)
+    if not list_of_coordinates:
+        return None
+    return list_of_coordinates[0]
 
-def return_multiple_text_coordinates(img, text, pyt_conf, lang):
+def return_multiple_text_coordinates(img, text, pyt_conf, lang, match_mode='exact', region=None):
     """
     To be used when there are multiple occurrences of the same text you wish to find.
     """
-    data = image_to_data(img, output_type=Output.DICT, config=pyt_conf, lang=lang)
-    boxes = len(data['level'])
-    list_of_coordinates = []
-    for i in range(boxes):
-        text_from_image = data['text'][i]
-        if text_from_image == text:
-            box_bounds = (int(data['left'][i]), int(data['top'][i]), int(data['width'][i]), int(data['height'][i]))
-            x = box_bounds[0] + box_bounds[2]/2
-            y = box_bounds[1] + box_bounds[3]/2
-            coordinates = (x, y)
-            list_of_coordinates.append(coordinates)
+    list_of_coordinates = _get_document(img, pyt_conf, lang, region).find_centers(text, match_mode)
     if not list_of_coordinates:
         return None
     return list_of_coordinates
 
-def return_text_bounds(img, text, pyt_conf, lang):
+def return_text_bounds(img, text, pyt_conf, lang, match_mode='exact', region=None):
     """
     This keyword is find the coordinates of text in an image.
     """
-    data = image_to_data(img, output_type=Output.DICT, config=pyt_conf, lang=lang)
-    boxes = len(data['level'])
-    for i in range(boxes):
-        text_from_image = data['text'][i]
-        if text_from_image == text:
-            box_bounds = (int(data['left'][i]), int(data['top'][i]), int(data['width'][i]), int(data['height'][i]))
-            return box_bounds
-    return None
+    list_of_box_bounds = _get_document(img, pyt_conf, lang, region).find_bounds(text, match_mode)
+    if not list_of_box_bounds:
+        return None
+    return list_of_box_bounds[0]
 
-def return_multiple_text_bounds(img, text, pyt_conf, lang):
+def return_multiple_text_bounds(img, text, pyt_conf, lang, match_mode='exact', region=None):
     """
     To be used when there are multiple occurrences of the same text you wish to find.
     """
-    data = image_to_data(img, output_type=Output.DICT, config=pyt_conf, lang=lang)
-    boxes = len(data['level'])
-    list_of_box_bounds = []
-    for i in range(boxes):
-        text_from_image = data['text'][i]
-        if text_from_image == text:
-            box_bounds = (int(data['left'][i]), int(data['top'][i]), int(data['width'][i]), int(data['height'][i]))
-            list_of_box_bounds.append(box_bounds)
+    list_of_box_bounds = _get_document(img, pyt_conf, lang, region).find_bounds(text, match_mode)
     if not list_of_box_bounds:
         return None
     return list_of_box_bounds
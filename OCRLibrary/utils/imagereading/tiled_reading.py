@@ -0,0 +1,194 @@
+"""
+Tiled reading module.
+
+This module is responsible for reading very large images in overlapping tiles. The tiles are read in parallel and the
+words found in each tile are merged back into a single result:
+    - the image is partitioned between the tiles, the boundaries being in the middle of the overlaps. A word is only taken
+      from the tile owning its center, so words cut at the edge of a tile are taken from the neighbouring tile instead.
+    - words read by two tiles with their center on each side of a boundary are found twice, the duplicate with the lower
+      confidence is dropped.
+The overlap must therefore be larger than the largest word in the image.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from OCRLibrary.utils.imagereading.ocr_engine import OCR_DATA_DTYPE
+
+# Tiling used by the image reading functions. A tile size of 0 disables tiling.
+OCR_TILING = {'tile_size': 0, 'overlap': 100, 'workers': None}
+
+def set_ocr_tiling(tile_size, overlap, workers=None):
+    """
+    Purpose:
+        Sets the tiling used by the image reading functions.
+    Args:
+        tile_size - width and height of the tiles in pixels, 0 disables tiling.
+        overlap - number of pixels shared by neighbouring tiles.
+        workers - number of tiles read in parallel, defaults to the number of CPUs (optional).
+    """
+    OCR_TILING['tile_size'] = tile_size
+    OCR_TILING['overlap'] = overlap
+    OCR_TILING['workers'] = workers
+
+def use_tiling(img):
+    """
+    Purpose:
+        Returns True if tiling is enabled and the image is larger than a tile.
+    """
+    tile_size = OCR_TILING['tile_size']
+    return tile_size > 0 and (img.shape[0] > tile_size or img.shape[1] > tile_size)
+
+def _split(length, tile_size, overlap):
+    """
+    Splits one axis of the image in overlapping spans. Returns a list of (start, size, owned_start, owned_end) where the
+    owned part of each span ends in the middle of its overlap with the next span.
+    """
+    if length <= tile_size:
+        return [(0, length, 0, length)]
+    step = max(tile_size - overlap, 1)
+    starts = list(range(0, length - tile_size, step)) + [length - tile_size]
+    bounds = [0] + [(start + starts[i] + tile_size) // 2 for i, start in enumerate(starts[1:])] + [length]
+    return [(start, tile_size, bounds[i], bounds[i + 1]) for i, start in enumerate(starts)]
+
+def get_tiles(width, height, tile_size, overlap):
+    """
+    Purpose:
+        Splits an image into overlapping tiles.
+    Args:
+        width - width of the image.
+        height - height of the image.
+        tile_size - width and height of the tiles.
+        overlap - number of pixels shared by neighbouring tiles.
+    Returns:
+        List of (tile, owned) where tile is the (x, y, w, h) of the tile and owned the (x, y, w, h) of the part of the image
+        owned by the tile. The owned parts do not overlap and cover the image, a word is taken from the tile owning its center.
+    """
+    return [((x, y, w, h), (x0, y0, x1 - x0, y1 - y0))
+            for y, h, y0, y1 in _split(height, tile_size, overlap)
+            for x, w, x0, x1 in _split(width, tile_size, overlap)]
+
+def _read_tile(engine, img, tile, owned, config, lang):
+    """
+    Reads one tile and returns the words whose center is in the part of the image owned by the tile, translated to the
+    coordinates of the image.
+    """
+    x, y, w, h = tile
+    data = engine.image_to_data(img[y:y + h, x:x + w], config, lang)
+    data = data[data['text'] != ''].copy()
+    data['left'] += x
+    data['top'] += y
+    center_x = data['left'] + data['width'] / 2
+    center_y = data['top'] + data['height'] / 2
+    owned_x, owned_y, owned_w, owned_h = owned
+    inside = ((center_x >= owned_x) & (center_x < owned_x + owned_w) &
+        (center_y >= owned_y) & (center_y < owned_y + owned_h))
+    return data[inside]
+
+def _crosses(start, end, boundaries):
+    """
+    Returns True for each span (start, end) that has one of the sorted boundaries strictly inside.
+    """
+    return np.searchsorted(boundaries, end, side='left') > np.searchsorted(boundaries, start, side='right')
+
+def _remove_duplicates(data, tiles):
+    """
+    Drops words found twice in the overlap of two tiles (same text, boxes overlapping by more than half), the word
+    with the highest confidence is kept. This happens when the center of a word is read on each side of the boundary
+    between two owned parts. The centers of the two words being on each side of the boundary, boxes overlapping by more
+    than half both cross the boundary, so only the words crossing a boundary between owned parts are compared.
+    """
+    x_boundaries = np.unique([owned[0] for _, owned in tiles if owned[0] > 0])
+    y_boundaries = np.unique([owned[1] for _, owned in tiles if owned[1] > 0])
+    candidates = (_crosses(data['left'], data['left'] + data['width'], x_boundaries) |
+        _crosses(data['top'], data['top'] + data['height'], y_boundaries))
+    keep = np.ones(len(data), dtype=bool)
+    keep[candidates] = _keep_best_words(data[candidates])
+    return data[keep]
+
+def _keep_best_words(data):
+    """
+    Returns True for the words kept, the words with a duplicate of a higher confidence are dropped.
+    """
+    order = np.argsort(-data['conf'], kind='stable')
+    data = data[order]
+    left, top = data['left'], data['top']
+    right, bottom = left + data['width'], top + data['height']
+    area = (data['width'] * data['height']).astype(np.float64)
+    keep = np.ones(len(data), dtype=bool)
+    for i in range(len(data)):
+        if not keep[i]:
+            continue
+        overlap_w = np.minimum(right[i], right[i + 1:]) - np.maximum(left[i], left[i + 1:])
+        overlap_h = np.minimum(bottom[i], bottom[i + 1:]) - np.maximum(top[i], top[i + 1:])
+        intersection = np.clip(overlap_w, 0, None) * np.clip(overlap_h, 0, None)
+        union = area[i] + area[i + 1:] - intersection
+        duplicates = (intersection > 0.5 * np.maximum(union, 1)) & (data['text'][i + 1:] == data['text'][i])
+        keep[i + 1:] &= ~duplicates
+    kept = np.empty(len(data), dtype=bool)
+    kept[order] = keep
+    return kept
+
+def number_lines(data):
+    """
+    Purpose:
+        Sorts words read separately (i.e. in different tiles) in reading order and numbers them by line. Words are on
+        the same line when their vertical center is inside the first word of the line.
+    Args:
+        data - structured array of words (see OCR_DATA_DTYPE).
+    Returns:
+        Structured array of the words in reading order, with one block and one paragraph.
+    """
+    data = data[np.lexsort((data['left'], data['top']))]
+    line_num = np.zeros(len(data), dtype=np.int32)
+    line_top, line_bottom, line = None, None, 0
+    for i, (top, height) in enumerate(zip(data['top'].tolist(), data['height'].tolist())):
+        center = top + height / 2
+        if line_top is None or not line_top <= center <= line_bottom:
+            line += 1
+            line_top, line_bottom = top, top + height
+        line_num[i] = line
+    data['line_num'] = line_num
+    data = data[np.lexsort((data['left'], data['line_num']))]
+    word_num = np.ones(len(data), dtype=np.int32)
+    for i in range(1, len(data)):
+        if data['line_num'][i] == data['line_num'][i - 1]:
+            word_num[i] = word_num[i - 1] + 1
+    data['word_num'] = word_num
+    data['level'] = 5
+    data['page_num'] = 1
+    data['block_num'] = 1
+    data['par_num'] = 1
+    return data
+
+def read_tiled_image_data(engine, img, config, lang):
+    """
+    Purpose:
+        Reads the image tile by tile in parallel and merges the words found.
+    Args:
+        engine - the OCR engine.
+        img - processed image returned from one of the image processing functions.
+        config - configuration to read the image.
+        lang - the language of the text to read.
+    Returns:
+        Structured array (see OCR_DATA_DTYPE) with one record per word, numbered by line in reading order.
+    """
+    tiles = get_tiles(img.shape[1], img.shape[0], OCR_TILING['tile_size'], OCR_TILING['overlap'])
+    workers = OCR_TILING['workers'] or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(tiles))) as executor:
+        tiles_data = list(executor.map(lambda tile: _read_tile(engine, img, tile[0], tile[1], config, lang), tiles))
+    data = np.concatenate(tiles_data) if tiles_data else np.zeros(0, dtype=OCR_DATA_DTYPE)
+    return number_lines(_remove_duplicates(data, tiles))
+
+def image_data_to_text(data):
+    """
+    Purpose:
+        Rebuilds the text of an image from its words (see read_tiled_image_data and return_image_data).
+    Returns:
+        The words of each line separated by spaces, and the lines separated by new lines.
+    """
+    lines = {}
+    words = data[data['text'] != '']
+    line_keys = zip(words['page_num'].tolist(), words['block_num'].tolist(), words['par_num'].tolist(), words['line_num'].tolist())
+    for line_key, text in zip(line_keys, words['text'].tolist()):
+        lines.setdefault(line_key, []).append(text)
+    return '\n'.join(' '.join(words) for _, words in sorted(lines.items())) + '\n'
@@ -9,17 +9,30 @@ from .test_binary_image_transformation_keywords \
 
 from .test_changing_colourspace_tranformation_keywords \
     import (TestKeywordConvertImageToGrayScale, TestKeywordCovertImageToHSV, TestKeywordMaskColour,
-    TestKeywordMaskColours)
+    TestKeywordMaskColours, TestKeywordMaskColourRanges)
 
 from .test_content_location_keywords \
     import (TestKeywordLocateTextCoordinates, TestKeywordLocateMultipleTextCoordinates, TestKeywordLocateTextBounds,
-    TestKeywordLocateMultipleTextBounds)
+    TestKeywordLocateMultipleTextBounds, TestKeywordGetOCRDocument, TestKeywordLocateTextInImages,
+    TestKeywordUpdateOCRDocument, TestKeywordLocateColourRegions, TestKeywordLocateImageTemplate,
+    TestKeywordLocateAllImageTemplates)
 
 from .test_content_validation_keywords \
-    import (TestKeywordValidateImageContent)
+    import (TestKeywordValidateImageContent, TestKeywordGetImagesContent, TestKeywordGetImageOCROutputs,
+    TestKeywordReadTextInColourRegions, TestKeywordReadTextInRegions)
+
+from .test_content_waiting_keywords \
+    import (TestKeywordWaitUntilTextIsVisible, TestKeywordWaitUntilTextDisappears)
+
+from .test_image_pipeline_keywords \
+    import (TestKeywordApplyPipeline)
+
+from .test_ocr_configuration_keywords \
+    import (TestKeywordSetOCREngine, TestKeywordSetOCRCacheSize, TestKeywordGetOCRCacheStatistics,
+    TestKeywordSetOCRTiling, TestKeywordSetOCRLineDetection, TestOCREngineParsing)
 
 from .test_read_and_save_images_keywords \
-    import (TestKeywordReadImage, TestKeywordSaveImage)
+    import (TestKeywordReadImage, TestKeywordReadImageFromBytes, TestKeywordReadImageFromBase64, TestKeywordSaveImage)
 
 from .test_smoothing_image_transformation_keywords \
     import (TestKeywordAppyFilter2DToImage, TestKeywordApplyMedianFilteringToImage, TestKeywordApplyAveragingBlurToImage,
@@ -40,12 +53,34 @@ __all__ = [
     "TestKeywordCovertImageToHSV",
     "TestKeywordMaskColour",
     "TestKeywordMaskColours",
+    "TestKeywordMaskColourRanges",
     "TestKeywordLocateTextCoordinates",
     "TestKeywordLocateMultipleTextCoordinates",
     "TestKeywordLocateTextBounds",
     "TestKeywordLocateMultipleTextBounds",
+    "TestKeywordGetOCRDocument",
+    "TestKeywordUpdateOCRDocument",
+    "TestKeywordLocateTextInImages",
+    "TestKeywordLocateColourRegions",
+    "TestKeywordLocateImageTemplate",
+    "TestKeywordLocateAllImageTemplates",
     "TestKeywordValidateImageContent",
+    "TestKeywordGetImagesContent",
+    "TestKeywordGetImageOCROutputs",
+    "TestKeywordReadTextInColourRegions",
+    "TestKeywordReadTextInRegions",
+    "TestKeywordWaitUntilTextIsVisible",
+    "TestKeywordWaitUntilTextDisappears",
+    "TestKeywordApplyPipeline",
+    "TestKeywordSetOCREngine",
+    "TestKeywordSetOCRCacheSize",
+    "TestKeywordGetOCRCacheStatistics",
+    "TestKeywordSetOCRTiling",
+    "TestKeywordSetOCRLineDetection",
+    "TestOCREngineParsing",
     "TestKeywordReadImage",
+    "TestKeywordReadImageFromBytes",
+    "TestKeywordReadImageFromBase64",
     "TestKeywordSaveImage",
     "TestKeywordAppyFilter2DToImage",
     "TestKeywordApplyMedianFilteringToImage",
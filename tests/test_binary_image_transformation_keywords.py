@@ -7,6 +7,7 @@ import numpy as np
 
 from OCRLibrary.keywords.binary_image_transformation import ImageThresholdingKeywords as itk
 from OCRLibrary.keywords.binary_image_transformation import MorphologicalTransformationKeywords  as mtk
+from OCRLibrary.utils.imageprocessing.imagetransformation.structuring_element import get_kernel
 from OCRLibrary.utils.exceptions.exceptions \
     import (InvalidImagePath, InvalidThresholdValue, InvalidKernelSize, InvalidKernelType, InvalidIteration, InvalidImageArgument)
 
@@ -80,6 +81,17 @@ class TestKeywordGetBinaryImage(BaseImageThresholdingKeywords):
         with self.assertRaises(InvalidThresholdValue):
             self.keyword.get_binary_image(self.img_path, False, False, None, 127)
 
+    def test_04_get_binary_image(self):
+        """
+        Images already read (colour or gray scale) give the same result as the image path.
+        """
+        image = cv2.imread(self.img_path)
+        expected_image = self.keyword.get_binary_image(self.img_path)
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_binary_image(image)))
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_binary_image(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))))
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.get_binary_image(np.zeros((10, 10, 2), dtype=np.uint8))
+
 class TestKeywordGetToZeroImage(BaseImageThresholdingKeywords):
     """
     TestKeywordGetToZeroImage Class
@@ -118,6 +130,29 @@ class TestKeywordGetToZeroImage(BaseImageThresholdingKeywords):
         with self.assertRaises(InvalidThresholdValue):
             self.keyword.get_to_zero_image(self.img_path, False, False, None, 127)
 
+    def test_04_get_to_zero_image(self):
+        """
+        Images already read (colour or gray scale) give the same result as the image path.
+        """
+        image = cv2.imread(self.img_path)
+        expected_image = self.keyword.get_to_zero_image(self.img_path)
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_to_zero_image(image)))
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_to_zero_image(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))))
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.get_to_zero_image(np.zeros((10, 10, 2), dtype=np.uint8))
+
+    def test_05_get_to_zero_image(self):
+        """
+        A JPEG image path keeps the gray values of the image read in colour and converted to gray scale, decoding it
+        directly to gray scale gives other gray values.
+        """
+        jpeg_path = 'tests/images/test_colour_masking.jpg'
+        gray_image = cv2.cvtColor(cv2.imread(jpeg_path), cv2.COLOR_BGR2GRAY)
+        decoded_gray_image = cv2.imread(jpeg_path, cv2.IMREAD_GRAYSCALE)
+        self.assertFalse(np.array_equal(gray_image, decoded_gray_image))
+        expected_image = cv2.threshold(gray_image, 0, 255, cv2.THRESH_TOZERO)[1]
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_to_zero_image(jpeg_path, threshold=0)))
+
 class TestKeywordGetTruncImage(BaseImageThresholdingKeywords):
     """
     TestKeywordGetTruncImage Class
@@ -156,6 +191,17 @@ class TestKeywordGetTruncImage(BaseImageThresholdingKeywords):
         with self.assertRaises(InvalidThresholdValue):
             self.keyword.get_trunc_image(self.img_path, False, None, 127)
 
+    def test_04_get_trunc_image(self):
+        """
+        Images already read (colour or gray scale) give the same result as the image path.
+        """
+        image = cv2.imread(self.img_path)
+        expected_image = self.keyword.get_trunc_image(self.img_path)
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_trunc_image(image)))
+        self.assertTrue(np.array_equal(expected_image, self.keyword.get_trunc_image(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))))
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.get_trunc_image(np.zeros((10, 10, 2), dtype=np.uint8))
+
 class TestKeywordApplyErosionToImage(BaseMorphologicalTransformationKeywords):
     """
     TestKeywordApplyErosionToImage Class
@@ -223,6 +269,20 @@ class TestKeywordApplyErosionToImage(BaseMorphologicalTransformationKeywords):
         with self.assertRaises(InvalidKernelType):
             self.keyword.apply_erosion_to_image(self.processed_image, (1, 1), "1")
 
+    def test_06_apply_erosion_to_image(self):
+        """
+        Eroding in place writes the eroded image to the given image, read only images are not modified.
+        """
+        binary_image = cv2.threshold(cv2.cvtColor(self.processed_image, cv2.COLOR_BGR2GRAY), 127, 255, cv2.THRESH_BINARY)[1]
+        expected_image = self.keyword.apply_erosion_to_image(binary_image, (3, 3), 0, 2)
+        binary_image.setflags(write=False)
+        eroded_image = self.keyword.apply_erosion_to_image(binary_image, (3, 3), 0, 2, in_place=True)
+        self.assertIsNot(eroded_image, binary_image)
+        binary_image = binary_image.copy()
+        eroded_image = self.keyword.apply_erosion_to_image(binary_image, (3, 3), 0, 2, in_place=True)
+        self.assertIs(eroded_image, binary_image)
+        self.assertTrue(np.array_equal(eroded_image, expected_image))
+
 class TestKeywordAppyDilationToImage(BaseMorphologicalTransformationKeywords):
     """
     TestKeywordAppyDilationToImage Class
@@ -290,6 +350,17 @@ class TestKeywordAppyDilationToImage(BaseMorphologicalTransformationKeywords):
         with self.assertRaises(InvalidKernelType):
             self.keyword.apply_dilation_to_image(self.processed_image, (1, 1), "1")
 
+    def test_06_apply_dilation_to_image(self):
+        """
+        Iterations of a rectangle kernel give the same image as one iteration of the equivalent larger kernel.
+        """
+        dilated_image = self.keyword.apply_dilation_to_image(self.processed_image, (5, 3), 0, 4)
+        expected_image = self.keyword.apply_dilation_to_image(self.processed_image, (17, 9), 0, 1)
+        self.assertTrue(np.array_equal(dilated_image, expected_image))
+        dilated_image = self.keyword.apply_dilation_to_image(self.processed_image, (40, 1), 0, 2)
+        expected_image = self.keyword.apply_dilation_to_image(self.keyword.apply_dilation_to_image(self.processed_image, (40, 1)), (40, 1))
+        self.assertTrue(np.array_equal(dilated_image, expected_image))
+
 class TestKeywordApplyOpeningToImage(BaseMorphologicalTransformationKeywords):
     """
     TestKeywordApplyOpeningToImage Class
@@ -357,6 +428,17 @@ class TestKeywordApplyOpeningToImage(BaseMorphologicalTransformationKeywords):
         with self.assertRaises(InvalidKernelType):
             self.keyword.apply_opening_to_image(self.processed_image, (1, 1), "1")
 
+    def test_06_apply_opening_to_image(self):
+        """
+        The iteration argument is applied, and the kernel is shared between calls and cannot be modified.
+        """
+        kernel = get_kernel(1, (3, 3))
+        opening_image = self.keyword.apply_opening_to_image(self.processed_image, (3, 3), 1, 2)
+        expected_image = cv2.morphologyEx(self.processed_image, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)), iterations=2)
+        self.assertTrue(np.array_equal(opening_image, expected_image))
+        self.assertIs(get_kernel(1, (3, 3)), kernel)
+        self.assertFalse(kernel.flags.writeable)
+
 class TestKeywordAppyClosingToImage(BaseMorphologicalTransformationKeywords):
     """
     TestKeywordAppyClosingToImage Class
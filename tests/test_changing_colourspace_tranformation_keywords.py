@@ -98,6 +98,22 @@ class TestKeywordMaskColour(BaseChangingColourspaceTransformationKeywords):
         with self.assertRaises(InvalidColourBoundArguments):
             self.keyword.mask_colour(self.mask_img_hsv, (0, 0, -2), (0, 0, 255))
 
+    def test_04_mask_colour(self):
+        """
+        Masking in place writes the masked image to the given image, read only images are not modified.
+        """
+        expected_img = cv2.bitwise_and(self.mask_img_bgr, self.mask_img_bgr, mask=cv2.inRange(self.mask_img_bgr, np.array((0, 0, 100)), np.array((80, 80, 255))))
+        masked_img = self.keyword.mask_colour(self.mask_img_bgr, (0, 0, 100), (80, 80, 255))
+        self.assertTrue(np.array_equal(masked_img, expected_img))
+        read_only_img = self.mask_img_bgr.copy()
+        read_only_img.setflags(write=False)
+        masked_img = self.keyword.mask_colour(read_only_img, (0, 0, 100), (80, 80, 255), in_place=True)
+        self.assertIsNot(masked_img, read_only_img)
+        self.assertTrue(np.array_equal(masked_img, expected_img))
+        masked_img = self.keyword.mask_colour(self.mask_img_bgr, (0, 0, 100), (80, 80, 255), in_place=True)
+        self.assertIs(masked_img, self.mask_img_bgr)
+        self.assertTrue(np.array_equal(masked_img, expected_img))
+
 class TestKeywordMaskColours(BaseChangingColourspaceTransformationKeywords):
     """
     TestKeywordMaskColours Class
@@ -134,3 +150,80 @@ class TestKeywordMaskColours(BaseChangingColourspaceTransformationKeywords):
             self.keyword.mask_colours(self.mask_multi_img_bgr, (0, 0, 0), (0, 0, 2560), (0, 0, 0), (0, 0, 25))
         with self.assertRaises(InvalidColourBoundArguments):
             self.keyword.mask_colours(self.mask_multi_img_bgr, (0, 0, -2), (0, 0, 255), (0, 0, 0), (0, 0, 25))
+
+class TestKeywordMaskColourRanges(BaseChangingColourspaceTransformationKeywords):
+    """
+    TestKeywordMaskColourRanges Class
+    """
+    def setUp(self):
+        self.mask_multi_img_bgr = cv2.imread('tests/images/test_multi_colour_masking.png')
+
+    def tearDown(self):
+        del self.mask_multi_img_bgr
+
+    def _expected_img(self, *bounds):
+        mask = np.zeros(self.mask_multi_img_bgr.shape[:2], np.uint8)
+        for lower, upper in zip(bounds[0::2], bounds[1::2]):
+            mask |= cv2.inRange(self.mask_multi_img_bgr, np.array(lower), np.array(upper))
+        return cv2.bitwise_and(self.mask_multi_img_bgr, self.mask_multi_img_bgr, mask=mask)
+
+    def test_01_mask_colour_ranges(self):
+        """
+        End to end flow of Mask Colour Ranges keyword with a few bounds.
+        """
+        bounds = ((100, 0, 0), (255, 0, 0), (0, 0, 100), (0, 0, 255))
+        masked_img = self.keyword.mask_colour_ranges(self.mask_multi_img_bgr, *bounds)
+        self.assertTrue(np.array_equal(masked_img, self._expected_img(*bounds)))
+        self.assertTrue(np.array_equal(masked_img, self.keyword.mask_colours(self.mask_multi_img_bgr, *bounds)))
+
+    def test_02_mask_colour_ranges(self):
+        """
+        Many bounds are masked with lookup tables and give the same image as masking each bound in turn.
+        """
+        bounds = []
+        for i in range(40):
+            bounds += [(i * 6, 0, 255 - i * 6), (i * 6 + 20, 255, 255 - i * 3)]
+        masked_img = self.keyword.mask_colour_ranges(self.mask_multi_img_bgr, *bounds)
+        self.assertTrue(np.array_equal(masked_img, self._expected_img(*bounds)))
+        masked_img = self.keyword.mask_colour_ranges(self.mask_multi_img_bgr, *bounds, in_place=True)
+        self.assertIs(masked_img, self.mask_multi_img_bgr)
+
+    def test_03_mask_colour_ranges(self):
+        """
+        Invalid image argument raises InvalidImageArgument.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.mask_colour_ranges(self.invalid_image, (100, 0, 0), (255, 0, 0))
+
+    def test_04_mask_colour_ranges(self):
+        """
+        Invalid bounds or a bound without its pair raises InvalidColourBoundArguments.
+        """
+        with self.assertRaises(InvalidColourBoundArguments):
+            self.keyword.mask_colour_ranges(self.mask_multi_img_bgr, (0, 0, 0), (0, 0, 2560))
+        with self.assertRaises(InvalidColourBoundArguments):
+            self.keyword.mask_colour_ranges(self.mask_multi_img_bgr, (0, 0, 0), (0, 0, 25), (0, 0, 0))
+        with self.assertRaises(InvalidColourBoundArguments):
+            self.keyword.mask_colour_ranges(self.mask_multi_img_bgr)
+
+    def test_05_mask_colour_ranges(self):
+        """
+        Gray or binary images raise InvalidImageArgument with a few or many bounds.
+        """
+        gray_img = cv2.cvtColor(self.mask_multi_img_bgr, cv2.COLOR_BGR2GRAY)
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.mask_colour_ranges(gray_img, (100, 0, 0), (255, 0, 0))
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.mask_colour_ranges(gray_img, *([(0, 0, 0), (255, 255, 255)] * 8))
+
+    def test_06_mask_colour_ranges(self):
+        """
+        The alpha channel of a BGRA image is ignored with a few or many bounds.
+        """
+        bgra_img = cv2.cvtColor(self.mask_multi_img_bgr, cv2.COLOR_BGR2BGRA)
+        bgra_img[::2, :, 3] = 0
+        for bounds in (((100, 0, 0), (255, 0, 0)), ((100, 0, 0), (255, 0, 0)) * 8):
+            mask = cv2.cvtColor(self._expected_img(*bounds), cv2.COLOR_BGR2GRAY) != 0
+            masked_img = self.keyword.mask_colour_ranges(bgra_img, *bounds)
+            self.assertTrue(np.array_equal(masked_img[mask], bgra_img[mask]))
+            self.assertFalse(masked_img[~mask].any())
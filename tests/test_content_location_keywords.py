@@ -1,12 +1,17 @@
 """
 Module to test keywords within ContentLocationKeywords class.
 """
+import os
+import tempfile
 import unittest
 import cv2
+import numpy as np
 
 from OCRLibrary.keywords.content_location import ContentLocationKeywords as clk
+from OCRLibrary.utils.imagereading.ocr_document import MATCH_MODES, create_ocr_document
 from OCRLibrary.utils.exceptions.exceptions \
-    import (InvalidImageArgument)
+    import (InvalidImageArgument, InvalidMatchMode, InvalidConfidenceValue, BatchOCRFailed, InvalidRegionArgument,
+    InvalidColourBoundArguments, InvalidTemplateArgument, InvalidImagePath)
 
 class BaseContentLocationKeywords(unittest.TestCase):
     """
@@ -55,6 +60,26 @@ class TestKeywordLocateTextCoordinates(BaseContentLocationKeywords):
         """
         self.assertEqual(None, self.keyword.locate_text_coordinates(self.processed_image, "Invalid Text"))
 
+    def test_04_locate_text_coordinates(self):
+        """
+        Locate text within a region of the image. Coordinates are relative to the full image.
+        """
+        actual_x, actual_y = self.keyword.locate_text_coordinates(self.processed_image, self.text, region=["800", "450", "300", "200"])
+        self.assertAlmostEqual(actual_x, 944, delta=5)
+        self.assertAlmostEqual(actual_y, 538, delta=5)
+        self.assertEqual(None, self.keyword.locate_text_coordinates(self.processed_image, self.text, region=(0, 0, 300, 200)))
+
+    def test_05_locate_text_coordinates(self):
+        """
+        Invalid region to raise InvalidRegionArgument
+        """
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.locate_text_coordinates(self.processed_image, self.text, region=(0, 0, 0, 10))
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.locate_text_coordinates(self.processed_image, self.text, region=(0, 0, 10))
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.locate_text_coordinates(self.processed_image, self.text, region=(100000, 0, 10, 10))
+
 class TestKeywordLocateMultipleTextCoordinates(BaseContentLocationKeywords):
     """
     TestKeywordLocateMultipleTextCoordinates Class
@@ -115,6 +140,20 @@ class TestKeywordLocateTextBounds(BaseContentLocationKeywords):
         """
         self.assertEqual(None, self.keyword.locate_text_bounds(self.processed_image, "Invalid"))
 
+    def test_04_locate_text_bounds(self):
+        """
+        Locate text bounds within a region of the image, with an image and with an OCR document.
+        """
+        region = (800, 450, 300, 200)
+        actual_x, actual_y, actual_w, actual_h = self.keyword.locate_text_bounds(self.processed_image, self.text, region=region)
+        self.assertAlmostEqual(actual_x, 900, delta=5)
+        self.assertAlmostEqual(actual_y, 510, delta=5)
+        self.assertAlmostEqual(actual_w, 84, delta=5)
+        self.assertAlmostEqual(actual_h, 45, delta=5)
+        document = self.keyword.get_ocr_document(self.processed_image)
+        self.assertEqual(self.keyword.locate_text_bounds(document, self.text), self.keyword.locate_text_bounds(document, self.text, region=region))
+        self.assertEqual(None, self.keyword.locate_text_bounds(document, self.text, region=(0, 0, 300, 200)))
+
 class TestKeywordLocateMultipleTextBounds(BaseContentLocationKeywords):
     """
     TestKeywordLocateMultipleTextBounds Class
@@ -147,3 +186,262 @@ class TestKeywordLocateMultipleTextBounds(BaseContentLocationKeywords):
         Text was not found error
         """
         self.assertEqual(None, self.keyword.locate_multiple_text_bounds(self.processed_image, "Invalid"))
+
+class TestKeywordGetOCRDocument(BaseContentLocationKeywords):
+    """
+    TestKeywordGetOCRDocument Class
+    """
+    def test_01_get_ocr_document(self):
+        """
+        End to end flow of Get OCR Document keyword used with the Locate keywords.
+        """
+        document = self.keyword.get_ocr_document(self.processed_image)
+        self.assertEqual(self.keyword.locate_text_coordinates(self.processed_image, self.text),
+            self.keyword.locate_text_coordinates(document, self.text))
+        self.assertEqual(self.keyword.locate_text_bounds(self.processed_image, self.text),
+            self.keyword.locate_text_bounds(document, self.text))
+        self.assertEqual(None, self.keyword.locate_multiple_text_bounds(document, "Invalid"))
+
+    def test_02_get_ocr_document(self):
+        """
+        Pass in incorrect image
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.get_ocr_document(None)
+
+    def test_03_get_ocr_document(self):
+        """
+        Locate text with the ignore_case and normalized match modes.
+        """
+        document = self.keyword.get_ocr_document(self.processed_image)
+        self.assertEqual(None, self.keyword.locate_text_coordinates(document, self.text.upper()))
+        expected = self.keyword.locate_text_coordinates(document, self.text)
+        self.assertEqual(expected, self.keyword.locate_text_coordinates(document, self.text.upper(), match_mode='ignore_case'))
+        self.assertEqual(expected, self.keyword.locate_text_coordinates(document, f"{self.text.lower()}!", match_mode='normalized'))
+
+    def test_04_get_ocr_document(self):
+        """
+        Invalid match mode to raise InvalidMatchMode
+        """
+        with self.assertRaises(InvalidMatchMode):
+            self.keyword.locate_text_coordinates(self.processed_image, self.text, match_mode='invalid')
+
+    def test_05_get_ocr_document(self):
+        """
+        Words below the minimum confidence are left out of the OCR document.
+        """
+        document = self.keyword.get_ocr_document(self.processed_image, min_confidence=0)
+        self.assertNotEqual(None, self.keyword.locate_text_coordinates(document, self.text))
+        document = self.keyword.get_ocr_document(self.processed_image, min_confidence=100.0)
+        self.assertEqual(None, self.keyword.locate_text_coordinates(document, self.text))
+        with self.assertRaises(InvalidConfidenceValue):
+            self.keyword.get_ocr_document(self.processed_image, min_confidence=101)
+
+    def test_06_get_ocr_document(self):
+        """
+        Only the documents returned by Get OCR Document keep a copy of the image, the documents read for a lookup do not.
+        The lookups of each match mode give the same words before and after the index of the match mode is built.
+        """
+        self.assertFalse(self.keyword.get_ocr_document(self.processed_image).image.flags.writeable)
+        document = create_ocr_document(self.processed_image, '--psm 6', 'eng')
+        self.assertEqual(None, document.image)
+        for match_mode in MATCH_MODES:
+            first_bounds = document.find_bounds(self.text, match_mode)
+            self.assertEqual(first_bounds, document.find_bounds(self.text, match_mode))
+            self.assertEqual(1, len(first_bounds))
+
+class TestKeywordUpdateOCRDocument(BaseContentLocationKeywords):
+    """
+    TestKeywordUpdateOCRDocument Class
+    """
+    def test_01_update_ocr_document(self):
+        """
+        End to end flow of Update OCR Document keyword. Text added to the image is found in the updated document.
+        """
+        document = self.keyword.get_ocr_document(self.processed_image_multi)
+        new_image = self.processed_image_multi.copy()
+        new_image[500:570, 890:1000] = self.processed_image[500:570, 890:1000]
+        updated_document = self.keyword.update_ocr_document(document, new_image)
+        self.assertEqual(self.keyword.locate_text_bounds(self.processed_image, self.text),
+            self.keyword.locate_text_bounds(updated_document, self.text))
+        self.assertEqual(self.keyword.locate_multiple_text_bounds(document, self.text_multi),
+            self.keyword.locate_multiple_text_bounds(updated_document, self.text_multi))
+        self.assertEqual(None, self.keyword.locate_text_bounds(document, self.text))
+
+    def test_02_update_ocr_document(self):
+        """
+        Text removed from the image is not found in the updated document.
+        """
+        document = self.keyword.get_ocr_document(self.processed_image)
+        new_image = self.processed_image.copy()
+        new_image[500:570, 890:1000] = self.processed_image[0, 0]
+        updated_document = self.keyword.update_ocr_document(document, new_image)
+        self.assertEqual(None, self.keyword.locate_text_coordinates(updated_document, self.text))
+
+    def test_03_update_ocr_document(self):
+        """
+        Pass in incorrect document and padding.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.update_ocr_document(self.processed_image, self.processed_image)
+        document = self.keyword.get_ocr_document(self.processed_image)
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.update_ocr_document(document, self.processed_image, padding=-1)
+
+    def test_04_update_ocr_document(self):
+        """
+        Changing the image in place after reading it does not change the document, the changes are found by the update.
+        """
+        image = self.processed_image_multi.copy()
+        document = self.keyword.get_ocr_document(image, region=(0, 0, 1500, 800))
+        self.assertFalse(document.image.flags.writeable)
+        image[500:570, 890:1000] = self.processed_image[500:570, 890:1000]
+        self.assertFalse(np.array_equal(document.image, image[:800, :1500]))
+        updated_document = self.keyword.update_ocr_document(document, image)
+        self.assertEqual(self.keyword.locate_text_bounds(self.processed_image, self.text),
+            self.keyword.locate_text_bounds(updated_document, self.text))
+
+class TestKeywordLocateTextInImages(BaseContentLocationKeywords):
+    """
+    TestKeywordLocateTextInImages Class
+    """
+    def test_01_locate_text_in_images(self):
+        """
+        End to end flow of Locate Text In Images function. All correct arguments.
+        """
+        images = [self.processed_image, 'tests/images/locate_text_coordinates1.png', self.processed_image_multi]
+        result = self.keyword.locate_text_in_images(images, self.text, workers=2)
+        self.assertEqual(3, len(result))
+        for coordinates in result[:2]:
+            self.assertAlmostEqual(coordinates[0], 944, delta=5)
+            self.assertAlmostEqual(coordinates[1], 538, delta=5)
+        self.assertEqual(None, result[2])
+
+    def test_02_locate_text_in_images(self):
+        """
+        Pass in incorrect images
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.locate_text_in_images(None, self.text)
+
+    def test_03_locate_text_in_images(self):
+        """
+        Image that cannot be read
+        """
+        with self.assertRaises(BatchOCRFailed):
+            self.keyword.locate_text_in_images(['invalid/path/to/image.png'], self.text)
+
+class TestKeywordLocateColourRegions(BaseContentLocationKeywords):
+    """
+    TestKeywordLocateColourRegions Class
+    """
+    def setUp(self):
+        self.colour_image = np.full((200, 300, 3), 255, dtype=np.uint8)
+        self.colour_image[20:40, 30:80] = (0, 0, 255)
+        self.colour_image[100:150, 200:260] = (0, 0, 230)
+        self.colour_image[180, 10] = (0, 0, 255)
+        self.colour_image[60:90, 60:90] = (255, 0, 0)
+
+    def tearDown(self):
+        del self.colour_image
+
+    def test_01_locate_colour_regions(self):
+        """
+        End to end flow of Locate Colour Regions keyword. All correct arguments.
+        """
+        regions = self.keyword.locate_colour_regions(self.colour_image, (0, 0, 200), (50, 50, 255))
+        self.assertEqual([(30, 20, 50, 20), (200, 100, 60, 50), (10, 180, 1, 1)], [region['bounds'] for region in regions])
+        self.assertEqual([(54, 30), (230, 124), (10, 180)], [region['centroid'] for region in regions])
+        self.assertEqual([1000, 3000, 1], [region['area'] for region in regions])
+
+    def test_02_locate_colour_regions(self):
+        """
+        Regions smaller than the minimum area are left out, coordinates are relative to the full image with a region.
+        """
+        regions = self.keyword.locate_colour_regions(self.colour_image, (0, 0, 200), (50, 50, 255), min_area=2)
+        self.assertEqual([(30, 20, 50, 20), (200, 100, 60, 50)], [region['bounds'] for region in regions])
+        regions = self.keyword.locate_colour_regions(self.colour_image, (0, 0, 200), (50, 50, 255), region=(150, 90, 150, 110))
+        self.assertEqual([(200, 100, 60, 50)], [region['bounds'] for region in regions])
+        self.assertEqual(None, self.keyword.locate_colour_regions(self.colour_image, (0, 200, 0), (50, 255, 50)))
+
+    def test_03_locate_colour_regions(self):
+        """
+        Pass in incorrect image, bounds and minimum area.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.locate_colour_regions(None, (0, 0, 200), (50, 50, 255))
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.locate_colour_regions(cv2.cvtColor(self.colour_image, cv2.COLOR_BGR2GRAY), (0, 0, 200), (50, 50, 255))
+        with self.assertRaises(InvalidColourBoundArguments):
+            self.keyword.locate_colour_regions(self.colour_image, (0, 0, 200), (50, 50, 256))
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.locate_colour_regions(self.colour_image, (0, 0, 200), (50, 50, 255), min_area=0)
+
+class BaseImageTemplateKeywords(BaseContentLocationKeywords):
+    """
+    Base Class for testing the image template keywords
+    """
+    def setUp(self):
+        self.template = self.processed_image[500:570, 890:1000].copy()
+        self.template_image = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+        for x, y in ((100, 100), (700, 400), (1500, 900)):
+            self.template_image[y:y + 70, x:x + 110] = self.template
+        self.template_image[600:740, 100:320] = cv2.resize(self.template, None, fx=2, fy=2)
+
+    def tearDown(self):
+        del self.template
+        del self.template_image
+
+class TestKeywordLocateImageTemplate(BaseImageTemplateKeywords):
+    """
+    TestKeywordLocateImageTemplate Class
+    """
+    def test_01_locate_image_template(self):
+        """
+        End to end flow of Locate Image Template keyword. All correct arguments.
+        """
+        self.assertEqual((945.0, 535.0), self.keyword.locate_image_template(self.processed_image, self.template))
+        with tempfile.TemporaryDirectory() as directory:
+            template_path = os.path.join(directory, 'template.png')
+            cv2.imwrite(template_path, self.template)
+            self.assertEqual((945.0, 535.0), self.keyword.locate_image_template(self.processed_image, template_path, threshold='0.95'))
+
+    def test_02_locate_image_template(self):
+        """
+        The template is not found below the threshold, or outside of the region.
+        """
+        self.assertEqual(None, self.keyword.locate_image_template(self.processed_image_multi, self.template))
+        self.assertEqual((755.0, 435.0), self.keyword.locate_image_template(self.template_image, self.template, region=(600, 300, 400, 300)))
+        self.assertEqual(None, self.keyword.locate_image_template(self.template_image, self.template, region=(300, 300, 300, 300)))
+
+    def test_03_locate_image_template(self):
+        """
+        Pass in incorrect image, template, threshold and scales.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.locate_image_template(None, self.template)
+        with self.assertRaises(InvalidImagePath):
+            self.keyword.locate_image_template(self.processed_image, 'path/to/invalid/template.txt')
+        with self.assertRaises(InvalidTemplateArgument):
+            self.keyword.locate_image_template(self.processed_image, self.template, threshold=1.5)
+        with self.assertRaises(InvalidTemplateArgument):
+            self.keyword.locate_image_template(self.processed_image, self.template, scales='1,0')
+
+class TestKeywordLocateAllImageTemplates(BaseImageTemplateKeywords):
+    """
+    TestKeywordLocateAllImageTemplates Class
+    """
+    def test_01_locate_all_image_templates(self):
+        """
+        End to end flow of Locate All Image Templates keyword. Every match is found once.
+        """
+        bounds = self.keyword.locate_all_image_templates(self.template_image, self.template)
+        self.assertEqual([(100, 100, 110, 70), (700, 400, 110, 70), (1500, 900, 110, 70)], sorted(bounds))
+
+    def test_02_locate_all_image_templates(self):
+        """
+        Matches of each scale of the template are found.
+        """
+        bounds = self.keyword.locate_all_image_templates(self.template_image, self.template, scales='1,2')
+        self.assertEqual([(100, 100, 110, 70), (100, 600, 220, 140), (700, 400, 110, 70), (1500, 900, 110, 70)], sorted(bounds))
+        self.assertEqual(None, self.keyword.locate_all_image_templates(self.processed_image_multi, self.template, scales=[0.5, 2]))
@@ -1,12 +1,20 @@
 """
 Module to test keywords within ContentValidationKeywords class.
 """
+import sys
 import unittest
+from xml.etree import ElementTree
 import cv2
+import numpy as np
+import pytesseract as pt
 
 from OCRLibrary.keywords.content_validation import ContentValidationKeywords as cvk
 from OCRLibrary.utils.exceptions.exceptions \
-    import (InvalidImageArgument, ContentNotFound)
+    import (InvalidImageArgument, ContentNotFound, InvalidWorkerCount, BatchOCRFailed, InvalidRegionArgument, InvalidOCROutput,
+    InvalidColourBoundArguments)
+from OCRLibrary.utils.imagereading import batch_reading
+from OCRLibrary.utils.imagereading.ocr_document import OCRDocument
+from OCRLibrary.utils.imagereading.ocr_engine import set_ocr_engine
 
 class BaseContentValidationKeywords(unittest.TestCase):
     """
@@ -15,13 +23,15 @@ class BaseContentValidationKeywords(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.keyword = cvk()
-        cls.processed_image = cv2.imread('tests/images/validate_image_content_test1.png')
+        cls.img_path = 'tests/images/validate_image_content_test1.png'
+        cls.processed_image = cv2.imread(cls.img_path)
         cls.correct_expected_content = "This is a test of test case 1 for validating image content"
         cls.incorrect_expected_content = "Some content that is not in the image."
 
     @classmethod
     def tearDownClass(cls):
         del cls.keyword
+        del cls.img_path
         del cls.processed_image
         del cls.correct_expected_content
         del cls.incorrect_expected_content
@@ -50,6 +60,57 @@ class TestKeywordValidateImageContent(BaseContentValidationKeywords):
         with self.assertRaises(ContentNotFound):
             self.keyword.validate_image_content(self.processed_image, self.incorrect_expected_content)
 
+class TestKeywordGetImageOCROutputs(BaseContentValidationKeywords):
+    """
+    TestKeywordGetImageOCROutputs Class
+    """
+    def test_01_get_image_ocr_outputs(self):
+        """
+        End to end flow of function. The text and the document come from the same OCR run.
+        """
+        outputs = self.keyword.get_image_ocr_outputs(self.processed_image)
+        self.assertEqual(['text', 'document'], list(outputs))
+        self.assertIn(self.correct_expected_content, outputs['text'])
+        self.assertTrue(isinstance(outputs['document'], OCRDocument))
+        self.assertEqual(outputs['text'], outputs['document'].text)
+        self.assertTrue(self.keyword.validate_image_content(outputs['document'], self.correct_expected_content))
+
+    def test_02_get_image_ocr_outputs(self):
+        """
+        Get the hOCR and ALTO XML of the image.
+        """
+        outputs = self.keyword.get_image_ocr_outputs(self.processed_image, ['hocr', 'alto'])
+        self.assertEqual(['hocr', 'alto'], list(outputs))
+        self.assertIn('ocr_page', outputs['hocr'])
+        self.assertIn('validating', outputs['hocr'])
+        self.assertIn('validating', outputs['alto'])
+
+    def test_03_get_image_ocr_outputs(self):
+        """
+        Raise InvalidOCROutput by providing incorrect outputs.
+        """
+        with self.assertRaises(InvalidOCROutput):
+            self.keyword.get_image_ocr_outputs(self.processed_image, 'text,pdf')
+        with self.assertRaises(InvalidOCROutput):
+            self.keyword.get_image_ocr_outputs(self.processed_image, [])
+
+    def test_04_get_image_ocr_outputs(self):
+        """
+        The hOCR and ALTO XML are well formed documents with the same structure with each OCR engine.
+        """
+        structures = []
+        try:
+            for engine in ('auto', 'pytesseract'):
+                set_ocr_engine(engine)
+                outputs = self.keyword.get_image_ocr_outputs(self.processed_image, ['hocr', 'alto'])
+                roots = [ElementTree.fromstring(outputs[output].encode('utf-8')) for output in ('hocr', 'alto')]
+                structures.append([[element.tag for element in root.iter()] for root in roots])
+        finally:
+            set_ocr_engine('auto')
+        self.assertEqual('{http://www.w3.org/1999/xhtml}html', structures[0][0][0])
+        self.assertEqual('{http://www.loc.gov/standards/alto/ns-v3#}alto', structures[0][1][0])
+        self.assertEqual(structures[0], structures[1])
+
 class TestKeywordGetImageContent(BaseContentValidationKeywords):
     """
     TestKeywordGetImageContent Class
@@ -67,3 +128,175 @@ class TestKeywordGetImageContent(BaseContentValidationKeywords):
         """
         with self.assertRaises(InvalidImageArgument):
             self.keyword.get_image_content(None)
+
+    def test_03_get_image_content(self):
+        """
+        Get the content of a region of the image.
+        """
+        height, width = self.processed_image.shape[:2]
+        content = self.keyword.get_image_content(self.processed_image, region=[0, 0, width, height])
+        self.assertIn(self.correct_expected_content, content)
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.get_image_content(self.processed_image, region=[width, 0, 10, 10])
+
+class TestKeywordGetImagesContent(BaseContentValidationKeywords):
+    """
+    TestKeywordGetImagesContent Class
+    """
+    def test_01_get_images_content(self):
+        """
+        End to end flow of function with image paths and processed images. All correct arguments.
+        """
+        contents = self.keyword.get_images_content([self.img_path, self.processed_image, self.img_path], workers=2, queue_size=1)
+        self.assertEqual(3, len(contents))
+        for content in contents:
+            self.assertIn(self.correct_expected_content, content)
+
+    def test_02_get_images_content(self):
+        """
+        Raise InvalidImageArgument by providing incorrect images.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.get_images_content(self.processed_image)
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.get_images_content([self.processed_image, None])
+
+    def test_03_get_images_content(self):
+        """
+        Raise InvalidWorkerCount by providing incorrect workers or queue size.
+        """
+        with self.assertRaises(InvalidWorkerCount):
+            self.keyword.get_images_content([self.processed_image], workers=0)
+        with self.assertRaises(InvalidWorkerCount):
+            self.keyword.get_images_content([self.processed_image], queue_size="invalid")
+
+    def test_04_get_images_content(self):
+        """
+        Raise BatchOCRFailed when an image cannot be read, unless continue_on_failure is enabled.
+        """
+        images = [self.processed_image, 'invalid/path/to/image.png']
+        with self.assertRaises(BatchOCRFailed):
+            self.keyword.get_images_content(images, workers=1)
+        contents = self.keyword.get_images_content(images, workers=2, continue_on_failure=True)
+        self.assertIn(self.correct_expected_content, contents[0])
+        self.assertEqual(None, contents[1])
+
+    def test_05_get_images_content(self):
+        """
+        The worker processes are reused between calls, and read the images with the OCR settings of the robot process.
+        """
+        self.keyword.get_images_content([self.processed_image, self.img_path], workers=2)
+        pool = batch_reading.get_process_pool(2)
+        tesseract_cmd = pt.pytesseract.tesseract_cmd
+        set_ocr_engine('pytesseract')
+        # A command that is not tesseract fails to read the images.
+        pt.pytesseract.tesseract_cmd = sys.executable
+        try:
+            contents = self.keyword.get_images_content([self.processed_image, self.img_path], workers=2,
+                continue_on_failure=True)
+        finally:
+            pt.pytesseract.tesseract_cmd = tesseract_cmd
+            set_ocr_engine('auto')
+        self.assertEqual([None, None], contents)
+        self.assertIs(pool, batch_reading.get_process_pool(2))
+
+class TestKeywordReadTextInColourRegions(BaseContentValidationKeywords):
+    """
+    TestKeywordReadTextInColourRegions Class
+    """
+    def setUp(self):
+        self.highlighted_image = np.full((400, 800, 3), 255, dtype=np.uint8)
+        self.highlighted_image[50:110, 40:500] = (0, 255, 255)
+        self.highlighted_image[250:310, 200:700] = (0, 255, 255)
+        cv2.putText(self.highlighted_image, "Invoice 1042", (60, 95), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+        cv2.putText(self.highlighted_image, "Total due", (220, 295), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+        cv2.putText(self.highlighted_image, "Other text", (40, 200), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+
+    def tearDown(self):
+        del self.highlighted_image
+
+    def test_01_read_text_in_colour_regions(self):
+        """
+        End to end flow of Read Text In Colour Regions keyword. Only the text of the highlighted rows is read.
+        """
+        rows = self.keyword.read_text_in_colour_regions(self.highlighted_image, (0, 200, 200), (80, 255, 255), workers=2)
+        self.assertEqual([{'bounds': (40, 50, 460, 60), 'text': 'Invoice 1042'}, {'bounds': (200, 250, 500, 60), 'text': 'Total due'}], rows)
+
+    def test_02_read_text_in_colour_regions(self):
+        """
+        Bounds of the regions read are grown by the padding and relative to the full image with a region.
+        """
+        rows = self.keyword.read_text_in_colour_regions(self.highlighted_image, (0, 200, 200), (80, 255, 255), padding=10,
+            region=(150, 200, 650, 200))
+        self.assertEqual([{'bounds': (190, 240, 520, 80), 'text': 'Total due'}], rows)
+        self.assertEqual(None, self.keyword.read_text_in_colour_regions(self.highlighted_image, (200, 0, 0), (255, 80, 80)))
+
+    def test_03_read_text_in_colour_regions(self):
+        """
+        Pass in incorrect image, bounds, minimum area and workers.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_text_in_colour_regions(None, (0, 200, 200), (80, 255, 255))
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_text_in_colour_regions(cv2.cvtColor(self.highlighted_image, cv2.COLOR_BGR2GRAY), (0, 200, 200),
+                (80, 255, 255))
+        with self.assertRaises(InvalidColourBoundArguments):
+            self.keyword.read_text_in_colour_regions(self.highlighted_image, (0, 200, 200), (80, 255, 256))
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.read_text_in_colour_regions(self.highlighted_image, (0, 200, 200), (80, 255, 255), min_area=0)
+        with self.assertRaises(InvalidWorkerCount):
+            self.keyword.read_text_in_colour_regions(self.highlighted_image, (0, 200, 200), (80, 255, 255), workers=0)
+
+    def test_04_read_text_in_colour_regions(self):
+        """
+        Regions padded to the same box are only read once.
+        """
+        image = np.full((60, 200, 3), 255, dtype=np.uint8)
+        image[10:20, 10:20] = (0, 255, 255)
+        image[30:40, 150:160] = (0, 255, 255)
+        rows = self.keyword.read_text_in_colour_regions(image, (0, 200, 200), (80, 255, 255), padding=200)
+        self.assertEqual([(0, 0, 200, 60)], [row['bounds'] for row in rows])
+
+class TestKeywordReadTextInRegions(BaseContentValidationKeywords):
+    """
+    TestKeywordReadTextInRegions Class
+    """
+    def setUp(self):
+        self.multi_image = cv2.imread('tests/images/locate_text_coordinates2.png')
+        self.regions = {'hello': (290, 295, 180, 80), 'another': (890, 300, 440, 80), 'more': (360, 675, 380, 85),
+            'empty': (0, 0, 200, 100)}
+
+    def tearDown(self):
+        del self.multi_image
+        del self.regions
+
+    def test_01_read_text_in_regions(self):
+        """
+        End to end flow of Read Text In Regions keyword. The text of each region is returned by name.
+        """
+        contents = self.keyword.read_text_in_regions(self.multi_image, self.regions)
+        self.assertEqual({'hello': 'Hello', 'another': 'Another word', 'more': 'More words', 'empty': ''}, contents)
+        self.assertEqual(list(self.regions), list(contents))
+
+    def test_02_read_text_in_regions(self):
+        """
+        The text of each region is the text read in the region on its own.
+        """
+        contents = self.keyword.read_text_in_regions(self.multi_image, self.regions, padding="4")
+        for name, region in self.regions.items():
+            self.assertEqual(self.keyword.get_image_content(self.multi_image, region=region).rstrip(), contents[name])
+
+    def test_03_read_text_in_regions(self):
+        """
+        Pass in incorrect image, regions and padding.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_text_in_regions(None, self.regions)
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.read_text_in_regions(self.multi_image, [(0, 0, 10, 10)])
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.read_text_in_regions(self.multi_image, {})
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.read_text_in_regions(self.multi_image, {'outside': (2000, 0, 10, 10)})
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.read_text_in_regions(self.multi_image, self.regions, padding=-1)
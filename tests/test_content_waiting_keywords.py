@@ -0,0 +1,124 @@
+"""
+Module to test keywords within ContentWaitingKeywords class.
+"""
+import unittest
+import cv2
+import numpy as np
+
+from OCRLibrary.keywords.content_waiting import ContentWaitingKeywords as cwk
+from OCRLibrary.keywords.ocr_configuration import OCRConfigurationKeywords as ock
+from OCRLibrary.utils.exceptions.exceptions \
+    import (ContentNotFound, ContentStillFound, InvalidWaitArgument, InvalidRegionArgument)
+
+class BaseContentWaitingKeywords(unittest.TestCase):
+    """
+    Base Class for testing ContentWaitingKeywords
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.keyword = cwk()
+        cls.configuration_keyword = ock()
+        cls.img_path = 'tests/images/validate_image_content_test1.png'
+        cls.processed_image = cv2.imread(cls.img_path)
+        cls.blank_image = np.full_like(cls.processed_image, 255)
+        cls.expected_content = "validating image content"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.configuration_keyword.set_ocr_cache_size()
+        del cls.keyword
+        del cls.configuration_keyword
+        del cls.img_path
+        del cls.processed_image
+        del cls.blank_image
+        del cls.expected_content
+
+    @staticmethod
+    def frames(*images):
+        """
+        Returns a screenshot callable returning the images in order, the last image is repeated.
+        """
+        images = list(images)
+        return lambda: images.pop(0) if len(images) > 1 else images[0]
+
+class TestKeywordWaitUntilTextIsVisible(BaseContentWaitingKeywords):
+    """
+    TestKeywordWaitUntilTextIsVisible Class
+    """
+    def test_01_wait_until_text_is_visible(self):
+        """
+        End to end flow of Wait Until Text Is Visible keyword with an image path.
+        """
+        frame = self.keyword.wait_until_text_is_visible(self.img_path, self.expected_content, timeout='2s')
+        self.assertTrue(np.array_equal(self.processed_image, frame))
+
+    def test_02_wait_until_text_is_visible(self):
+        """
+        Unchanged screenshots are not read again.
+        """
+        self.configuration_keyword.set_ocr_cache_size()
+        self.configuration_keyword.clear_ocr_cache()
+        screenshot = self.frames(self.blank_image, self.blank_image.copy(), self.blank_image.copy(), self.processed_image)
+        frame = self.keyword.wait_until_text_is_visible(screenshot, self.expected_content, timeout='5s', poll_interval='10ms')
+        stats = self.configuration_keyword.get_ocr_cache_statistics()
+        self.assertTrue(np.array_equal(self.processed_image, frame))
+        self.assertEqual(2, stats['misses'])
+        self.assertEqual(0, stats['hits'])
+
+    def test_03_wait_until_text_is_visible(self):
+        """
+        Text not visible before the timeout to raise ContentNotFound.
+        """
+        with self.assertRaises(ContentNotFound):
+            self.keyword.wait_until_text_is_visible(self.frames(self.blank_image), self.expected_content, timeout='200ms',
+                poll_interval='50ms', backoff=2)
+
+    def test_04_wait_until_text_is_visible(self):
+        """
+        Invalid wait arguments to raise InvalidWaitArgument.
+        """
+        with self.assertRaises(InvalidWaitArgument):
+            self.keyword.wait_until_text_is_visible(self.img_path, self.expected_content, timeout='invalid')
+        with self.assertRaises(InvalidWaitArgument):
+            self.keyword.wait_until_text_is_visible(self.img_path, self.expected_content, poll_interval=0)
+        with self.assertRaises(InvalidWaitArgument):
+            self.keyword.wait_until_text_is_visible(self.img_path, self.expected_content, backoff=0.5)
+
+    def test_05_wait_until_text_is_visible(self):
+        """
+        Only the region of the frames is read, a region outside of the frames to raise InvalidRegionArgument.
+        """
+        height, width = self.processed_image.shape[:2]
+        frame = self.keyword.wait_until_text_is_visible(self.img_path, self.expected_content, timeout='2s',
+            region=(0, 0, width, height))
+        self.assertTrue(np.array_equal(self.processed_image, frame))
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.wait_until_text_is_visible(self.img_path, self.expected_content, timeout='2s',
+                region=(width, 0, 100, 100))
+
+    def test_06_wait_until_text_is_visible(self):
+        """
+        A missing image path is not run as a keyword, screenshots are taken until the timeout to raise ContentNotFound.
+        """
+        for screenshot in ('tests/images/missing_screenshot.png', 'missing_screenshot.png'):
+            with self.assertRaises(ContentNotFound):
+                self.keyword.wait_until_text_is_visible(screenshot, self.expected_content, timeout='200ms',
+                    poll_interval='50ms')
+
+class TestKeywordWaitUntilTextDisappears(BaseContentWaitingKeywords):
+    """
+    TestKeywordWaitUntilTextDisappears Class
+    """
+    def test_01_wait_until_text_disappears(self):
+        """
+        End to end flow of Wait Until Text Disappears keyword.
+        """
+        screenshot = self.frames(self.processed_image, self.processed_image, self.blank_image)
+        self.keyword.wait_until_text_disappears(screenshot, self.expected_content, timeout='5s', poll_interval='10ms')
+
+    def test_02_wait_until_text_disappears(self):
+        """
+        Text still visible after the timeout to raise ContentStillFound.
+        """
+        with self.assertRaises(ContentStillFound):
+            self.keyword.wait_until_text_disappears(self.img_path, self.expected_content, timeout='200ms', poll_interval='50ms')
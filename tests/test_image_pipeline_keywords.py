@@ -0,0 +1,122 @@
+"""
+Module to test keywords within ImagePipelineKeywords class.
+"""
+import unittest
+import cv2
+import numpy as np
+
+from OCRLibrary.keywords.image_pipeline import ImagePipelineKeywords as ipk
+from OCRLibrary.keywords.binary_image_transformation import ImageThresholdingKeywords, MorphologicalTransformationKeywords
+from OCRLibrary.keywords.changing_colourspace_transformation import ChangingColourspaceKeywords
+from OCRLibrary.keywords.smoothing_image_transformation import SmoothingImageKeywords
+from OCRLibrary.utils.exceptions.exceptions \
+    import (InvalidPipelineStep, InvalidKernelSize, InvalidKernelType, InvalidColourBoundArguments, InvalidImageArgument)
+from OCRLibrary.utils.helpers.buffer_pool import BUFFER_POOL
+from OCRLibrary.utils.imageprocessing.image_pipeline import COMPILED_PIPELINES
+
+class BaseImagePipelineKeywords(unittest.TestCase):
+    """
+    Base Class for testing ImagePipelineKeywords
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.keyword = ipk()
+        cls.processed_image = cv2.imread('tests/images/test_colour_masking.png')
+        cls.processed_image.setflags(write=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        COMPILED_PIPELINES.clear()
+        del cls.keyword
+        del cls.processed_image
+
+class TestKeywordApplyPipeline(BaseImagePipelineKeywords):
+    """
+    TestKeywordApplyPipeline Class
+    """
+    def test_01_apply_pipeline(self):
+        """
+        The pipeline returns the same image as the keywords of its steps applied one after the other.
+        """
+        steps = ['threshold type=binary inverse=True threshold=100', 'morph_opening kernel_size=3,3 kernel_type=1',
+            'morph_erosion kernel_size=2,2 iteration=2', 'blur type=median kernel_size=3', 'filter_2d kernel_size=1,1']
+        pipeline_img = self.keyword.apply_pipeline(self.processed_image, steps)
+        expected = ImageThresholdingKeywords().get_binary_image(self.processed_image, inverse=True, threshold=100)
+        expected = MorphologicalTransformationKeywords().apply_opening_to_image(expected, (3, 3), 1)
+        expected = MorphologicalTransformationKeywords().apply_erosion_to_image(expected, (2, 2), 0, 2)
+        expected = SmoothingImageKeywords().apply_median_filtering_to_image(expected, 3)
+        expected = SmoothingImageKeywords().apply_filter2D_to_image(expected, (1, 1))
+        self.assertTrue(np.array_equal(pipeline_img, expected))
+
+    def test_02_apply_pipeline(self):
+        """
+        Colour steps, and steps given as dictionaries, return the same image as the keywords.
+        """
+        steps = [{'name': 'mask', 'lower': ['0', '0', '100'], 'upper': [80, 80, 255]}, {'name': 'blur', 'type': 'gaussian', 'kernel_size': [3, 3]},
+            'gray_scale']
+        pipeline_img = self.keyword.apply_pipeline(self.processed_image, steps)
+        expected = ChangingColourspaceKeywords().mask_colour(self.processed_image, (0, 0, 100), (80, 80, 255))
+        expected = SmoothingImageKeywords().apply_gaussian_blur_to_image(expected, (3, 3))
+        expected = ChangingColourspaceKeywords().convert_image_to_gray_scale(expected)
+        self.assertTrue(np.array_equal(pipeline_img, expected))
+        hsv_img = self.keyword.apply_pipeline(self.processed_image, 'hsv')
+        self.assertTrue(np.array_equal(hsv_img, ChangingColourspaceKeywords().convert_image_to_HSV(self.processed_image)))
+
+    def test_03_apply_pipeline(self):
+        """
+        A pipeline is compiled once, and the images returned are not overwritten by the following calls.
+        """
+        COMPILED_PIPELINES.clear()
+        steps = ['gray_scale', 'threshold otsu=True', 'morph_closing kernel_size=3,3']
+        first_img = self.keyword.apply_pipeline(self.processed_image, steps)
+        first_copy = first_img.copy()
+        second_img = self.keyword.apply_pipeline(255 - self.processed_image, list(steps))
+        self.assertTrue(np.array_equal(first_img, first_copy))
+        self.assertFalse(np.array_equal(first_img, second_img))
+        statistics = COMPILED_PIPELINES.statistics()
+        self.assertEqual(statistics['entries'], 1)
+        self.assertEqual(statistics['hits'], 1)
+
+    def test_04_apply_pipeline(self):
+        """
+        Invalid steps raise InvalidPipelineStep, and invalid arguments the errors of the corresponding keywords.
+        """
+        with self.assertRaises(InvalidPipelineStep):
+            self.keyword.apply_pipeline(self.processed_image, [])
+        with self.assertRaises(InvalidPipelineStep):
+            self.keyword.apply_pipeline(self.processed_image, ['sharpen'])
+        with self.assertRaises(InvalidPipelineStep):
+            self.keyword.apply_pipeline(self.processed_image, ['morph_opening'])
+        with self.assertRaises(InvalidPipelineStep):
+            self.keyword.apply_pipeline(self.processed_image, ['gray_scale kernel_size=3,3'])
+        with self.assertRaises(InvalidPipelineStep):
+            self.keyword.apply_pipeline(self.processed_image, ['threshold type=trunc inverse=True'])
+        with self.assertRaises(InvalidKernelSize):
+            self.keyword.apply_pipeline(self.processed_image, ['blur type=gaussian kernel_size=2,2'])
+        with self.assertRaises(InvalidKernelType):
+            self.keyword.apply_pipeline(self.processed_image, ['morph_erosion kernel_size=3,3 kernel_type=3'])
+        with self.assertRaises(InvalidColourBoundArguments):
+            self.keyword.apply_pipeline(self.processed_image, [{'name': 'mask', 'lower': (0, 0, 0), 'upper': (0, 0, 256)}])
+
+    def test_05_apply_pipeline(self):
+        """
+        Invalid image argument, or colour steps applied to a gray image, raise InvalidImageArgument.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.apply_pipeline('invalid_image.png', ['gray_scale'])
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.apply_pipeline(self.processed_image, ['gray_scale', 'hsv'])
+
+    def test_06_apply_pipeline(self):
+        """
+        The intermediate images of a pipeline are written to two buffers of the buffer pool, reused by the following calls.
+        """
+        BUFFER_POOL.clear()
+        steps = ['morph_erosion kernel_size=3,3', 'morph_dilation kernel_size=3,3', 'blur kernel_size=3,3', 'filter_2d kernel_size=1,1']
+        first_img = self.keyword.apply_pipeline(self.processed_image, steps)
+        self.assertEqual(BUFFER_POOL.statistics()['allocated'], 2)
+        second_img = self.keyword.apply_pipeline(self.processed_image, steps)
+        statistics = BUFFER_POOL.statistics()
+        self.assertEqual(statistics['allocated'], 2)
+        self.assertEqual(statistics['buffers'], 2)
+        self.assertTrue(np.array_equal(first_img, second_img))
@@ -0,0 +1,360 @@
+"""
+Module to test keywords within OCRConfigurationKeywords class.
+"""
+import unittest
+from unittest import mock
+import cv2
+import numpy as np
+
+from OCRLibrary.keywords.content_location import ContentLocationKeywords as clk
+from OCRLibrary.keywords.content_validation import ContentValidationKeywords as cvk
+from OCRLibrary.keywords.ocr_configuration import OCRConfigurationKeywords as ock
+from OCRLibrary.utils.imagereading.ocr_engine \
+    import (OCR_DATA_DTYPE, TSV_HEADER, TesseractAPIEngine, parse_config, parse_tsv)
+from OCRLibrary.utils.exceptions.exceptions \
+    import (InvalidOCREngine, InvalidCacheSize, InvalidTilingArgument, InvalidKernelSize, InvalidRegionArgument,
+    InvalidWorkerCount)
+from OCRLibrary.utils.imagereading import tiled_reading
+
+class BaseOCRConfigurationKeywords(unittest.TestCase):
+    """
+    Base Class for testing OCRConfigurationKeywords
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.keyword = ock()
+        cls.content_keyword = cvk()
+        cls.processed_image = cv2.imread('tests/images/validate_image_content_test1.png')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.keyword.set_ocr_engine('auto')
+        cls.keyword.set_ocr_cache_size()
+        cls.keyword.set_ocr_tiling()
+        cls.keyword.set_ocr_line_detection(False)
+        del cls.keyword
+        del cls.content_keyword
+        del cls.processed_image
+
+class TestKeywordSetOCREngine(BaseOCRConfigurationKeywords):
+    """
+    TestKeywordSetOCREngine Class
+    """
+    def test_01_set_ocr_engine(self):
+        """
+        End to end flow of Set OCR Engine keyword.
+        """
+        self.assertEqual('pytesseract', self.keyword.set_ocr_engine('pytesseract'))
+        self.assertEqual('pytesseract', self.keyword.get_ocr_engine())
+
+    def test_02_set_ocr_engine(self):
+        """
+        Auto selection always results in an available engine.
+        """
+        self.assertIn(self.keyword.set_ocr_engine('auto'), ('tesseract_api', 'pytesseract'))
+
+    def test_03_set_ocr_engine(self):
+        """
+        Invalid engine name to raise InvalidOCREngine.
+        """
+        with self.assertRaises(InvalidOCREngine):
+            self.keyword.set_ocr_engine('invalid_engine')
+
+    def test_04_set_ocr_engine(self):
+        """
+        Colour, grayscale and binary images read through the pytesseract engine give the same content as the default engine.
+        """
+        gray_image = cv2.cvtColor(self.processed_image, cv2.COLOR_BGR2GRAY)
+        binary_image = cv2.threshold(gray_image, 127, 255, cv2.THRESH_BINARY)[1]
+        self.keyword.set_ocr_cache_size(0, 0)
+        for image in (self.processed_image, gray_image, binary_image):
+            self.keyword.set_ocr_engine('auto')
+            expected_content = self.content_keyword.get_image_content(image)
+            self.keyword.set_ocr_engine('pytesseract')
+            self.assertEqual(expected_content, self.content_keyword.get_image_content(image))
+
+class TestKeywordSetOCRCacheSize(BaseOCRConfigurationKeywords):
+    """
+    TestKeywordSetOCRCacheSize Class
+    """
+    def test_01_set_ocr_cache_size(self):
+        """
+        End to end flow of Set OCR Cache Size keyword.
+        """
+        self.keyword.set_ocr_cache_size("16", "1048576")
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(16, stats['max_entries'])
+        self.assertEqual(1048576, stats['max_bytes'])
+
+    def test_02_set_ocr_cache_size(self):
+        """
+        Disabled cache does not store results.
+        """
+        self.keyword.clear_ocr_cache()
+        self.keyword.set_ocr_cache_size(0, 0)
+        self.content_keyword.get_image_content(self.processed_image)
+        self.content_keyword.get_image_content(self.processed_image)
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(0, stats['entries'])
+        self.assertEqual(0, stats['hits'])
+
+    def test_03_set_ocr_cache_size(self):
+        """
+        Invalid cache sizes to raise InvalidCacheSize.
+        """
+        with self.assertRaises(InvalidCacheSize):
+            self.keyword.set_ocr_cache_size(-1, 1024)
+        with self.assertRaises(InvalidCacheSize):
+            self.keyword.set_ocr_cache_size(10, "invalid")
+        with self.assertRaises(InvalidCacheSize):
+            self.keyword.set_ocr_cache_size(None, 1024)
+
+class TestKeywordGetOCRCacheStatistics(BaseOCRConfigurationKeywords):
+    """
+    TestKeywordGetOCRCacheStatistics Class
+    """
+    def test_01_get_ocr_cache_statistics(self):
+        """
+        Reading the same image twice is a cache miss followed by a cache hit. The text and the boxes are cached together
+        with the tesseract_api engine.
+        """
+        paired = self.keyword.set_ocr_engine('auto') == 'tesseract_api'
+        self.keyword.set_ocr_cache_size()
+        self.keyword.clear_ocr_cache()
+        first_content = self.content_keyword.get_image_content(self.processed_image)
+        second_content = self.content_keyword.get_image_content(self.processed_image.copy())
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(first_content, second_content)
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(2 if paired else 1, stats['entries'])
+
+    def test_02_get_ocr_cache_statistics(self):
+        """
+        A different configuration is a cache miss.
+        """
+        self.keyword.set_ocr_cache_size()
+        self.keyword.clear_ocr_cache()
+        self.content_keyword.get_image_content(self.processed_image, '--psm 6')
+        self.content_keyword.get_image_content(self.processed_image, '--psm 3')
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(2, stats['misses'])
+        self.assertEqual(0, stats['hits'])
+
+    def test_03_get_ocr_cache_statistics(self):
+        """
+        Validating content and locating text in the same image reads the image once with the tesseract_api engine.
+        """
+        paired = self.keyword.set_ocr_engine('auto') == 'tesseract_api'
+        self.keyword.set_ocr_cache_size()
+        self.keyword.clear_ocr_cache()
+        self.content_keyword.validate_image_content(self.processed_image, 'validating image content')
+        self.assertEqual((138.5, 223.0), clk().locate_text_coordinates(self.processed_image, "This"))
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(1 if paired else 2, stats['misses'])
+        self.assertEqual(2, stats['entries'])
+
+    def test_04_get_ocr_cache_statistics(self):
+        """
+        The pytesseract engine only reads and caches the requested output.
+        """
+        self.keyword.set_ocr_engine('pytesseract')
+        self.keyword.set_ocr_cache_size()
+        self.keyword.clear_ocr_cache()
+        self.content_keyword.validate_image_content(self.processed_image, 'validating image content')
+        self.assertEqual(1, self.keyword.get_ocr_cache_statistics()['entries'])
+        self.assertEqual((138.5, 223.0), clk().locate_text_coordinates(self.processed_image, "This"))
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(2, stats['misses'])
+        self.assertEqual(2, stats['entries'])
+        self.keyword.set_ocr_engine('auto')
+
+    def test_05_get_ocr_cache_statistics(self):
+        """
+        Reading a region of an image and a copy of the same region is a cache miss followed by a cache hit.
+        """
+        self.keyword.set_ocr_cache_size()
+        self.keyword.clear_ocr_cache()
+        first_content = self.content_keyword.get_image_content(self.processed_image, region=(100, 150, 700, 150))
+        second_content = self.content_keyword.get_image_content(self.processed_image[150:300, 100:800].copy())
+        stats = self.keyword.get_ocr_cache_statistics()
+        self.assertEqual(first_content, second_content)
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['hits'])
+
+    def test_06_get_ocr_cache_statistics(self):
+        """
+        With the pytesseract engine an OCR document only reads the boxes, its text is the text read when it is cached.
+        """
+        self.keyword.set_ocr_engine('pytesseract')
+        self.keyword.set_ocr_cache_size()
+        self.keyword.clear_ocr_cache()
+        try:
+            document = clk().get_ocr_document(self.processed_image)
+            stats = self.keyword.get_ocr_cache_statistics()
+            self.assertEqual(1, stats['misses'])
+            self.assertEqual(1, stats['entries'])
+            self.assertIn('validating image content', document.text)
+            content = self.content_keyword.get_image_content(self.processed_image)
+            self.assertEqual(content, clk().get_ocr_document(self.processed_image).text)
+            self.assertEqual(2, self.keyword.get_ocr_cache_statistics()['misses'])
+        finally:
+            self.keyword.set_ocr_engine('auto')
+
+class TestKeywordSetOCRTiling(BaseOCRConfigurationKeywords):
+    """
+    TestKeywordSetOCRTiling Class
+    """
+    def test_01_set_ocr_tiling(self):
+        """
+        End to end flow of Set OCR Tiling keyword.
+        """
+        self.keyword.set_ocr_tiling("640", "200", "2")
+        self.assertEqual({'tile_size': 640, 'overlap': 200, 'workers': 2}, self.keyword.get_ocr_tiling())
+        self.keyword.set_ocr_tiling()
+        self.assertEqual({'tile_size': 0, 'overlap': 100, 'workers': None}, self.keyword.get_ocr_tiling())
+
+    def test_02_set_ocr_tiling(self):
+        """
+        Tiled reading returns the same content as reading the full image.
+        """
+        self.keyword.set_ocr_tiling()
+        expected_content = self.content_keyword.get_image_content(self.processed_image)
+        self.keyword.set_ocr_tiling(640, 200)
+        self.assertEqual(expected_content, self.content_keyword.get_image_content(self.processed_image))
+
+    def test_03_set_ocr_tiling(self):
+        """
+        Words located in a tiled image are located once, in the coordinates of the full image.
+        """
+        location_keyword = clk()
+        processed_image = cv2.imread('tests/images/locate_text_coordinates2.png')
+        self.keyword.set_ocr_tiling()
+        expected_bounds = location_keyword.locate_multiple_text_bounds(processed_image, 'Another')
+        self.keyword.set_ocr_tiling(640, 200)
+        self.assertEqual(expected_bounds, location_keyword.locate_multiple_text_bounds(processed_image, 'Another'))
+
+    def test_04_set_ocr_tiling(self):
+        """
+        Invalid tiling to raise InvalidTilingArgument.
+        """
+        with self.assertRaises(InvalidTilingArgument):
+            self.keyword.set_ocr_tiling(-1)
+        with self.assertRaises(InvalidTilingArgument):
+            self.keyword.set_ocr_tiling(640, 640)
+        with self.assertRaises(InvalidTilingArgument):
+            self.keyword.set_ocr_tiling("invalid", 100)
+
+    def test_05_set_ocr_tiling(self):
+        """
+        Only the words read twice across the boundary between two tiles are removed as duplicates.
+        """
+        tiles = tiled_reading.get_tiles(1000, 100, 640, 200)
+        boundary = tiles[1][1][0]
+        data = np.zeros(3, dtype=OCR_DATA_DTYPE)
+        data['text'] = 'word'
+        data['top'] = 10
+        data['height'] = 20
+        data['width'] = 60
+        data['left'] = [boundary - 32, boundary - 28, 100]
+        data['conf'] = [80, 90, 70]
+        words = tiled_reading._remove_duplicates(np.concatenate([data, data[2:]]), tiles)
+        self.assertEqual([boundary - 28, 100, 100], list(words['left']))
+
+class TestKeywordSetOCRLineDetection(BaseOCRConfigurationKeywords):
+    """
+    TestKeywordSetOCRLineDetection Class
+    """
+    def tearDown(self):
+        self.keyword.set_ocr_line_detection(False)
+
+    def test_01_set_ocr_line_detection(self):
+        """
+        End to end flow of Set OCR Line Detection keyword.
+        """
+        self.keyword.set_ocr_line_detection("True", ("25", "3"), "2", "2")
+        self.assertEqual({'enabled': True, 'kernel_size': (25, 3), 'padding': 2, 'workers': 2}, self.keyword.get_ocr_line_detection())
+        self.keyword.set_ocr_line_detection(False)
+        self.assertEqual({'enabled': False, 'kernel_size': (35, 5), 'padding': 4, 'workers': None}, self.keyword.get_ocr_line_detection())
+
+    def test_02_set_ocr_line_detection(self):
+        """
+        Reading line by line returns the same content and bounds as reading the full image.
+        """
+        location_keyword = clk()
+        processed_image = cv2.imread('tests/images/locate_text_coordinates2.png')
+        expected_content = self.content_keyword.get_image_content(processed_image)
+        expected_bounds = location_keyword.locate_multiple_text_bounds(processed_image, 'Another')
+        self.keyword.set_ocr_line_detection()
+        self.assertEqual(expected_content, self.content_keyword.get_image_content(processed_image))
+        self.assertEqual(expected_bounds, location_keyword.locate_multiple_text_bounds(processed_image, 'Another'))
+        self.assertEqual([(307, 311, 147, 48), (1307, 712, 147, 48)], location_keyword.locate_multiple_text_bounds(processed_image, 'Hello'))
+
+    def test_03_set_ocr_line_detection(self):
+        """
+        Invalid kernel size, padding or workers raise an error.
+        """
+        with self.assertRaises(InvalidKernelSize):
+            self.keyword.set_ocr_line_detection(kernel_size=(0, 5))
+        with self.assertRaises(InvalidRegionArgument):
+            self.keyword.set_ocr_line_detection(padding=-1)
+        with self.assertRaises(InvalidWorkerCount):
+            self.keyword.set_ocr_line_detection(workers=0)
+        self.assertFalse(self.keyword.get_ocr_line_detection()['enabled'])
+
+class TestOCREngineParsing(unittest.TestCase):
+    """
+    TestOCREngineParsing Class
+
+    Tests of the parsing of the OCR engine module, none of them runs tesseract.
+    """
+    def test_01_parse_config(self):
+        """
+        Supported configuration strings are parsed into the settings of the tesseract_api engine.
+        """
+        self.assertEqual({'psm': 3, 'oem': 3, 'datapath': None, 'dpi': None, 'variables': ()}, parse_config(None))
+        self.assertEqual({'psm': 6, 'oem': 3, 'datapath': None, 'dpi': None,
+            'variables': (('tessedit_char_whitelist', '0123456789'),)},
+            parse_config('--psm 6 -c tessedit_char_whitelist=0123456789'))
+        self.assertEqual({'psm': 3, 'oem': 1, 'datapath': '/path/to/tessdata', 'dpi': 300,
+            'variables': (('tessedit_do_invert', '0'), ('preserve_interword_spaces', '1'))},
+            parse_config('--oem 1 --dpi 300 --tessdata-dir /path/to/tessdata -ctessedit_do_invert=0 '
+                '-c preserve_interword_spaces=1'))
+
+    def test_02_parse_config(self):
+        """
+        Configuration strings with an option the tesseract_api engine cannot apply return None.
+        """
+        for config in ('--user-words words.txt', '--psm', '--psm six', '-c tessedit_do_invert', '"--psm 6', 'digits'):
+            self.assertEqual(None, parse_config(config), config)
+
+    def test_03_parse_tsv(self):
+        """
+        TSV output is parsed into one record per row, the missing text cell of the last row is an empty text.
+        """
+        tsv = ('\t'.join(TSV_HEADER) + '\n'
+            '1\t1\t0\t0\t0\t0\t0\t0\t200\t100\t-1\t\n'
+            '5\t1\t1\t1\t1\t1\t10\t20\t30\t15\t96.5\tHello\n'
+            '5\t1\t1\t1\t1\t2\t45\t20\t40\t15\t91\tworld\n'
+            '5\t1\t1\t1\t1\t3\t90\t20\t5\t15\t-1')
+        data = parse_tsv(tsv)
+        self.assertEqual(OCR_DATA_DTYPE, data.dtype)
+        self.assertEqual(['', 'Hello', 'world', ''], data['text'].tolist())
+        self.assertEqual([0, 10, 45, 90], data['left'].tolist())
+        self.assertEqual([0, 1, 2, 3], data['word_num'].tolist())
+        self.assertEqual([-1.0, 96.5, 91.0, -1.0], data['conf'].tolist())
+        self.assertEqual(['Hello', 'world', ''], parse_tsv(tsv.split('\n', 2)[2], has_header=False)['text'].tolist()[-3:])
+        self.assertEqual(0, len(parse_tsv('\t'.join(TSV_HEADER))))
+
+    def test_04_recognize(self):
+        """
+        The tesseract_api engine gives the call to its fallback engine when the configuration cannot be parsed.
+        """
+        engine = TesseractAPIEngine.__new__(TesseractAPIEngine)
+        engine._lib = mock.Mock()
+        engine._fallback = mock.Mock()
+        engine._fallback.recognize.return_value = {'text': 'fallback'}
+        image = np.zeros((10, 10), dtype=np.uint8)
+        self.assertEqual({'text': 'fallback'}, engine.recognize(image, '--user-words words.txt', 'eng', ('text',)))
+        engine._fallback.recognize.assert_called_once_with(image, '--user-words words.txt', 'eng', ('text',))
+        engine._lib.TessBaseAPIRecognize.assert_not_called()
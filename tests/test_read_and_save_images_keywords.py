@@ -2,6 +2,10 @@
 Module to test keywords within GenericImageProcessingKeywords class.
 """
 
+import base64
+import os
+import shutil
+import tempfile
 import unittest
 import cv2
 import numpy as np
@@ -9,7 +13,7 @@ from robot.libraries.BuiltIn import RobotNotRunningError
 
 from OCRLibrary.keywords.read_and_save_images import ReadImageKeywords as rik
 from OCRLibrary.keywords.read_and_save_images import SaveImageKeywords as sik
-from OCRLibrary.utils.exceptions.exceptions import InvalidImagePath
+from OCRLibrary.utils.exceptions.exceptions import InvalidImagePath, InvalidReadMode, InvalidImageArgument
 
 class BaseReadImageKeywords(unittest.TestCase):
     """
@@ -23,6 +27,7 @@ class BaseReadImageKeywords(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        cls.keyword.set_image_cache_size()
         del cls.keyword
         del cls.valid_image_path
         del cls.invalid_image_path
@@ -63,6 +68,117 @@ class TestKeywordReadImage(BaseReadImageKeywords):
         with self.assertRaises(InvalidImagePath):
             self.keyword.read_image(self.invalid_image_path)
 
+    def test_03_read_image(self):
+        """
+        Read an image in gray scale and at reduced resolutions.
+        """
+        height, width = self.keyword.read_image(self.valid_image_path).shape[:2]
+        self.assertEqual((height, width), self.keyword.read_image(self.valid_image_path, 'grayscale').shape)
+        self.assertEqual((height // 2, width // 2, 3), self.keyword.read_image(self.valid_image_path, 'reduced_colour_2').shape)
+        self.assertEqual((height // 4, width // 4), self.keyword.read_image(self.valid_image_path, 'REDUCED_GRAYSCALE_4').shape)
+        self.assertEqual((height // 8, width // 8, 3), self.keyword.read_image(self.valid_image_path, 'reduced_color_8').shape)
+
+    def test_04_read_image(self):
+        """
+        Invalid read mode to raise InvalidReadMode
+        """
+        with self.assertRaises(InvalidReadMode):
+            self.keyword.read_image(self.valid_image_path, 'reduced_colour_3')
+        with self.assertRaises(InvalidReadMode):
+            self.keyword.read_image(self.valid_image_path, None)
+
+    def test_05_read_image(self):
+        """
+        Reading the same file twice decodes it once, the image returned is read only.
+        """
+        self.keyword.set_image_cache_size()
+        self.keyword.clear_image_cache()
+        first_image = self.keyword.read_image(self.valid_image_path)
+        second_image = self.keyword.read_image(os.path.abspath(self.valid_image_path))
+        stats = self.keyword.get_image_cache_statistics()
+        self.assertIs(first_image, second_image)
+        self.assertFalse(first_image.flags.writeable)
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(first_image.nbytes, stats['bytes'])
+
+    def test_06_read_image(self):
+        """
+        A file that is overwritten is decoded again.
+        """
+        self.keyword.set_image_cache_size()
+        with tempfile.TemporaryDirectory() as directory:
+            img_path = os.path.join(directory, 'image.png')
+            shutil.copy(self.valid_image_path, img_path)
+            first_image = self.keyword.read_image(img_path)
+            cv2.imwrite(img_path, first_image[:100, :100])
+            os.utime(img_path, ns=(0, os.stat(img_path).st_mtime_ns + 1))
+            self.assertEqual((100, 100, 3), self.keyword.read_image(img_path).shape)
+
+    def test_07_read_image(self):
+        """
+        Disabled cache does not store images.
+        """
+        self.keyword.clear_image_cache()
+        self.keyword.set_image_cache_size(0, 0)
+        self.keyword.read_image(self.valid_image_path)
+        self.keyword.read_image(self.valid_image_path)
+        stats = self.keyword.get_image_cache_statistics()
+        self.assertEqual(0, stats['entries'])
+        self.assertEqual(0, stats['hits'])
+
+class TestKeywordReadImageFromBytes(BaseReadImageKeywords):
+    """
+    TestKeywordReadImageFromBytes Class
+    """
+    def test_01_read_image_from_bytes(self):
+        """
+        End to end flow of Read Image From Bytes keyword.
+        """
+        with open(self.valid_image_path, 'rb') as image_file:
+            img_bytes = image_file.read()
+        expected_image = self.keyword.read_image(self.valid_image_path)
+        self.assertTrue(np.array_equal(expected_image, self.keyword.read_image_from_bytes(img_bytes)))
+        self.assertTrue(np.array_equal(self.keyword.read_image(self.valid_image_path, 'reduced_grayscale_2'),
+            self.keyword.read_image_from_bytes(bytearray(img_bytes), 'reduced_grayscale_2')))
+
+    def test_02_read_image_from_bytes(self):
+        """
+        Invalid bytes to raise InvalidImageArgument.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_image_from_bytes(b'')
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_image_from_bytes('not bytes')
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_image_from_bytes(b'not an image')
+
+class TestKeywordReadImageFromBase64(BaseReadImageKeywords):
+    """
+    TestKeywordReadImageFromBase64 Class
+    """
+    def test_01_read_image_from_base64(self):
+        """
+        End to end flow of Read Image From Base64 keyword, with and without a data URI prefix.
+        """
+        with open(self.valid_image_path, 'rb') as image_file:
+            img_base64 = base64.b64encode(image_file.read()).decode('ascii')
+        expected_image = self.keyword.read_image(self.valid_image_path, 'grayscale')
+        self.assertTrue(np.array_equal(expected_image, self.keyword.read_image_from_base64(img_base64, 'grayscale')))
+        self.assertTrue(np.array_equal(expected_image,
+            self.keyword.read_image_from_base64(f'data:image/png;base64,{img_base64}', 'grayscale')))
+
+    def test_02_read_image_from_base64(self):
+        """
+        Invalid base64 to raise InvalidImageArgument.
+        """
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_image_from_base64('')
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_image_from_base64('abc')
+        with self.assertRaises(InvalidImageArgument):
+            self.keyword.read_image_from_base64(base64.b64encode(b'not an image').decode('ascii'))
+
 class TestKeywordSaveImage(BaseSaveImageKeywords):
     """
     TestKeywordSaveImage Class